@@ -0,0 +1,362 @@
+# Run from the repository root as a module, so the game modules are importable:
+#   python -m Benchmark.bench_core [--quick] [--save-baseline]
+# The baseline is machine-specific and is not kept in the repository. Record one on the machine
+# that runs the comparison with --save-baseline, before the change being measured.
+import argparse
+import contextlib
+import gc
+import io
+import json
+import pathlib as pl
+import platform
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+import vars
+from decision import AutomaticDecisionProvider
+from game import Game, discard_event
+from game_random import GameRandom
+from gameboard import Gameboard, check_design
+from player import Player
+from save_index import SaveIndex
+from Benchmark.bench_huge_board import generate_design
+
+
+BOARD_SIZES = [40, 1000, 100000]
+PLAYER_COUNTS = [2, 100, 1000]
+QUICK_BOARD_SIZES = [40, 1000]
+QUICK_PLAYER_COUNTS = [2, 100]
+DEFAULT_BASELINE_PATH = pl.Path(__file__).resolve().parent / 'baseline_core.json'
+DEFAULT_REPEAT = 5
+MINIMUM_SAMPLE_NS = 20_000_000  # Timed work per sample
+MAXIMUM_SAMPLE_NS = 200_000_000  # Time per sample, set-ups included
+CONFIRMATION_RUNS = 2  # Times the cases slower than the baseline are measured again before they count as regressions
+# A case regresses when it is this many times slower than its baseline. The time of the file calls of
+# the cases that write or read save files varies more, so they get a looser threshold.
+DEFAULT_THRESHOLD = 1.35
+DEFAULT_IO_THRESHOLD = 1.6
+DESIGN_FILE_NAME = 'bench_core_{size}.json'
+
+DESIGNS = {}
+
+
+class UnindexedSaves(SaveIndex):
+    # Keeps the SQLite commit of the save index out of the timed saves
+
+    def update(self, file_name, save_state):
+        pass
+
+
+def design_for(board_size):
+    if board_size not in DESIGNS:
+        DESIGNS[board_size] = generate_design(board_size)
+    return DESIGNS[board_size]
+
+
+def make_game(board_size, number_of_players, seed=0):
+    gameboard = Gameboard()
+    gameboard.load_design(design_for(board_size))
+    gameboard.design_file_name = DESIGN_FILE_NAME.format(size=board_size)
+    game = Game(AutomaticDecisionProvider(), discard_event, seed)
+    game.setup_game(gameboard, [f'Player{i}' for i in range(1, number_of_players + 1)], {"maximum_player": vars.LARGE_LOBBY_MAXIMUM_PLAYER})
+    return game
+
+
+def play_rounds(game, rounds):
+    for _ in range(rounds):
+        if game.game_state["game_over"]:
+            return
+        game.play_one_round()
+        game.game_state["current_round"] += 1
+
+
+# Every case takes (board size, number of players), does its set-up and returns a function that
+# runs the measured operation and returns how many operations it ran.
+
+def bench_roll_dice(board_size, number_of_players):
+    player = Player('Player1', board_size, 'bench')
+    player.rng = GameRandom(0)
+
+    def run():
+        for _ in range(100000):
+            player.roll_dice()
+        return 100000
+    return run
+
+
+def bench_move(board_size, number_of_players):
+    player = Player('Player1', board_size, 'bench')
+
+    def run():
+        for _ in range(100000):
+            player.move(7)
+            player.adjust_location()
+        return 100000
+    return run
+
+
+def bench_landing(board_size, number_of_players):
+    # Cost of one turn of play_one_round: dice, move and resolving the square landed on
+    game = make_game(board_size, number_of_players)
+    turns = [0]
+
+    def count_turn(event, payload):
+        if event == 'move':
+            turns[0] += 1
+    game.event_sink = count_turn
+    for player in game.player_table:
+        player.event_sink = count_turn
+
+    def run():
+        play_rounds(game, max(1, 2000 // number_of_players))
+        return turns[0]
+    return run
+
+
+def bench_retire_player(board_size, number_of_players):
+    game = make_game(board_size, number_of_players)
+    play_rounds(game, 5)
+    players = [player for player in game.player_table if not player.is_retired][:-1]
+
+    def run():
+        for player in players:
+            game.retire_player(player)
+        return max(1, len(players))
+    return run
+
+
+def bench_change_property_ownership(board_size, number_of_players):
+    game = make_game(board_size, number_of_players)
+    gameboard = game.gameboard
+    locations = [location for location in range(1, board_size + 1) if gameboard.square_is_ownable[location]]
+    player_table = game.player_table
+
+    def run():
+        for i, location in enumerate(locations):
+            player = player_table[i % len(player_table)]
+            player.location = location
+            game.change_property_ownership(player)
+        return len(locations)
+    return run
+
+
+def bench_check_design(board_size, number_of_players):
+    design = design_for(board_size)
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            check_design(design)
+        return 1
+    return run
+
+
+def bench_load_design(board_size, number_of_players):
+    design = design_for(board_size)
+
+    def run():
+        Gameboard().load_design(design)
+        return 1
+    return run
+
+
+def bench_save_game_state(suffix):
+    def bench(board_size, number_of_players):
+        game = make_game(board_size, number_of_players)
+        play_rounds(game, 3)
+        game.save_index = UnindexedSaves()
+
+        def run():
+            game.save_game_state(f'bench_core{suffix}')
+            return 1
+        return run
+    return bench
+
+
+def bench_load_game_state(suffix):
+    def bench(board_size, number_of_players):
+        game = make_game(board_size, number_of_players)
+        play_rounds(game, 3)
+        game.save_index = UnindexedSaves()
+        game.save_game_state(f'bench_core{suffix}')
+
+        def run():
+            Game(AutomaticDecisionProvider(), discard_event).load_game_state(f'bench_core{suffix}')
+            return 1
+        return run
+    return bench
+
+
+def bench_show_game_status(board_size, number_of_players):
+    game = make_game(board_size, number_of_players)
+    play_rounds(game, 3)
+
+    def run():
+        # Every page is rendered; automatic players never stop paging
+        with contextlib.redirect_stdout(io.StringIO()):
+            game.show_game_status()
+        return 1
+    return run
+
+
+# name: (case, varies with the board size, varies with the number of players, reads or writes files)
+CASES = {
+    'roll_dice': (bench_roll_dice, False, False, False),
+    'move_adjust_location': (bench_move, True, False, False),
+    'landing': (bench_landing, True, True, False),
+    'retire_player': (bench_retire_player, True, True, False),
+    'change_property_ownership': (bench_change_property_ownership, True, False, False),
+    'check_design': (bench_check_design, True, False, False),
+    'load_design': (bench_load_design, True, False, False),
+    'save_game_state_json': (bench_save_game_state('.json'), True, True, True),
+    'save_game_state_binary': (bench_save_game_state(vars.BINARY_SAVE_SUFFIX), True, True, True),
+    'load_game_state_json': (bench_load_game_state('.json'), True, True, True),
+    'load_game_state_binary': (bench_load_game_state(vars.BINARY_SAVE_SUFFIX), True, True, True),
+    'show_game_status': (bench_show_game_status, True, True, False),
+}
+
+
+def case_keys(cases, board_sizes, player_counts):
+    # [(key, case name, board size, number of players), ...]
+    keys = []
+    for name in cases:
+        _, by_board, by_players, _ = CASES[name]
+        for board_size in board_sizes if by_board else board_sizes[:1]:
+            for number_of_players in player_counts if by_players else player_counts[:1]:
+                key = name + (f'/board={board_size}' if by_board else '') + (f'/players={number_of_players}' if by_players else '')
+                keys.append((key, name, board_size, number_of_players))
+    return keys
+
+
+def measure_case(name, board_size, number_of_players, repeat):
+    # Fastest nanoseconds per operation over `repeat` fresh set-ups, after one untimed warm-up run.
+    # Noise only ever adds time, so the minimum is the steadiest estimate. As in timeit, the garbage
+    # collector is off while timing, so the garbage of earlier cases does not slow down later ones.
+    # A sample runs fresh set-ups until it has MINIMUM_SAMPLE_NS of timed work, so short cases are not
+    # down to the timer and scheduler jitter of a single run. Slow set-ups stop at MAXIMUM_SAMPLE_NS.
+    # Timed in CPU time: other processes on the machine and waits for the file system do not add to it,
+    # so the saves measure the serialization and file calls of the game, not the disk.
+    case = CASES[name][0]
+    case(board_size, number_of_players)()
+    samples = []
+    for _ in range(repeat):
+        nanoseconds, operations = 0, 0
+        gc.collect()
+        gc.disable()
+        try:
+            sample_started = time.perf_counter_ns()
+            while nanoseconds < MINIMUM_SAMPLE_NS and (operations == 0 or time.perf_counter_ns() - sample_started < MAXIMUM_SAMPLE_NS):
+                run = case(board_size, number_of_players)
+                start = time.process_time_ns()
+                operations += run()
+                nanoseconds += time.process_time_ns() - start
+        finally:
+            gc.enable()
+        samples.append(nanoseconds / operations)
+    return min(samples)
+
+
+def measure_cases(keys, repeat=DEFAULT_REPEAT, progress=None):
+    # {key: nanoseconds per operation} of the case_keys entries. Saves go to a temporary save directory,
+    # and the generated designs to a temporary design directory.
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        directory = pl.Path(directory)
+        with patch('vars.BASE_SAVE_STATE_PATH', directory), patch('vars.BASE_GAMEBOARD_DESIGN_DIR', directory):
+            for board_size in sorted(set(board_size for _, _, board_size, _ in keys)):
+                with open(directory / DESIGN_FILE_NAME.format(size=board_size), 'w') as design_file:
+                    json.dump(design_for(board_size), design_file)
+            for key, name, board_size, number_of_players in keys:
+                results[key] = measure_case(name, board_size, number_of_players, repeat)
+                if progress is not None:
+                    progress(key, results[key])
+    return results
+
+
+def run_suite(cases=None, board_sizes=BOARD_SIZES, player_counts=PLAYER_COUNTS, repeat=DEFAULT_REPEAT, progress=None):
+    keys = case_keys(cases or list(CASES), board_sizes, player_counts)
+    return {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results_ns': measure_cases(keys, repeat, progress),
+    }
+
+
+def case_threshold(key, threshold=DEFAULT_THRESHOLD, io_threshold=DEFAULT_IO_THRESHOLD):
+    return io_threshold if CASES[key.split('/')[0]][3] else threshold
+
+
+def compare_with_baseline(report, baseline, threshold=DEFAULT_THRESHOLD, io_threshold=DEFAULT_IO_THRESHOLD):
+    # [(key, baseline ns, current ns, ratio), ...] for the cases present in both, slowest first
+    comparisons = []
+    for key, current in report['results_ns'].items():
+        previous = baseline['results_ns'].get(key)
+        if previous and key.split('/')[0] in CASES:
+            comparisons.append((key, previous, current, current / previous))
+    comparisons.sort(key=lambda comparison: comparison[3], reverse=True)
+    regressions = [comparison for comparison in comparisons if comparison[3] > case_threshold(comparison[0], threshold, io_threshold)]
+    return comparisons, regressions
+
+
+def format_ns(nanoseconds):
+    for unit, scale in [('s', 1e9), ('ms', 1e6), ('us', 1e3)]:
+        if nanoseconds >= scale:
+            return f'{nanoseconds / scale:.2f} {unit}'
+    return f'{nanoseconds:.0f} ns'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Microbenchmarks of the core game operations, recorded to and compared against a JSON baseline.', epilog='Run from the repository root: python -m Benchmark.bench_core')
+    parser.add_argument('--case', action='append', choices=list(CASES), help='Only run these cases')
+    parser.add_argument('--quick', action='store_true', help=f'Boards of {QUICK_BOARD_SIZES} squares and {QUICK_PLAYER_COUNTS} players only')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='Timed runs per case, after one warm-up run; the fastest is kept')
+    parser.add_argument('--baseline', type=pl.Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument('--save-baseline', action='store_true', help='Write the results to the baseline instead of comparing')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument('--io-threshold', type=float, default=DEFAULT_IO_THRESHOLD, help='Threshold of the cases that write or read save files')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    args = parser.parse_args(argv)
+
+    board_sizes, player_counts = (QUICK_BOARD_SIZES, QUICK_PLAYER_COUNTS) if args.quick else (BOARD_SIZES, PLAYER_COUNTS)
+    progress = None if args.json else (lambda key, nanoseconds: print(f'{key:<55}{format_ns(nanoseconds):>12}', flush=True))
+    report = run_suite(args.case, board_sizes, player_counts, args.repeat, progress)
+
+    if args.save_baseline or not args.baseline.is_file():
+        if args.json:
+            print(json.dumps(report, indent=4))
+        if args.save_baseline:
+            with open(args.baseline, 'w') as baseline_file:
+                json.dump(report, baseline_file, indent=4)
+            print(f'Baseline written to {args.baseline}', file=sys.stderr)
+        else:
+            print(f'No baseline at {args.baseline}; run with --save-baseline to record one', file=sys.stderr)
+        return 0
+
+    with open(args.baseline, 'r') as baseline_file:
+        baseline = json.load(baseline_file)
+    if (baseline.get('python'), baseline.get('machine')) != (report['python'], report['machine']):
+        print(f'Baseline was recorded on Python {baseline.get("python")} / {baseline.get("machine")}, timings may not be comparable', file=sys.stderr)
+
+    comparisons, regressions = compare_with_baseline(report, baseline, args.threshold, args.io_threshold)
+    for _ in range(CONFIRMATION_RUNS):
+        if not regressions:
+            break
+        # A real regression stays slow when measured again; a noisy sample does not
+        regressed = set(key for key, _, _, _ in regressions)
+        print(f'Measuring {len(regressed)} slower cases again', file=sys.stderr)
+        keys = case_keys(args.case or list(CASES), board_sizes, player_counts)
+        for key, nanoseconds in measure_cases([entry for entry in keys if entry[0] in regressed], args.repeat).items():
+            report['results_ns'][key] = min(report['results_ns'][key], nanoseconds)
+        comparisons, regressions = compare_with_baseline(report, baseline, args.threshold, args.io_threshold)
+    if args.json:
+        print(json.dumps(report, indent=4))
+
+    for key, previous, current, ratio in comparisons:
+        print(f'{key:<55}{format_ns(previous):>12}{format_ns(current):>12}{ratio:>8.2f}x', file=sys.stderr)
+    for key, previous, current, ratio in regressions:
+        print(f'Regression: {key} is {ratio:.2f}x slower than the baseline', file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
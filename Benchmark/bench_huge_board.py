@@ -0,0 +1,92 @@
+import argparse
+import contextlib
+import io
+import json
+import sys
+import time
+from gameboard import Gameboard, check_design
+from design_validation import DesignValidator
+
+
+DEFAULT_SIZES = [10000, 100000, 1000000]
+
+
+def generate_design(size):
+    # Square board with one of each function square per side, every other square a property
+    functions = {
+        1: "Go",
+        size // 4 + 1: "Just Visiting / In Jail",
+        size // 2 + 1: "Free Parking",
+        3 * size // 4 + 1: "Go To Jail",
+        size // 8 + 1: "Chance",
+        3 * size // 8 + 1: "Income Tax",
+    }
+    properties = []
+    for location in range(1, size + 1):
+        if location not in functions:
+            properties.append({"location": location, "name": f"Property {location}", "price": 100 + location % 300, "rent": 10 + location % 30, "role": "property", "is_ownable": True})
+    return {
+        "enforce_square_design": True,
+        "size": size,
+        "properties": properties,
+        "functions": [{"location": location, "name": name, "role": "function", "is_ownable": False} for location, name in functions.items()],
+    }
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def edit_and_revalidate(validator, row):
+    # One designer edit: rename a property and re-check only that square
+    validator.remove_square('properties', row)
+    row['name'] = f'{row["name"]} (renamed)'
+    validator.add_square('properties', row)
+    return validator.report()
+
+
+def measure_board(size):
+    design = generate_design(size)
+    encoded, _ = timed(json.dumps, design)
+    design, parse_seconds = timed(json.loads, encoded)
+    with contextlib.redirect_stdout(io.StringIO()):
+        is_valid, check_seconds = timed(check_design, design)
+    _, load_seconds = timed(Gameboard().load_design, design)
+    validator = DesignValidator(design)
+    validator.report()
+    report, revalidate_seconds = timed(edit_and_revalidate, validator, design['properties'][0])
+    return {
+        'size': size,
+        'is_valid': is_valid,
+        'parse_s': parse_seconds,
+        'check_design_s': check_seconds,
+        'load_design_s': load_seconds,
+        'revalidate_s': revalidate_seconds,
+        'is_valid_after_edit': report['is_valid'],
+    }
+
+
+def print_report(report):
+    print(f'{"size":>10}{"valid":>7}{"parse [s]":>11}{"check [s]":>11}{"load [s]":>10}{"edit + recheck [ms]":>21}')
+    for result in report:
+        print(f'{result["size"]:>10}{str(result["is_valid"]):>7}{result["parse_s"]:>11.3f}{result["check_design_s"]:>11.3f}{result["load_design_s"]:>10.3f}{result["revalidate_s"] * 1000:>21.3f}')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Time parsing, validating and loading procedurally generated huge gameboards.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    args = parser.parse_args(argv)
+
+    report = [measure_board(size) for size in args.sizes]
+    if args.json:
+        print(json.dumps(report, indent=4))
+    else:
+        print_report(report)
+    return 0 if all(result['is_valid'] and result['is_valid_after_edit'] for result in report) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
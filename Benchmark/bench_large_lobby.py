@@ -0,0 +1,90 @@
+import argparse
+import json
+import statistics
+import sys
+import time
+import vars
+from game import run_headless_game
+
+
+DEFAULT_PLAYER_COUNTS = [100, 250, 500, 1000]
+DEFAULT_ROUNDS = 20
+# Largest allowed ratio between the slowest and the fastest cost per turn across player counts
+DEFAULT_TOLERANCE = 2.0
+
+
+class TurnCounter:
+    # Event sink that counts rounds and player turns without keeping any messages
+
+    def __init__(self):
+        self.rounds = 0
+        self.turns = 0
+
+    def __call__(self, event, payload):
+        if event == 'round':
+            self.rounds += 1
+        elif event == 'roll' or (event == 'jailbreak' and payload['count_down'] != 0):
+            self.turns += 1
+
+
+def measure_lobby(gameboard_design, number_of_players, rounds, seed):
+    counter = TurnCounter()
+    game_parameters = {"maximum_player": vars.LARGE_LOBBY_MAXIMUM_PLAYER, "maximum_rounds": rounds}
+    player_names = [f'Player{i}' for i in range(1, number_of_players + 1)]
+    start = time.perf_counter()
+    run_headless_game(gameboard_design, player_names, game_parameters, event_sink=counter, seed=seed)
+    elapsed = time.perf_counter() - start
+    return {
+        'players': number_of_players,
+        'rounds': counter.rounds,
+        'turns': counter.turns,
+        'ms_per_round': elapsed * 1000 / max(1, counter.rounds),
+        'us_per_turn': elapsed * 1e6 / max(1, counter.turns),
+    }
+
+
+def run_benchmark(gameboard_design, player_counts=DEFAULT_PLAYER_COUNTS, rounds=DEFAULT_ROUNDS, repeat=3, seed=0):
+    report = []
+    for number_of_players in player_counts:
+        results = [measure_lobby(gameboard_design, number_of_players, rounds, seed) for _ in range(repeat)]
+        report.append({key: statistics.median(result[key] for result in results) for key in results[0]})
+    return report
+
+
+def check_linear(report, tolerance=DEFAULT_TOLERANCE):
+    # Per-round cost is linear in the player count when the cost of one turn does not grow with it
+    costs = [result['us_per_turn'] for result in report]
+    return max(costs) / min(costs) <= tolerance
+
+
+def print_report(report):
+    print(f'{"players":>8}{"rounds":>8}{"turns":>9}{"ms/round":>11}{"us/turn":>10}')
+    for result in report:
+        print(f'{result["players"]:>8}{result["rounds"]:>8.0f}{result["turns"]:>9.0f}{result["ms_per_round"]:>11.2f}{result["us_per_turn"]:>10.1f}')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Measure how the cost of a round grows with the number of players.')
+    parser.add_argument('design_file_name', nargs='?', default='default_gameboard.json')
+    parser.add_argument('--players', type=int, nargs='+', default=DEFAULT_PLAYER_COUNTS)
+    parser.add_argument('--rounds', type=int, default=DEFAULT_ROUNDS)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    args = parser.parse_args(argv)
+
+    gameboard_design = json.load(open(vars.BASE_GAMEBOARD_DESIGN_DIR / args.design_file_name, 'r'))
+    report = run_benchmark(gameboard_design, args.players, args.rounds, args.repeat)
+    if args.json:
+        print(json.dumps(report, indent=4))
+    else:
+        print_report(report)
+
+    if not check_linear(report, args.tolerance):
+        print(f'Cost per turn grew by more than {args.tolerance}x across player counts')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
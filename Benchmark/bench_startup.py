@@ -0,0 +1,147 @@
+import argparse
+import json
+import os
+import pathlib as pl
+import statistics
+import subprocess
+import sys
+import time
+
+
+REPO_ROOT = pl.Path(__file__).resolve().parent.parent
+MODULES = ['vars', 'functions', 'player', 'gameboard', 'game', 'model']
+
+# Milliseconds, cumulative import time with warm bytecode caches
+DEFAULT_BUDGETS_MS = {
+    'vars': 20,
+    'functions': 25,
+    'player': 25,
+    'gameboard': 30,
+    'game': 45,
+    'model': 45,
+    'first_prompt': 50,
+}
+
+FIRST_PROMPT_SCRIPT = '''
+import builtins, time
+start = time.perf_counter()
+import model
+
+class FirstPrompt(Exception):
+    pass
+
+def first_prompt(question=''):
+    raise FirstPrompt(time.perf_counter() - start)
+
+builtins.input = first_prompt
+builtins.print = lambda *args, **kwargs: None
+try:
+    model.play_monopoly_game()
+except FirstPrompt as e:
+    import sys
+    sys.stderr.write(f'first_prompt {e.args[0] * 1e6:.0f}\\n')
+'''
+
+
+def parse_importtime(stderr):
+    # Lines look like "import time:  self [us] | cumulative | imported package"
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def remove_repo_bytecode():
+    for pyc_path in (REPO_ROOT / '__pycache__').glob('*.pyc'):
+        pyc_path.unlink()
+
+
+def run_python(args, cold):
+    # Cold runs compile the repo modules from source and do not write bytecode back;
+    # warm runs reuse the cached bytecode. The standard library is cached in both cases.
+    if cold:
+        remove_repo_bytecode()
+        args = ['-B'] + args
+    start = time.perf_counter()
+    completed = subprocess.run([sys.executable] + args, cwd=REPO_ROOT, env=dict(os.environ), capture_output=True, text=True)
+    return completed.stderr, time.perf_counter() - start
+
+
+def measure_import(module, cold):
+    stderr, wall_time = run_python(['-X', 'importtime', '-c', f'import {module}'], cold)
+    timings = parse_importtime(stderr)
+    self_us, cumulative_us = timings.get(module, (0, 0))
+    return {'self_us': self_us, 'cumulative_us': cumulative_us, 'process_ms': wall_time * 1000}
+
+
+def measure_first_prompt(cold):
+    stderr, wall_time = run_python(['-c', FIRST_PROMPT_SCRIPT], cold)
+    for line in stderr.splitlines():
+        if line.startswith('first_prompt '):
+            return {'cumulative_us': int(line.split()[1]), 'process_ms': wall_time * 1000}
+    raise RuntimeError(f'play_monopoly_game did not reach its first prompt:\n{stderr}')
+
+
+def median_result(results):
+    return {key: statistics.median(result[key] for result in results) for key in results[0]}
+
+
+def run_benchmark(repeat=5):
+    report = {}
+    for module in MODULES + ['first_prompt']:
+        measure = (lambda cold: measure_first_prompt(cold)) if module == 'first_prompt' else (lambda cold: measure_import(module, cold))
+        cold_results, warm_results = [], []
+        for _ in range(repeat):
+            cold_results.append(measure(True))
+        # Prime the bytecode cache once before the warm runs
+        measure(False)
+        for _ in range(repeat):
+            warm_results.append(measure(False))
+        report[module] = {'cold': median_result(cold_results), 'warm': median_result(warm_results)}
+    return report
+
+
+def check_budgets(report, budgets):
+    failures = []
+    for name, budget_ms in budgets.items():
+        if name in report and report[name]['warm']['cumulative_us'] / 1000 > budget_ms:
+            failures.append(f'{name}: {report[name]["warm"]["cumulative_us"] / 1000:.1f} ms > budget {budget_ms} ms')
+    return failures
+
+
+def print_report(report):
+    print(f'{"module":<14}{"cold self [us]":>16}{"cold cumul [us]":>17}{"warm self [us]":>16}{"warm cumul [us]":>17}')
+    for name, result in report.items():
+        cold, warm = result['cold'], result['warm']
+        print(f'{name:<14}{cold.get("self_us", 0):>16.0f}{cold["cumulative_us"]:>17.0f}{warm.get("self_us", 0):>16.0f}{warm["cumulative_us"]:>17.0f}')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Measure MonopolyCMD import and startup time against a budget.')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--budget', action='append', default=[], metavar='NAME=MS', help='Override a budget, e.g. model=40')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    args = parser.parse_args(argv)
+
+    budgets = dict(DEFAULT_BUDGETS_MS)
+    for budget in args.budget:
+        name, budget_ms = budget.split('=')
+        budgets[name] = float(budget_ms)
+
+    report = run_benchmark(args.repeat)
+    if args.json:
+        print(json.dumps(report, indent=4))
+    else:
+        print_report(report)
+
+    failures = check_budgets(report, budgets)
+    for failure in failures:
+        print(f'Over budget: {failure}')
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
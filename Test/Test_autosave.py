@@ -0,0 +1,111 @@
+import unittest
+from unittest.mock import patch
+import json
+import pathlib as pl
+import tempfile
+import time
+from autosave import AutosaveWriter
+from delta_save import delta_path_for
+from decision import AutomaticDecisionProvider
+from game import Game
+from gameboard import Gameboard
+from save_format import write_save_state
+from save_index import load_save_state
+import model
+import vars
+
+
+class TestAutosave(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.save_state_path = pl.Path(self.temporary_directory.name)
+        self.patcher = patch('vars.BASE_SAVE_STATE_PATH', self.save_state_path)
+        self.patcher.start()
+        self.save_state = {
+            'game_state': {'game_id': 'g', 'game_over': False, 'current_round': 1},
+            'player_orders': {1: 'a'},
+            'game_parameters': {'go_money': 1500},
+            'players': {'a': {'id': 'a', 'money': 1500}},
+            'gameboard_parameters': {'design_file_name': 'default_gameboard.json', 'game_id': 'g'}
+        }
+
+    def tearDown(self):
+        self.patcher.stop()
+        self.temporary_directory.cleanup()
+
+    def test_writer_keeps_snapshot(self):
+        writer = AutosaveWriter('snapshot.json')
+        writer.submit(self.save_state)
+        # Later changes to the live game must not leak into the pending checkpoint
+        self.save_state['game_state']['current_round'] = 99
+        writer.close()
+        self.assertEqual(json.load(open(self.save_state_path / 'snapshot.json'))['game_state']['current_round'], 1)
+        self.assertIsNone(writer.last_error)
+
+    def test_writer_writes_latest_state(self):
+        writer = AutosaveWriter('latest.json')
+        for current_round in range(1, 20):
+            self.save_state['game_state'] = dict(self.save_state['game_state'], current_round=current_round)
+            writer.submit(self.save_state)
+        writer.close()
+        self.assertEqual(load_save_state(self.save_state_path / 'latest.json')['game_state']['current_round'], 19)
+        self.assertGreaterEqual(writer.saves_written, 1)
+        self.assertLessEqual(set(path.name for path in self.save_state_path.iterdir()), {'latest.json', delta_path_for(self.save_state_path / 'latest.json').name, vars.SAVE_INDEX_FILE_NAME})
+
+    def test_writer_appends_deltas(self):
+        writer = AutosaveWriter('deltas.json')
+        writer.submit(self.save_state)
+        deadline = time.monotonic() + 10
+        while writer.saves_written < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.save_state['game_state'] = dict(self.save_state['game_state'], current_round=2)
+        writer.submit(self.save_state)
+        writer.close()
+        self.assertEqual(writer.saves_written, 2)
+        self.assertEqual(json.load(open(self.save_state_path / 'deltas.json'))['game_state']['current_round'], 1)
+        self.assertEqual(open(delta_path_for(self.save_state_path / 'deltas.json')).read(), '{"game_state":{"current_round":2}}\n')
+        self.assertEqual(load_save_state(self.save_state_path / 'deltas.json')['game_state']['current_round'], 2)
+
+    def test_write_save_state_atomically(self):
+        write_save_state(self.save_state_path / 'atomic.json', {'a': 1})
+        self.assertEqual(json.load(open(self.save_state_path / 'atomic.json')), {'a': 1})
+        self.assertFalse((self.save_state_path / '.atomic.json.tmp').exists())
+
+    def test_play_with_autosave(self):
+        gameboard = Gameboard()
+        gameboard.load_design(json.load(open(vars.DEFAULT_GAMEBOARD_DESIGN_PATH, 'r')))
+        gameboard.design_file_name = 'default_gameboard.json'
+        game = Game(AutomaticDecisionProvider(), lambda event, payload: None)
+        game.setup_game(gameboard, ['Player1', 'Player2'], {"maximum_rounds": 9})
+        game.play(autosave_every=4, autosave_file_name='autosave_test.json')
+
+        # The last checkpoint is written even if the game ends before maximum_rounds
+        saved = load_save_state(self.save_state_path / 'autosave_test.json')
+        final_round = game.game_state['current_round']
+        self.assertEqual(saved['game_state']['current_round'], final_round - (final_round - 1) % 4)
+        loaded_game = Game(event_sink=lambda event, payload: None)
+        self.assertTrue(loaded_game.load_game_state('autosave_test.json'))
+
+    def test_write_errors_are_reported(self):
+        gameboard = Gameboard()
+        gameboard.load_design(json.load(open(vars.DEFAULT_GAMEBOARD_DESIGN_PATH, 'r')))
+        gameboard.design_file_name = 'default_gameboard.json'
+        messages = []
+        game = Game(AutomaticDecisionProvider(), lambda event, payload: messages.append(payload) if event == 'message' else None)
+        game.setup_game(gameboard, ['Player1', 'Player2'], {"maximum_rounds": 3})
+        with patch('delta_save.write_save_state', side_effect=OSError('No space left on device')):
+            game.play(autosave_every=1, autosave_file_name='full_disk.json')
+        failures = [message for message in messages if message.startswith('Autosave to')]
+        self.assertGreaterEqual(len(failures), 1)
+        self.assertTrue(failures[-1].endswith('failed: No space left on device'))
+
+    def test_interactive_game_autosaves_from_vars(self):
+        with patch('vars.AUTOSAVE_EVERY_ROUNDS', 3), patch('builtins.input', side_effect=['0', '0']), patch('builtins.print'), \
+                patch.object(Game, 'new_game', return_value=True), patch.object(Game, 'play') as mock_play:
+            model.play_monopoly_game()
+        mock_play.assert_called_once_with(autosave_every=3)
+
+
+if __name__ == '__main__':
+    unittest.main()
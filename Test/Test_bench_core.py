@@ -0,0 +1,32 @@
+import unittest
+from Benchmark.bench_core import case_keys, case_threshold, compare_with_baseline, format_ns
+
+
+class TestBenchCore(unittest.TestCase):
+
+    def test_case_keys(self):
+        keys = [key for key, _, _, _ in case_keys(['roll_dice', 'check_design', 'landing'], [40, 1000], [2, 100])]
+        self.assertEqual(keys, [
+            'roll_dice',
+            'check_design/board=40', 'check_design/board=1000',
+            'landing/board=40/players=2', 'landing/board=40/players=100', 'landing/board=1000/players=2', 'landing/board=1000/players=100',
+        ])
+
+    def test_compare_with_baseline(self):
+        baseline = {'results_ns': {'roll_dice': 100, 'check_design/board=40': 1000, 'save_game_state_json/board=40/players=2': 1000, 'removed': 5}}
+        report = {'results_ns': {'roll_dice': 110, 'check_design/board=40': 1500, 'save_game_state_json/board=40/players=2': 1500, 'added': 5}}
+        comparisons, regressions = compare_with_baseline(report, baseline, 1.25, 1.6)
+        self.assertEqual([key for key, _, _, _ in comparisons], ['check_design/board=40', 'save_game_state_json/board=40/players=2', 'roll_dice'])
+        # The save case has the looser file system threshold
+        self.assertEqual(regressions, [('check_design/board=40', 1000, 1500, 1.5)])
+
+    def test_case_threshold(self):
+        self.assertEqual(case_threshold('roll_dice', 1.25, 1.6), 1.25)
+        self.assertEqual(case_threshold('load_game_state_binary/board=40/players=2', 1.25, 1.6), 1.6)
+
+    def test_format_ns(self):
+        self.assertEqual([format_ns(nanoseconds) for nanoseconds in [357, 4500, 2_740_000, 1.5e9]], ['357 ns', '4.50 us', '2.74 ms', '1.50 s'])
+
+
+if __name__ == '__main__':
+    unittest.main()
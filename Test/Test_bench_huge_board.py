@@ -0,0 +1,25 @@
+import unittest
+from unittest.mock import patch
+from gameboard import check_design
+from Benchmark.bench_huge_board import generate_design
+
+
+class TestBenchHugeBoard(unittest.TestCase):
+
+    def test_generate_design_is_valid(self):
+        design = generate_design(400)
+        self.assertEqual(len(design['properties']) + len(design['functions']), 400)
+        with patch('builtins.print') as mock_print:
+            self.assertTrue(check_design(design))
+            mock_print.assert_called_with("Design is valid!")
+
+    def test_generated_design_with_duplicate_name(self):
+        design = generate_design(400)
+        design['properties'][1]['name'] = design['properties'][0]['name']
+        with patch('builtins.print') as mock_print:
+            self.assertFalse(check_design(design))
+            mock_print.assert_called_with("Error: Duplicate property name detected.")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,21 @@
+import unittest
+from Benchmark.bench_large_lobby import TurnCounter, check_linear
+
+
+class TestBenchLargeLobby(unittest.TestCase):
+
+    def test_turn_counter(self):
+        counter = TurnCounter()
+        counter('round', {'round': 1})
+        counter('roll', {'player_id': 'a', 'first_roll': 1, 'second_roll': 2})
+        counter('jailbreak', {'player_id': 'b', 'paid': 0, 'count_down': 2})
+        counter('jailbreak', {'player_id': 'c', 'paid': 150, 'count_down': 0})
+        self.assertEqual((counter.rounds, counter.turns), (1, 2))
+
+    def test_check_linear(self):
+        self.assertTrue(check_linear([{'us_per_turn': 10.0}, {'us_per_turn': 15.0}]))
+        self.assertFalse(check_linear([{'us_per_turn': 10.0}, {'us_per_turn': 45.0}]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,26 @@
+import unittest
+from Benchmark.bench_startup import parse_importtime, check_budgets
+
+
+class TestBenchStartup(unittest.TestCase):
+
+    def test_parse_importtime(self):
+        stderr = '\n'.join([
+            'import time: self [us] | cumulative | imported package',
+            'import time:       286 |       9293 | vars',
+            'import time:        72 |       4094 |     fnmatch',
+        ])
+        self.assertEqual(parse_importtime(stderr), {'vars': (286, 9293), 'fnmatch': (72, 4094)})
+
+    def test_check_budgets(self):
+        report = {
+            'vars': {'cold': {'cumulative_us': 9000}, 'warm': {'cumulative_us': 8000}},
+            'model': {'cold': {'cumulative_us': 90000}, 'warm': {'cumulative_us': 70000}},
+        }
+        failures = check_budgets(report, {'vars': 10, 'model': 60, 'game': 1})
+        self.assertEqual(len(failures), 1)
+        self.assertTrue(failures[0].startswith('model'))
+
+
+if __name__ == '__main__':
+    unittest.main()
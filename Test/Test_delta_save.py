@@ -0,0 +1,134 @@
+import unittest
+from unittest.mock import patch
+import json
+import pathlib as pl
+import tempfile
+from delta_save import DeltaSaveWriter, compute_save_delta, apply_save_delta, apply_save_deltas, delta_path_for
+from decision import AutomaticDecisionProvider
+from game import Game, run_headless_game
+from save_index import load_save_state
+import vars
+
+
+class TestDeltaSave(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.save_state_path = pl.Path(self.temporary_directory.name)
+        self.patcher = patch('vars.BASE_SAVE_STATE_PATH', self.save_state_path)
+        self.patcher.start()
+        self.design = json.load(open(vars.DEFAULT_GAMEBOARD_DESIGN_PATH, 'r'))
+        self.previous_state = {
+            'game_state': {'game_id': 'g', 'game_over': False, 'current_round': 1},
+            'player_orders': {1: 'a', 2: 'b'},
+            'game_parameters': {'go_money': 1500},
+            'players': {
+                'a': {'id': 'a', 'location': 1, 'money': 1500, 'owned_properties': []},
+                'b': {'id': 'b', 'location': 1, 'money': 1500, 'owned_properties': []},
+            },
+            'gameboard_parameters': {'design_file_name': 'default_gameboard.json', 'game_id': 'g'}
+        }
+
+    def tearDown(self):
+        self.patcher.stop()
+        self.temporary_directory.cleanup()
+
+    def test_compute_save_delta_only_changes(self):
+        save_state = json.loads(json.dumps(self.previous_state))
+        save_state['player_orders'] = {1: 'a', 2: 'b'}
+        save_state['game_state']['current_round'] = 2
+        save_state['players']['a']['money'] = 1300
+        save_state['players']['a']['owned_properties'] = [2]
+        delta = compute_save_delta(self.previous_state, save_state)
+        self.assertEqual(delta, {
+            'game_state': {'current_round': 2},
+            'players': {'a': {'money': 1300, 'owned_properties': [2]}}
+        })
+
+    def test_apply_save_delta(self):
+        save_state = apply_save_delta(json.loads(json.dumps(self.previous_state)), {'players': {'b': {'location': 5}}, 'player_orders': {'1': 'b', '7': 'a'}})
+        self.assertEqual(save_state['players']['b']['location'], 5)
+        self.assertEqual(save_state['players']['a']['location'], 1)
+        self.assertEqual(save_state['player_orders'], {'1': 'b', '7': 'a'})
+
+    def test_partial_last_line_is_ignored(self):
+        save_path = self.save_state_path / 'partial.json'
+        with open(delta_path_for(save_path), 'w') as delta_file:
+            delta_file.write('{"game_state": {"current_round": 3}}\n{"game_state": {"curr')
+        save_state = apply_save_deltas(json.loads(json.dumps(self.previous_state)), save_path)
+        self.assertEqual(save_state['game_state']['current_round'], 3)
+
+    def test_writer_compaction(self):
+        writer = DeltaSaveWriter('compact.json', compaction_interval=2)
+        for current_round in range(1, 6):
+            self.previous_state['game_state']['current_round'] = current_round
+            writer.save(self.previous_state)
+            if current_round == 4:
+                self.assertFalse(writer.delta_path.is_file())
+        self.assertEqual(len(open(writer.delta_path).readlines()), 1)
+        self.assertEqual(json.load(open(writer.save_path))['game_state']['current_round'], 4)
+
+    def test_crash_while_replacing_the_base(self):
+        # The new base fails to be written after the old deltas are dropped
+        writer = DeltaSaveWriter('crash.json', compaction_interval=2)
+        for current_round in range(1, 4):
+            self.previous_state['game_state']['current_round'] = current_round
+            self.previous_state['players']['a']['money'] = 1500 - current_round
+            writer.save(self.previous_state)
+        self.previous_state['game_state']['current_round'] = 4
+        with patch('delta_save.write_save_state', side_effect=OSError('crash')):
+            with self.assertRaises(OSError):
+                writer.save(self.previous_state)
+        save_state = apply_save_deltas(json.load(open(writer.save_path)), writer.save_path)
+        self.assertEqual(save_state['game_state']['current_round'], 1)
+        self.assertEqual(save_state['players']['a']['money'], 1499)
+
+        game = run_headless_game(self.design, ['Player1', 'Player2'], {"maximum_rounds": 2}, event_sink=lambda event, payload: None, design_file_name='default_gameboard.json')
+        game.save_game_state('crash_full.json', incremental=True)
+        saved_state = json.load(open(self.save_state_path / 'crash_full.json'))
+        game.game_state['current_round'] += 1
+        game.save_game_state('crash_full.json', incremental=True)
+        game.game_state['current_round'] += 1
+        with patch('delta_save.write_save_state', side_effect=OSError('crash')):
+            with self.assertRaises(OSError):
+                game.save_game_state('crash_full.json')
+        self.assertFalse(delta_path_for(self.save_state_path / 'crash_full.json').is_file())
+        self.assertEqual(load_save_state(self.save_state_path / 'crash_full.json'), saved_state)
+
+    def test_incremental_saves_round_trip(self):
+        game = run_headless_game(self.design, ['Player1', 'Player2', 'Player3'], {"maximum_rounds": 5}, event_sink=lambda event, payload: None, design_file_name='default_gameboard.json', seed=4)
+        game.save_game_state('incremental.json', incremental=True)
+        for _ in range(10):
+            game.game_state['game_over'] = False
+            game.play_one_round()
+            game.game_state['current_round'] += 1
+            game.save_game_state('incremental.json', incremental=True)
+        self.assertTrue(delta_path_for(self.save_state_path / 'incremental.json').is_file())
+
+        loaded_game = Game(event_sink=lambda event, payload: None)
+        self.assertTrue(loaded_game.load_game_state('incremental.json'))
+        self.assertEqual(loaded_game.build_save_state()['players'], game.build_save_state()['players'])
+        self.assertEqual(loaded_game.game_state, game.game_state)
+        self.assertEqual(loaded_game.player_orders, game.player_orders)
+
+    def test_save_requests_append_deltas(self):
+        class SaveEveryRound(AutomaticDecisionProvider):
+            def save_game(self, game):
+                return 'every_round.json'
+
+        game = run_headless_game(self.design, ['Player1', 'Player2', 'Player3'], {"maximum_rounds": 8}, SaveEveryRound(), lambda event, payload: None, design_file_name='default_gameboard.json', seed=6)
+        self.assertEqual(len(open(delta_path_for(self.save_state_path / 'every_round.json')).readlines()), game.game_state['current_round'] - 1)
+        loaded_game = Game(event_sink=lambda event, payload: None)
+        self.assertTrue(loaded_game.load_game_state('every_round.json'))
+        self.assertEqual(loaded_game.build_save_state()['players'], game.build_save_state()['players'])
+
+    def test_full_save_drops_deltas(self):
+        game = run_headless_game(self.design, ['Player1', 'Player2'], {"maximum_rounds": 2}, event_sink=lambda event, payload: None, design_file_name='default_gameboard.json')
+        game.save_game_state('full.json', incremental=True)
+        game.save_game_state('full.json', incremental=True)
+        game.save_game_state('full.json')
+        self.assertFalse(delta_path_for(self.save_state_path / 'full.json').is_file())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import json
+import os
+import tempfile
+import unittest
+import pathlib as pl
+from unittest.mock import patch
+import vars
+from design_cache import DesignCache
+
+
+class TestDesignCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.directory = pl.Path(self.temporary_directory.name)
+        self.design_text = vars.DEFAULT_GAMEBOARD_DESIGN_PATH.read_text()
+        self.design_path = self.directory / 'design.json'
+        self.design_path.write_text(self.design_text)
+        self.cache = DesignCache(maximum_entries=2)
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_unchanged_file_is_parsed_once(self):
+        first_design, report = self.cache.load(self.design_path)
+        with patch('design_cache.json.loads') as mock_loads:
+            second_design, _ = self.cache.load(self.design_path)
+            mock_loads.assert_not_called()
+        self.assertIs(first_design, second_design)
+        self.assertTrue(report['is_valid'])
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_touched_file_with_same_content_is_not_parsed(self):
+        first_design, _ = self.cache.load(self.design_path)
+        stat = self.design_path.stat()
+        os.utime(self.design_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        second_design, _ = self.cache.load(self.design_path)
+        self.assertIs(first_design, second_design)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_changed_file_is_reloaded(self):
+        self.cache.load(self.design_path)
+        design = json.loads(self.design_text)
+        design['functions'] = [row for row in design['functions'] if row['name'] != 'Go']
+        self.design_path.write_text(json.dumps(design))
+        stat = self.design_path.stat()
+        os.utime(self.design_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        reloaded_design, report = self.cache.load(self.design_path)
+        self.assertNotIn('Go', [row['name'] for row in reloaded_design['functions']])
+        self.assertFalse(report['is_valid'])
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        paths = [self.directory / f'design_{i}.json' for i in range(3)]
+        for path in paths:
+            path.write_text(self.design_text)
+        self.cache.load(paths[0])
+        self.cache.load(paths[1])
+        self.cache.load(paths[0])
+        self.cache.load(paths[2])
+        self.assertEqual(list(self.cache.entries), [str(paths[0]), str(paths[2])])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+from design_validation import DesignValidator, validate_design
+
+
+class TestDesignValidation(unittest.TestCase):
+
+    def setUp(self):
+        self.design = {
+            "enforce_square_design": True,
+            "size": 4,
+            "properties": [
+                {"location": 2, "name": "Property1", "price": 100, "rent": 10, "role": "property", "is_ownable": True},
+                {"location": 4, "name": "Property2", "price": 150, "rent": 15, "role": "property", "is_ownable": True}
+            ],
+            "functions": [
+                {"location": 1, "name": "Go", "role": "function", "is_ownable": False},
+                {"location": 3, "name": "Just Visiting / In Jail", "role": "function", "is_ownable": False}
+            ]
+        }
+
+    def test_valid_design(self):
+        self.assertEqual(validate_design(self.design), {'is_valid': True, 'errors': []})
+
+    def test_all_errors_are_collected(self):
+        self.design['properties'][0]['rent'] = ''
+        self.design['properties'][1]['name'] = 'Property1'
+        self.design['properties'][1]['price'] = ''
+        self.design['functions'][1]['location'] = 7
+        report = validate_design(self.design)
+        self.assertFalse(report['is_valid'])
+        self.assertEqual([(error['rule'], error['location']) for error in report['errors']], [
+            ('missing-location', 3),
+            ('location-out-of-range', 7),
+            ('empty-field', 2),
+            ('empty-field', 4),
+            ('duplicate-property-name', 2),
+            ('duplicate-property-name', 4),
+        ])
+
+    def test_incremental_revalidation(self):
+        validator = DesignValidator(self.design)
+        self.assertTrue(validator.report()['is_valid'])
+
+        duplicate = {"location": 2, "name": "Property3", "price": 100, "rent": 10, "role": "property", "is_ownable": True}
+        validator.add_square('properties', duplicate)
+        self.assertEqual(validator.dirty_locations, {2})
+        self.assertEqual([error['rule'] for error in validator.report()['errors']], ['size-mismatch', 'duplicate-location'])
+
+        validator.remove_square('properties', duplicate)
+        renamed = dict(self.design['properties'][1], name='Property1')
+        validator.remove_square('properties', self.design['properties'][1])
+        validator.add_square('properties', renamed)
+        # Renaming one square makes the other square with that name a duplicate too
+        self.assertEqual(validator.dirty_locations, {2, 4})
+        self.assertEqual([error['location'] for error in validator.report()['errors']], [2, 4])
+
+        validator.remove_square('properties', renamed)
+        validator.add_square('properties', self.design['properties'][1])
+        self.assertTrue(validator.report()['is_valid'])
+
+    def test_set_size(self):
+        validator = DesignValidator(self.design)
+        validator.set_size(8)
+        self.assertEqual([error['rule'] for error in validator.report()['errors']], ['missing-location'] * 4 + ['size-mismatch'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+import copy
+import json
+import pathlib as pl
+import tempfile
+from decision import AutomaticDecisionProvider
+from event_log import EventLogWriter, read_event_log, replay_event_log, RECORD_HEADER
+from game import run_headless_game
+import vars
+
+
+class RecordingDecisionProvider(AutomaticDecisionProvider):
+
+    def __init__(self):
+        self.save_states = {}
+
+    def save_game(self, game):
+        # Called once after every finished round
+        self.save_states[game.game_state["current_round"]] = copy.deepcopy(game.build_save_state())
+        return None
+
+
+class TestEventLog(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.log_path = pl.Path(self.temporary_directory.name) / 'game.log'
+        self.design = json.load(open(vars.DEFAULT_GAMEBOARD_DESIGN_PATH, 'r'))
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def play_logged_game(self, game_parameters, seed):
+        decision_provider = RecordingDecisionProvider()
+        writer = EventLogWriter(self.log_path)
+        game = run_headless_game(self.design, ['Player1', 'Player2', 'Player3'], game_parameters, decision_provider, writer, 'default_gameboard.json', seed)
+        writer.close()
+        return game, decision_provider.save_states
+
+    def test_writer_ignores_messages(self):
+        messages = []
+        writer = EventLogWriter(self.log_path, messages.append)
+        writer('message', 'hello')
+        writer('round', {'round': 1})
+        writer.close()
+        self.assertEqual(messages, ['hello'])
+        self.assertEqual(self.log_path.stat().st_size, RECORD_HEADER.size)
+
+    def test_read_event_log(self):
+        writer = EventLogWriter(self.log_path)
+        writer('round', {'round': 4})
+        writer('rent', {'player_id': 'abc', 'owner_id': 'def', 'amount': 65, 'location': 3})
+        writer('move', {'player_id': 'abc', 'location': 7})
+        writer.close()
+        self.assertEqual(list(read_event_log(self.log_path)), [
+            ('round', {'round': 4}),
+            ('rent', {'player_id': 'abc', 'owner_id': 'def', 'amount': 65, 'location': 3}),
+            ('move', {'player_id': 'abc', 'location': 7}),
+        ])
+
+    def test_replay_final_state(self):
+        game, save_states = self.play_logged_game({"maximum_rounds": 40, "go_money": 100}, 31)
+        replayed = replay_event_log(self.log_path)
+        self.assertEqual(replayed.build_save_state()['players'], game.build_save_state()['players'])
+        self.assertEqual(replayed.player_orders, game.player_orders)
+        self.assertEqual(replayed.game_state['current_round'], game.game_state['current_round'])
+        self.assertTrue(replayed.game_state['game_over'])
+        self.assertEqual(replayed.winners, game.winners)
+        for location, square in game.gameboard.actual_layout['layout'].items():
+            self.assertEqual(replayed.gameboard.actual_layout['layout'][location].get('ownership'), square.get('ownership'))
+
+    def test_replay_until_round(self):
+        game, save_states = self.play_logged_game({"maximum_rounds": 30}, 8)
+        for current_round in [2, 10, 25]:
+            replayed = replay_event_log(self.log_path, until_round=current_round - 1)
+            self.assertEqual(replayed.game_state['current_round'], current_round)
+            self.assertEqual(replayed.build_save_state()['players'], save_states[current_round]['players'])
+
+
+if __name__ == '__main__':
+    unittest.main()
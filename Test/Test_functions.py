@@ -1,6 +1,5 @@
 import unittest
 from unittest.mock import Mock
-import random
 from functions import go, income_tax, chance, free_parking, just_visiting_or_in_jail, go_to_jail, retire
 
 class TestGameFunctions(unittest.TestCase):
@@ -33,16 +32,19 @@ class TestGameFunctions(unittest.TestCase):
         self.assertEqual(self.player.money, 900)
 
     def test_chance_gain(self):
-        random.choice = Mock(side_effect=[True, 5])
+        self.player.rng.chance_is_gain = Mock(return_value=True)
+        self.player.rng.chance_amount = Mock(return_value=5)
         chance(self.player, self.game_parameters)
         gain_money = self.game_parameters['chance_multiplier'] * 5
         self.assertEqual(self.player.money, 1050)
 
     def test_chance_loss(self):
-        random.choice = Mock(side_effect=[False, 3])
+        self.player.rng.chance_is_gain = Mock(return_value=False)
+        self.player.rng.chance_amount = Mock(return_value=3)
         chance(self.player, self.game_parameters)
         loss_money = self.game_parameters['chance_multiplier'] * 3
         self.assertEqual(self.player.money, 970)
+        self.player.rng.chance_amount.assert_called_once_with(30)
 
     def test_free_parking(self):
         free_parking(self.player, self.game_parameters)
@@ -1,8 +1,12 @@
 import unittest
 from unittest.mock import MagicMock, patch
-from game import Game
+from game import Game, run_headless_game
 from player import Player
 from gameboard import Gameboard
+from decision import AutomaticDecisionProvider
+import json
+import pathlib as pl
+import tempfile
 import vars
 
 class TestGame(unittest.TestCase):
@@ -10,13 +14,14 @@ class TestGame(unittest.TestCase):
     def setUp(self):
         self.game = Game()
 
-        self.game.gameboard = MagicMock(spec=Gameboard)
+        self.game.gameboard = Gameboard()
         self.game.gameboard.design_file_name = "default_gameboard.json"
         self.game.gameboard.game_id = "test_game"
         self.mock_player1 = MagicMock(spec=Player)
         self.mock_player2 = MagicMock(spec=Player)
 
         self.mock_player1.id = 'player1'
+        self.mock_player1.index = 0
         self.mock_player1.name = 'Player1'
         self.mock_player1.location = 0
         self.mock_player1.owned_properties = []
@@ -28,6 +33,7 @@ class TestGame(unittest.TestCase):
         self.mock_player1.game_id = "test_game_id"  # 新增屬性
 
         self.mock_player2.id = 'player2'
+        self.mock_player2.index = 1
         self.mock_player2.name = 'Player2'
         self.mock_player2.location = 1
         self.mock_player2.owned_properties = []
@@ -43,16 +49,19 @@ class TestGame(unittest.TestCase):
             self.mock_player1.id: self.mock_player1,
             self.mock_player2.id: self.mock_player2
         }
+        self.game.player_table = [self.mock_player1, self.mock_player2]
         self.game.player_orders = {1: 'player1', 2: 'player2'}
 
  
         self.game.gameboard.actual_layout = {
+            'size': 10,
             'layout': {
                 0: {'ownership': None, 'owner_name': '', 'is_ownable': True, 'price': 200, 'rent': 20, 'name': 'Property1'},
                 1: {'ownership': None, 'owner_name': '', 'is_ownable': True, 'price': 300, 'rent': 30, 'name': 'Property2'},
                 2: {'ownership': None, 'owner_name': '', 'is_ownable': False, 'name': 'Go To Jail'},
             }
         }
+        self.game.gameboard.compile_layout()
 
     def tearDown(self):
         self.game = None
@@ -83,14 +92,16 @@ class TestGame(unittest.TestCase):
         self.mock_player1.show_status.assert_called_once()
 
     def test_show_all_players_status(self):
-        with patch('pandas.DataFrame.to_string') as mock_to_string:
+        with patch('game.format_table', return_value='table') as mock_format_table, patch('builtins.print'):
             self.game.show_all_players_status()
-            self.assertTrue(mock_to_string.called)
+            self.assertTrue(mock_format_table.called)
+            self.assertEqual([row['Name'] for row in mock_format_table.call_args[0][0]], ['Player1', 'Player2'])
 
     def test_show_game_status(self):
-        with patch('pandas.DataFrame.to_string') as mock_to_string:
+        with patch('game.format_table', return_value='table') as mock_format_table, patch('builtins.print'):
             self.game.show_game_status()
-            self.assertTrue(mock_to_string.called)
+            self.assertTrue(mock_format_table.called)
+            self.assertEqual(len(mock_format_table.call_args[0][0]), 3)
 
     @patch('builtins.input', side_effect=['0', '2', 'Player1', 'Player2'])
     def test_new_game(self, mock_input):
@@ -98,6 +109,18 @@ class TestGame(unittest.TestCase):
         self.assertEqual(len(self.game.players), 2)
         self.assertEqual(self.game.game_state['current_round'], 1)
 
+    def test_new_large_lobby_game_fills_players(self):
+        with patch('builtins.input', side_effect=['0', '300', '2', '1', 'roi', 'Alice', 'Bob']), patch('builtins.print'):
+            self.assertTrue(self.game.new_game(large_lobby=True))
+        self.assertEqual([player.name for player in self.game.player_table[:3]], ['Alice', 'Bob', 'roi bot 3'])
+        self.assertEqual(len(self.game.player_table), 300)
+        self.assertTrue(all(player.decision_provider is not None for player in self.game.player_table[2:]))
+
+        with patch('builtins.input', side_effect=['0', '50', '0', '0']), patch('builtins.print'):
+            self.assertTrue(self.game.new_game(large_lobby=True))
+        self.assertEqual(len(self.game.player_table), 50)
+        self.assertTrue(all(player.decision_provider is self.game.decision_provider for player in self.game.player_table))
+
     def test_player_buy_property(self):
         self.mock_player1.money = 500
         self.mock_player1.owned_properties = [0] 
@@ -122,18 +145,20 @@ class TestGame(unittest.TestCase):
 
     @patch('builtins.input', side_effect=['y', 'save_file.json', 'n'])
     def test_save_and_load_game(self, mock_input):
-        with patch('vars.json.dump') as mock_json_dump:
-            self.game.save_game_state('save_file.json')
-            self.assertTrue(mock_json_dump.called)
-
-        with patch('vars.json.load', return_value={
-            'game_state': self.game.game_state,
-            'player_orders': self.game.player_orders,
-            'game_parameters': self.game.game_parameters,
-            'players': {},
-            'gameboard_parameters': {'design_file_name': 'default_gameboard.json', 'game_id': 'test_game'}
-        }):
-            self.assertFalse(self.game.load_game_state('save_file.json'))
+        with tempfile.TemporaryDirectory() as directory, patch('vars.BASE_SAVE_STATE_PATH', pl.Path(directory)):
+            with patch('json.dump') as mock_json_dump:
+                self.game.save_game_state('save_file.json')
+                self.assertTrue(mock_json_dump.called)
+            self.game.save_index.close()
+
+            with patch('json.load', return_value={
+                'game_state': self.game.game_state,
+                'player_orders': self.game.player_orders,
+                'game_parameters': self.game.game_parameters,
+                'players': {},
+                'gameboard_parameters': {'design_file_name': 'default_gameboard.json', 'game_id': 'test_game'}
+            }):
+                self.assertFalse(self.game.load_game_state('save_file.json'))
 
     def test_player_jailbreak(self):
         self.mock_player1.is_jailed = True
@@ -157,5 +182,121 @@ class TestGame(unittest.TestCase):
         self.game.check_only_player_is_left()
         self.assertTrue(self.game.game_state["game_over"])
 
+    def test_run_headless_game(self):
+        design = json.load(open(vars.DEFAULT_GAMEBOARD_DESIGN_PATH, 'r'))
+        events = []
+        with patch('builtins.input') as mock_input, patch('builtins.print') as mock_print:
+            game = run_headless_game(design, ['Player1', 'Player2', 'Player3'], {"maximum_rounds": 20}, event_sink=lambda event, payload: events.append(event))
+            mock_input.assert_not_called()
+            mock_print.assert_not_called()
+        self.assertTrue(game.game_state["game_over"])
+        self.assertLessEqual(game.game_state["current_round"], 21)
+        self.assertGreater(len(game.winners), 0)
+        self.assertIn('message', events)
+
+    def test_run_headless_game_decision_provider(self):
+        class NeverBuy(AutomaticDecisionProvider):
+            def buy_property(self, game, player, location):
+                return False
+
+        design = json.load(open(vars.DEFAULT_GAMEBOARD_DESIGN_PATH, 'r'))
+        game = run_headless_game(design, ['Player1', 'Player2'], {"maximum_rounds": 10}, NeverBuy(), lambda event, payload: None)
+        for player in game.players.values():
+            self.assertEqual(player.owned_properties, [])
+
+
+    def test_next_player_is_announced(self):
+        class AskNextPlayerOnce(AutomaticDecisionProvider):
+            def __init__(self):
+                self.asked = set()
+
+            def choose_turn_action(self, game, player):
+                if player.id in self.asked:
+                    return 'continue'
+                self.asked.add(player.id)
+                return 'next_player'
+
+        design = json.load(open(vars.DEFAULT_GAMEBOARD_DESIGN_PATH, 'r'))
+        messages = []
+        with patch('builtins.print') as mock_print:
+            run_headless_game(design, ['Player1', 'Player2'], {"maximum_rounds": 2}, AskNextPlayerOnce(), lambda event, payload: messages.append(payload) if event == 'message' else None)
+            mock_print.assert_not_called()
+        self.assertEqual(sum(1 for message in messages if 'Next Player:' in message), 2)
+
+    def test_run_headless_game_is_reproducible(self):
+        design = json.load(open(vars.DEFAULT_GAMEBOARD_DESIGN_PATH, 'r'))
+        first = run_headless_game(design, ['Player1', 'Player2'], {"maximum_rounds": 30, "random_player_orders": True}, event_sink=lambda event, payload: None, seed=2024)
+        second = run_headless_game(design, ['Player1', 'Player2'], {"maximum_rounds": 30, "random_player_orders": True}, event_sink=lambda event, payload: None, seed=2024)
+        self.assertEqual(first.game_state["seed"], 2024)
+        self.assertEqual([player.money for player in first.players.values()], [player.money for player in second.players.values()])
+        self.assertEqual([player.location for player in first.players.values()], [player.location for player in second.players.values()])
+
+    def test_loaded_game_continues_like_the_running_game(self):
+        def play_rounds(game, last_round):
+            while game.game_state["current_round"] <= last_round and not game.game_state["game_over"]:
+                game.play_one_round()
+                game.game_state["current_round"] += 1
+
+        gameboard = Gameboard()
+        gameboard.load_design(json.load(open(vars.DEFAULT_GAMEBOARD_DESIGN_PATH, 'r')))
+        gameboard.design_file_name = 'default_gameboard.json'
+        game = Game(AutomaticDecisionProvider(), lambda event, payload: None, seed=31)
+        game.setup_game(gameboard, ['Player1', 'Player2', 'Player3'], {"random_player_orders": True})
+        with tempfile.TemporaryDirectory() as directory, patch('vars.BASE_SAVE_STATE_PATH', pl.Path(directory)):
+            play_rounds(game, 3)
+            game.save_game_state('continued.json')
+            play_rounds(game, 12)
+            loaded_game = Game(AutomaticDecisionProvider(), lambda event, payload: None)
+            self.assertTrue(loaded_game.load_game_state('continued.json'))
+            play_rounds(loaded_game, 12)
+        self.assertEqual(loaded_game.build_save_state()['players'], game.build_save_state()['players'])
+
+    def test_owners_are_player_indices(self):
+        design = json.load(open(vars.DEFAULT_GAMEBOARD_DESIGN_PATH, 'r'))
+        game = run_headless_game(design, ['Player1', 'Player2', 'Player3'], {"maximum_rounds": 10}, event_sink=lambda event, payload: None, seed=7)
+        self.assertEqual([player.index for player in game.player_table], [0, 1, 2])
+        for player in game.player_table:
+            for location in player.owned_properties:
+                self.assertEqual(game.gameboard.square_owners[location], player.index)
+                self.assertEqual(game.gameboard.actual_layout['layout'][location]['ownership'], player.id)
+
+    def test_large_lobby_game(self):
+        design = json.load(open(vars.DEFAULT_GAMEBOARD_DESIGN_PATH, 'r'))
+        game = run_headless_game(design, [f'Player{i}' for i in range(300)], {"maximum_player": vars.LARGE_LOBBY_MAXIMUM_PLAYER, "maximum_rounds": 5}, event_sink=lambda event, payload: None, seed=3)
+        self.assertEqual(len(game.player_orders), 300)
+        occupants = sorted(index for square in game.gameboard.square_occupants for index in square)
+        self.assertEqual(occupants, sorted(player.index for player in game.player_table if not player.is_retired))
+        for player in game.player_table:
+            if not player.is_retired:
+                self.assertIn(player.index, game.gameboard.square_occupants[player.location])
+
+    def test_status_goes_to_the_event_sink(self):
+        events = []
+        self.game.event_sink = lambda event, payload: events.append((event, payload))
+        with patch('builtins.print') as mock_print:
+            self.game.show_all_players_status()
+            self.game.show_game_status()
+            mock_print.assert_not_called()
+        messages = [payload for event, payload in events if event == 'message']
+        self.assertIn('All Player Status', messages[0])
+        self.assertIn('Current Round', messages[1])
+        self.assertIn('Gameboard Status', messages[2])
+
+    def test_status_is_paginated(self):
+        rows = [{'Name': f'Player{i}'} for i in range(vars.STATUS_PAGE_SIZE * 2 + 1)]
+        with patch('game.format_table', return_value='table') as mock_format_table, patch('builtins.print'), patch('builtins.input', side_effect=['', '']) as mock_input:
+            self.game.print_table_pages('All Player Status', rows)
+            self.assertEqual(mock_format_table.call_count, 3)
+            self.assertEqual(mock_input.call_count, 2)
+        with patch('game.format_table', return_value='table') as mock_format_table, patch('builtins.print'), patch('builtins.input', side_effect=['q']):
+            self.game.print_table_pages('All Player Status', rows)
+            self.assertEqual(mock_format_table.call_count, 1)
+        # Automatic players see every page without being asked
+        with patch('game.format_table', return_value='table') as mock_format_table, patch('builtins.print'), patch('builtins.input') as mock_input:
+            self.game.print_table_pages('All Player Status', rows, AutomaticDecisionProvider())
+            self.assertEqual(mock_format_table.call_count, 3)
+            mock_input.assert_not_called()
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,49 @@
+import unittest
+from game_random import GameRandom
+
+
+class TestGameRandom(unittest.TestCase):
+
+    def test_same_seed_same_streams(self):
+        first = GameRandom(1234)
+        second = GameRandom(1234)
+        self.assertEqual([first.roll_dice() for _ in range(50)], [second.roll_dice() for _ in range(50)])
+        self.assertEqual([first.chance_amount(20) for _ in range(50)], [second.chance_amount(20) for _ in range(50)])
+
+    def test_different_seeds_differ(self):
+        first = GameRandom(1)
+        second = GameRandom(2)
+        self.assertNotEqual([first.roll_dice() for _ in range(50)], [second.roll_dice() for _ in range(50)])
+
+    def test_streams_are_independent(self):
+        first = GameRandom(99)
+        second = GameRandom(99)
+        # Drawing chance cards must not shift the dice stream
+        for _ in range(10):
+            second.chance_is_gain()
+        self.assertEqual([first.roll_dice() for _ in range(20)], [second.roll_dice() for _ in range(20)])
+
+    def test_stream_key_changes_streams(self):
+        first = GameRandom(7, 'round-1')
+        second = GameRandom(7, 'round-2')
+        self.assertNotEqual([first.roll_dice() for _ in range(50)], [second.roll_dice() for _ in range(50)])
+
+    def test_dice_block(self):
+        rng = GameRandom(5, dice_block_size=8)
+        rolls = [rng.roll_dice() for _ in range(20)]
+        for first_roll, second_roll in rolls:
+            self.assertTrue(1 <= first_roll <= 4)
+            self.assertTrue(1 <= second_roll <= 4)
+        self.assertEqual(len(rng.dice_block), 4)
+
+    def test_shuffle_orders(self):
+        player_orders_keys = [1, 2, 3, 4, 5]
+        GameRandom(3).shuffle_orders(player_orders_keys)
+        self.assertEqual(sorted(player_orders_keys), [1, 2, 3, 4, 5])
+
+    def test_seed_is_generated(self):
+        self.assertIsInstance(GameRandom().seed, int)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import json
+import random
+import statistics
+from game import run_headless_game
+from game_stats import RunningStats, FixedHistogram, GameStatsAggregator
+from simulation import simulate, simulate_statistics
+import vars
+
+
+class TestGameStats(unittest.TestCase):
+
+    def setUp(self):
+        self.design = json.load(open(vars.DEFAULT_GAMEBOARD_DESIGN_PATH, 'r'))
+        self.game_parameters = {"maximum_rounds": 20}
+
+    def play(self, event_sink, seed):
+        return run_headless_game(self.design, ['Player1', 'Player2', 'Player3'], self.game_parameters, event_sink=event_sink, design_file_name='default_gameboard.json', seed=seed)
+
+    def test_running_stats(self):
+        rng = random.Random(1)
+        values = [rng.gauss(50, 10) for _ in range(200)]
+        running = RunningStats()
+        for value in values:
+            running.add(value)
+        self.assertEqual(running.count, len(values))
+        self.assertAlmostEqual(running.mean, statistics.mean(values))
+        self.assertAlmostEqual(running.variance, statistics.variance(values))
+        self.assertEqual((running.minimum, running.maximum), (min(values), max(values)))
+
+        # Any grouping of partial results gives the same totals
+        for split in [0, 1, 57, len(values)]:
+            left, right = RunningStats(), RunningStats()
+            for value in values[:split]:
+                left.add(value)
+            for value in values[split:]:
+                right.add(value)
+            merged = left.merge(right)
+            self.assertEqual(merged.count, running.count)
+            self.assertAlmostEqual(merged.mean, running.mean)
+            self.assertAlmostEqual(merged.variance, running.variance)
+
+    def test_fixed_histogram(self):
+        histogram = FixedHistogram(1, 11, 5)
+        for value in [0, 1, 2, 3, 10, 11, 25]:
+            histogram.add(value)
+        self.assertEqual(histogram.counts, [2, 1, 0, 0, 1])
+        self.assertEqual((histogram.underflow, histogram.overflow), (1, 2))
+        histogram.merge(histogram)
+        self.assertEqual(histogram.counts, [4, 2, 0, 0, 2])
+        with self.assertRaises(ValueError):
+            histogram.merge(FixedHistogram(1, 11, 10))
+
+    def test_aggregator_follows_the_game(self):
+        events = []
+        aggregator = GameStatsAggregator(self.game_parameters["maximum_rounds"])
+        game = self.play(lambda event, payload: (events.append((event, payload)), aggregator(event, payload)), seed=11)
+
+        statistics_ = aggregator.to_dict()
+        self.assertEqual(statistics_['games'], 1)
+        self.assertEqual(sum(statistics_['landings'].values()), sum(1 for event, _ in events if event == 'move'))
+        self.assertEqual(statistics_['jail_sends'], sum(1 for event, _ in events if event == 'jail'))
+        self.assertEqual(sum(income['total'] for income in statistics_['rent_income'].values()), sum(payload['amount'] for event, payload in events if event == 'rent'))
+        self.assertEqual(statistics_['game_length']['mean'], max(payload['round'] for event, payload in events if event == 'round'))
+        winner_seats = [seat for seat, player in enumerate(game.player_table) if player.id in game.winners]
+        self.assertEqual([seat for seat, rate in enumerate(statistics_['win_rate_per_seat']) if rate], winner_seats)
+        self.assertEqual(statistics_['bankruptcy_round']['count'], sum(player.is_retired for player in game.player_table))
+
+    def test_partial_aggregates_merge(self):
+        together = GameStatsAggregator(self.game_parameters["maximum_rounds"])
+        parts = [GameStatsAggregator(self.game_parameters["maximum_rounds"]) for _ in range(3)]
+        for seed, part in zip([1, 2, 3], parts):
+            self.play(together, seed)
+            self.play(part, seed)
+        merged = parts[0].merge(parts[1].merge(parts[2]))
+        merged_statistics, together_statistics = merged.to_dict(), together.to_dict()
+        for key in ['games', 'landings', 'jail_sends', 'rent_income', 'game_length_histogram', 'win_rate_per_seat', 'bankruptcy_rate_per_seat']:
+            self.assertEqual(merged_statistics[key], together_statistics[key])
+        self.assertAlmostEqual(merged_statistics['game_length']['standard_deviation'], together_statistics['game_length']['standard_deviation'])
+
+    def test_simulate_statistics(self):
+        serial = simulate_statistics('default_gameboard.json', self.game_parameters, 12, 3, workers=1, seed=5, games_per_task=5)
+        parallel = simulate_statistics('default_gameboard.json', self.game_parameters, 12, 3, workers=2, seed=5, games_per_task=5)
+        self.assertEqual(serial.to_dict(), parallel.to_dict())
+
+        results = simulate('default_gameboard.json', self.game_parameters, 12, 3, workers=1, seed=5)
+        self.assertEqual(serial.games, 12)
+        self.assertAlmostEqual(serial.game_length.mean, sum(result['rounds_played'] for result in results) / 12)
+
+
+if __name__ == '__main__':
+    unittest.main()
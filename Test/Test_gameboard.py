@@ -1,6 +1,6 @@
 import unittest
 from unittest.mock import patch, MagicMock, mock_open
-from gameboard import Gameboard, check_design
+from gameboard import Gameboard, check_design, SQUARE_NONE, SQUARE_PROPERTY, SQUARE_FUNCTION, SQUARE_GO_TO_JAIL, NO_OWNER
 import json
 
 
@@ -49,6 +49,33 @@ class TestGameboard(unittest.TestCase):
                 mock_print.assert_any_call("Error: Go does not exist.")
                 self.assertEqual(self.gameboard.actual_layout, {})
 
+    def test_compile_layout(self):
+        self.gameboard.load_design({
+            "size": 4,
+            "properties": [
+                {"location": 1, "name": "Property1", "price": 100, "rent": 10, "is_ownable": True}
+            ],
+            "functions": [
+                {"location": 2, "name": "Go", "role": "function", "is_ownable": False},
+                {"location": 3, "name": "Just Visiting / In Jail", "role": "function", "is_ownable": False},
+                {"location": 4, "name": "Go To Jail", "role": "function", "is_ownable": False}
+            ]
+        })
+        self.assertEqual(list(self.gameboard.square_kinds), [SQUARE_NONE, SQUARE_PROPERTY, SQUARE_NONE, SQUARE_FUNCTION, SQUARE_GO_TO_JAIL])
+        self.assertEqual(self.gameboard.square_prices[1], 100)
+        self.assertEqual(self.gameboard.square_rents[1], 10)
+        self.assertEqual(self.gameboard.square_names[4], 'Go To Jail')
+        self.assertIsNotNone(self.gameboard.square_functions[2])
+
+        player = MagicMock(id='player1', index=0)
+        player.name = 'Player1'
+        self.gameboard.set_owner(1, player)
+        self.assertEqual(self.gameboard.square_owners[1], 0)
+        self.assertEqual(self.gameboard.actual_layout['layout'][1]['owner_name'], 'Player1')
+        self.gameboard.clear_owner(1)
+        self.assertEqual(self.gameboard.square_owners[1], NO_OWNER)
+        self.assertIsNone(self.gameboard.actual_layout['layout'][1]['ownership'])
+
     def test_square_checker_property_valid(self):
         property_square = {
             "location": 1,
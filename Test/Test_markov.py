@@ -0,0 +1,57 @@
+import unittest
+import json
+from markov import dice_outcomes, move_location, solve_landing_probabilities, LandingChain
+import vars
+
+
+class TestMarkov(unittest.TestCase):
+
+    def setUp(self):
+        self.design = json.load(open(vars.DEFAULT_GAMEBOARD_DESIGN_PATH, 'r'))
+        self.ring_design = {
+            "enforce_square_design": True,
+            "size": 12,
+            "properties": [
+                {"location": i, "name": f"Property{i}", "price": 100, "rent": 10 * i, "role": "property", "is_ownable": True} for i in range(2, 13)
+            ],
+            "functions": [{"location": 1, "name": "Go", "role": "function", "is_ownable": False}]
+        }
+
+    def tearDown(self):
+        self.design = None
+        self.ring_design = None
+
+    def test_dice_outcomes(self):
+        outcomes = dice_outcomes()
+        self.assertAlmostEqual(sum(probability for steps, probability, is_double in outcomes), 1)
+        self.assertAlmostEqual(sum(probability for steps, probability, is_double in outcomes if is_double), 0.25)
+        self.assertEqual(min(steps for steps, probability, is_double in outcomes), 2)
+        self.assertEqual(max(steps for steps, probability, is_double in outcomes), 8)
+
+    def test_move_location(self):
+        self.assertEqual(move_location(10, 2, 10), 2)
+        self.assertEqual(move_location(3, 4, 10), 7)
+
+    def test_ring_without_jail_is_uniform(self):
+        squares = solve_landing_probabilities(self.ring_design)
+        for location, square in squares.items():
+            self.assertAlmostEqual(square["landing_probability"], 1 / 12, places=6)
+        self.assertAlmostEqual(squares[5]["expected_rent_per_roll"], 50 / 12, places=4)
+        self.assertEqual(squares[1]["expected_rent_per_roll"], 0)
+
+    def test_jail_states(self):
+        chain = LandingChain(self.design)
+        self.assertEqual(chain.number_of_states, self.design['size'] + 3)
+        distribution = chain.stationary_distribution()
+        self.assertAlmostEqual(distribution.sum(), 1)
+        # Nobody ever stands on Go To Jail at the end of a turn
+        self.assertAlmostEqual(distribution[16 - 1], 0)
+
+    def test_rolling_for_jailbreak_keeps_players_in_jail_longer(self):
+        paying = LandingChain(self.design, pay_jailbreak=True).stationary_distribution()
+        rolling = LandingChain(self.design, pay_jailbreak=False).stationary_distribution()
+        self.assertGreater(rolling[-3:].sum(), paying[-3:].sum())
+
+
+if __name__ == '__main__':
+    unittest.main()
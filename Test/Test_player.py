@@ -21,6 +21,10 @@ class TestPlayer(unittest.TestCase):
         self.assertFalse(self.player.is_jailed)
         self.assertFalse(self.player.is_retired)
 
+    def test_player_has_no_instance_dict(self):
+        self.assertFalse(hasattr(self.player, '__dict__'))
+        self.assertIsNone(self.player.index)
+
     @patch('vars.secure_random_string', return_value="secure_id")
     def test_id_generation(self, mock_secure_random_string):
         player = Player("TestPlayer", 10, "game_1")
@@ -105,6 +109,22 @@ class TestPlayer(unittest.TestCase):
         mock_handle_question_with_options.assert_called_once()
         mock_roll_dice.assert_called_once()
 
+    @patch('player.Player.roll_dice', return_value=[1, 2])
+    def test_jailbreak_uses_decision_provider(self, mock_roll_dice):
+        self.player.is_jailed = True
+        self.player.jailed_rounds_count_down = 3
+        self.player.decision_provider = MagicMock()
+        self.player.decision_provider.pay_jailbreak.return_value = False
+        self.player.event_sink = MagicMock()
+
+        dice = self.player.jailbreak(50)
+
+        self.player.decision_provider.pay_jailbreak.assert_called_once_with(self.player, 50)
+        self.assertEqual(dice, [None, None])
+        self.assertEqual(self.player.jailed_rounds_count_down, 2)
+        self.player.event_sink.assert_any_call('message', f'{self.player.name} failed to roll doubles. Must roll again next turn.')
+        self.player.event_sink.assert_called_with('jailbreak', {'player_id': self.player.id, 'paid': 0, 'count_down': 2})
+
     def test_retired(self):
         self.player.retired()
         self.assertTrue(self.player.is_retired)
@@ -116,6 +136,13 @@ class TestPlayer(unittest.TestCase):
         self.player.show_status()
         mock_print.assert_called()
 
+    @patch('builtins.print')
+    def test_show_status_goes_to_the_event_sink(self, mock_print):
+        self.player.event_sink = MagicMock()
+        self.player.show_status()
+        mock_print.assert_not_called()
+        self.assertIn(f'Player Name: {self.player.name}', self.player.event_sink.call_args[0][1])
+
     @patch('builtins.print')
     def test_show_status_retired(self, mock_print):
         self.player.retired()
@@ -0,0 +1,83 @@
+import unittest
+from unittest.mock import patch
+import json
+from decision import AutomaticDecisionProvider
+from game import Game, run_headless_game
+from profiling import GameProfiler, PROFILE_PHASES
+import vars
+
+
+class StatusOnceDecisionProvider(AutomaticDecisionProvider):
+
+    def __init__(self):
+        self.asked = set()
+
+    def choose_turn_action(self, game, player):
+        # Looks at the game status once per player, then keeps playing
+        if player.id in self.asked:
+            return 'continue'
+        self.asked.add(player.id)
+        return 'status'
+
+    def choose_status_view(self, game, player):
+        return 'all'
+
+
+class TestProfiling(unittest.TestCase):
+
+    def setUp(self):
+        self.design = json.load(open(vars.DEFAULT_GAMEBOARD_DESIGN_PATH, 'r'))
+        self.events = []
+
+    def play(self, **kwargs):
+        return run_headless_game(self.design, ['Player1', 'Player2', 'Player3'], {"maximum_rounds": 30}, event_sink=lambda event, payload: self.events.append((event, payload)), seed=8, **kwargs)
+
+    def test_profiler_counts_phases(self):
+        profiler = GameProfiler()
+        with patch('builtins.print'):
+            game = self.play(profiler=profiler, decision_provider=StatusOnceDecisionProvider())
+        profile = profiler.to_dict()
+        self.assertEqual(list(profile), [phase for phase in PROFILE_PHASES if phase in profile])
+        self.assertEqual(profile['round']['calls'], game.game_state['current_round'] - 1)
+        self.assertEqual(profile['status']['calls'], 3)
+        self.assertEqual(profile['move']['calls'], profile['landing']['calls'])
+        self.assertEqual(profile['move']['calls'], sum(1 for event, _ in self.events if event == 'roll'))
+        self.assertEqual(profile['jail']['calls'], sum(1 for event, _ in self.events if event == 'jailbreak'))
+        self.assertGreaterEqual(profile['round']['total_ns'], profile['landing']['total_ns'])
+        self.assertTrue(all(timing['total_ns'] >= 0 for timing in profile.values()))
+
+        self.assertIn(' move ', profiler.format_report())
+
+    def test_shared_profiler_is_reported_by_its_owner(self):
+        profiler = GameProfiler()
+        first = self.play(profiler=profiler)
+        first_rounds = profiler.calls['round']
+        second = self.play(profiler=profiler)
+        self.assertIs(first.profiler, second.profiler)
+        self.assertEqual(profiler.calls['round'], first_rounds + second.game_state['current_round'] - 1)
+        self.assertNotIn('profile', [event for event, _ in self.events])
+
+    def test_profiling_is_off_by_default(self):
+        game = self.play()
+        self.assertIsNone(game.profiler)
+        self.assertNotIn('move_player', game.__dict__)
+        self.assertNotIn('profile', [event for event, _ in self.events])
+        with patch('vars.PROFILE_GAMES', True):
+            self.assertIsInstance(Game().profiler, GameProfiler)
+            game = self.play()
+        profile_events = [payload['profile'] for event, payload in self.events if event == 'profile']
+        self.assertEqual(profile_events, [game.profiler.to_dict()])
+
+    def test_profilers_merge(self):
+        first, second = GameProfiler(), GameProfiler()
+        first.calls, first.nanoseconds = {'dice': 2, 'move': 1}, {'dice': 10, 'move': 5}
+        second.calls, second.nanoseconds = {'dice': 1, 'landing': 4}, {'dice': 20, 'landing': 8}
+        self.assertEqual(first.merge(second).to_dict(), {
+            'dice': {'calls': 3, 'total_ns': 30, 'mean_ns': 10},
+            'move': {'calls': 1, 'total_ns': 5, 'mean_ns': 5},
+            'landing': {'calls': 4, 'total_ns': 8, 'mean_ns': 2},
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import unittest
+from unittest.mock import patch
+import contextlib
+import io
+import json
+import pathlib as pl
+import tempfile
+from convert_saves import main as convert_saves_main
+from delta_save import delta_path_for
+from game import Game, run_headless_game
+from save_format import SAVE_FORMATS, BinarySaveFormat, read_save_state, write_save_state, owned_properties_bitset, bitset_owned_properties
+from save_index import load_save_state
+import vars
+
+
+class TestSaveFormat(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.save_state_path = pl.Path(self.temporary_directory.name)
+        self.patcher = patch('vars.BASE_SAVE_STATE_PATH', self.save_state_path)
+        self.patcher.start()
+        self.design = json.load(open(vars.DEFAULT_GAMEBOARD_DESIGN_PATH, 'r'))
+        self.game = run_headless_game(self.design, ['Player1', 'Player2', 'Player3', 'Player4'], {"maximum_rounds": 20}, event_sink=lambda event, payload: None, design_file_name='default_gameboard.json', seed=5)
+
+    def tearDown(self):
+        self.patcher.stop()
+        self.temporary_directory.cleanup()
+
+    def expected_state(self):
+        # What a binary save reads back as: integer order keys and sorted owned properties
+        save_state = json.loads(json.dumps(self.game.build_save_state()))
+        save_state['player_orders'] = {int(order): player_id for order, player_id in save_state['player_orders'].items()}
+        for player in save_state['players'].values():
+            player['owned_properties'].sort()
+        return save_state
+
+    def test_binary_round_trip(self):
+        save_state = self.game.build_save_state()
+        data = BinarySaveFormat().encode(save_state)
+        self.assertEqual(BinarySaveFormat().decode(data), self.expected_state())
+        self.assertLess(len(data) * 5, len(json.dumps(save_state, indent=4)))
+
+    def test_binary_edge_values(self):
+        save_state = self.expected_state()
+        player = next(iter(save_state['players'].values()))
+        player['money'] = -123456
+        player['game_id'] = None
+        player['gameboard_size'] = 1000000
+        player['owned_properties'] = [3, 999999]
+        player['name'] = 'Ünïcode ' * 20  # Lengths past a one-byte varint
+        save_state['game_state']['seed'] = 'named seed'
+        save_state['gameboard_parameters']['design_file_name'] = None
+        self.assertEqual(BinarySaveFormat().decode(BinarySaveFormat().encode(save_state)), save_state)
+
+    def test_owned_properties_bitset(self):
+        self.assertEqual(owned_properties_bitset([1, 9]), bytes([1, 1]))
+        self.assertEqual(owned_properties_bitset([]), b'')
+        self.assertEqual(bitset_owned_properties(owned_properties_bitset([40, 2, 17])), [2, 17, 40])
+
+    def test_corrupted_binary_save(self):
+        data = BinarySaveFormat().encode(self.game.build_save_state())
+        for corrupted in [data[:len(data) // 2], b'{"game_state": {}}']:
+            with self.assertRaises(ValueError):
+                BinarySaveFormat().decode(corrupted)
+
+    def test_format_follows_extension(self):
+        save_state = self.game.build_save_state()
+        for suffix in SAVE_FORMATS:
+            write_save_state(self.save_state_path / f'save{suffix}', save_state)
+        self.assertEqual(json.load(open(self.save_state_path / 'save.json'))['game_state']['game_id'], self.game.game_state['game_id'])
+        self.assertEqual(read_save_state(self.save_state_path / f'save{vars.BINARY_SAVE_SUFFIX}'), self.expected_state())
+        with self.assertRaises(ValueError):
+            write_save_state(self.save_state_path / 'save.txt', save_state)
+
+    def test_game_saves_and_loads_binary(self):
+        save_file_name = f'binary{vars.BINARY_SAVE_SUFFIX}'
+        self.game.save_game_state(save_file_name, incremental=True)
+        self.game.game_state['current_round'] += 1
+        self.game.save_game_state(save_file_name, incremental=True)
+
+        loaded_game = Game(event_sink=lambda event, payload: None)
+        self.assertTrue(loaded_game.load_game_state(save_file_name))
+        self.assertEqual(loaded_game.build_save_state()['players'], self.expected_state()['players'])
+        self.assertEqual(loaded_game.game_state, self.game.game_state)
+        self.assertEqual(loaded_game.player_orders, self.game.player_orders)
+
+    def test_formats_keep_their_own_deltas(self):
+        binary_file_name = f'shared{vars.BINARY_SAVE_SUFFIX}'
+        self.game.save_game_state('shared.json', incremental=True)
+        self.game.game_state['current_round'] += 1
+        self.game.save_game_state('shared.json', incremental=True)
+        json_round = self.game.game_state['current_round']
+        self.game.game_state['current_round'] += 1
+        self.game.save_game_state(binary_file_name, incremental=True)
+        self.game.game_state['current_round'] += 1
+        self.game.save_game_state(binary_file_name, incremental=True)
+        self.assertTrue(delta_path_for(self.save_state_path / binary_file_name).is_file())
+        self.assertEqual(load_save_state(self.save_state_path / 'shared.json')['game_state']['current_round'], json_round)
+        self.assertEqual(load_save_state(self.save_state_path / binary_file_name)['game_state']['current_round'], json_round + 2)
+
+        # Converting over a save drops the deltas of the save it replaces
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(convert_saves_main([str(self.save_state_path / 'shared.json'), '--to', vars.BINARY_SAVE_SUFFIX, '--workers', '1']), 0)
+        self.assertEqual(load_save_state(self.save_state_path / binary_file_name)['game_state']['current_round'], json_round)
+
+    def test_convert_saves(self):
+        self.game.save_game_state('converted.json')
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(convert_saves_main([str(self.save_state_path), '--to', vars.BINARY_SAVE_SUFFIX, '--workers', '1']), 0)
+            self.assertEqual(convert_saves_main([str(self.save_state_path / f'converted{vars.BINARY_SAVE_SUFFIX}'), '--to', '.json', '--output-directory', str(self.save_state_path / 'back')]), 0)
+        self.assertEqual(read_save_state(self.save_state_path / f'converted{vars.BINARY_SAVE_SUFFIX}'), self.expected_state())
+        back = json.load(open(self.save_state_path / 'back' / 'converted.json'))
+        self.assertEqual(back['players'], self.expected_state()['players'])
+
+
+if __name__ == '__main__':
+    unittest.main()
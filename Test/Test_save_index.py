@@ -0,0 +1,98 @@
+import unittest
+from unittest.mock import patch
+import json
+import sqlite3
+import pathlib as pl
+import tempfile
+from game import run_headless_game
+from save_format import write_save_state
+from save_index import SaveIndex, bulk_load_save_states, load_save_state
+import vars
+
+
+class TestSaveIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.save_state_path = pl.Path(self.temporary_directory.name)
+        self.patcher = patch('vars.BASE_SAVE_STATE_PATH', self.save_state_path)
+        self.patcher.start()
+        self.save_index = SaveIndex()
+
+    def tearDown(self):
+        self.save_index.close()
+        self.patcher.stop()
+        self.temporary_directory.cleanup()
+
+    def write_save(self, file_name, game_id, current_round, retired=(), game_over=False):
+        save_state = {
+            'game_state': {'game_id': game_id, 'game_over': game_over, 'current_round': current_round},
+            'player_orders': {1: 'a', 2: 'b', 3: 'c'},
+            'game_parameters': {'go_money': 1500},
+            'players': {player_id: {'id': player_id, 'money': 1500, 'is_retired': player_id in retired} for player_id in 'abc'},
+            'gameboard_parameters': {'design_file_name': 'default_gameboard.json', 'game_id': game_id}
+        }
+        write_save_state(self.save_state_path / file_name, save_state)
+        return save_state
+
+    def test_update_and_query(self):
+        for file_name, game_id, current_round, retired in [('a.json', 'g1', 3, ()), ('b.json', 'g1', 40, ('a', 'b')), ('c.json', 'g2', 12, ('c',))]:
+            self.save_index.update(file_name, self.write_save(file_name, game_id, current_round, retired))
+
+        self.assertEqual([summary['file_name'] for summary in self.save_index.query()], ['a.json', 'b.json', 'c.json'])
+        self.assertEqual([summary['file_name'] for summary in self.save_index.query(game_id='g1')], ['a.json', 'b.json'])
+        self.assertEqual([summary['file_name'] for summary in self.save_index.query(minimum_round=10, maximum_round=20)], ['c.json'])
+        self.assertEqual([summary['file_name'] for summary in self.save_index.query(minimum_live_players=2)], ['a.json', 'c.json'])
+        self.assertEqual(self.save_index.query(game_id='g2')[0], {
+            'file_name': 'c.json', 'game_id': 'g2', 'current_round': 12, 'live_players': 2, 'total_players': 3,
+            'design_file_name': 'default_gameboard.json', 'game_over': False
+        })
+
+    def test_refresh_picks_up_external_changes(self):
+        self.save_index.update('kept.json', self.write_save('kept.json', 'g1', 1))
+        self.save_index.update('deleted.json', self.write_save('deleted.json', 'g1', 1))
+        (self.save_state_path / 'deleted.json').unlink()
+        self.write_save('kept.json', 'g1', 7, game_over=True)
+        self.write_save('copied.json', 'g3', 2)
+        (self.save_state_path / 'notes.json').write_text('[]')
+
+        self.save_index.refresh()
+        summaries = {summary['file_name']: summary for summary in self.save_index.query()}
+        self.assertEqual(sorted(summaries), ['copied.json', 'kept.json'])
+        self.assertEqual(summaries['kept.json']['current_round'], 7)
+        self.assertTrue(summaries['kept.json']['game_over'])
+
+    def test_bulk_load_save_states(self):
+        file_names = [f'save_{i}.json' for i in range(6)]
+        for i, file_name in enumerate(file_names):
+            self.write_save(file_name, f'g{i}', i)
+        for workers in [1, 2]:
+            save_states = bulk_load_save_states(file_names, workers=workers)
+            self.assertEqual(list(save_states), file_names)
+            self.assertEqual([save_state['game_state']['current_round'] for save_state in save_states.values()], list(range(6)))
+
+    def test_game_save_updates_index(self):
+        design = json.load(open(vars.DEFAULT_GAMEBOARD_DESIGN_PATH, 'r'))
+        game = run_headless_game(design, ['Player1', 'Player2'], {"maximum_rounds": 3}, event_sink=lambda event, payload: None, design_file_name='default_gameboard.json', seed=2)
+        base_round = game.game_state['current_round']
+        with patch('save_index.sqlite3.connect', wraps=sqlite3.connect) as mock_connect:
+            game.save_game_state('indexed.json', incremental=True)
+            game.game_state['current_round'] += 1
+            with patch.object(SaveIndex, 'update') as mock_update:
+                game.save_game_state('indexed.json', incremental=True)
+            # Deltas are not indexed
+            mock_update.assert_not_called()
+            game.save_game_state('other.json')
+        # The game keeps one index and one connection for all its saves
+        mock_connect.assert_called_once()
+
+        def indexed_round():
+            return {summary['file_name']: summary for summary in self.save_index.query(game_id=game.game_state['game_id'])}['indexed.json']['current_round']
+        self.assertEqual(indexed_round(), base_round)
+        self.save_index.refresh()
+        self.assertEqual(indexed_round(), game.game_state['current_round'])
+        self.assertEqual(load_save_state(self.save_state_path / 'indexed.json')['game_state'], game.game_state)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+from simulation import simulate, summarize_results, play_simulated_game
+import json
+import vars
+
+
+class TestSimulation(unittest.TestCase):
+
+    def setUp(self):
+        self.game_parameters = {"maximum_rounds": 15}
+
+    def test_play_simulated_game_result(self):
+        design = json.load(open(vars.DEFAULT_GAMEBOARD_DESIGN_PATH, 'r'))
+        result = play_simulated_game(design, 'default_gameboard.json', self.game_parameters, 3, 42)
+        self.assertEqual(result["seed"], 42)
+        self.assertEqual(len(result["final_money"]), 3)
+        self.assertLessEqual(result["rounds_played"], 15)
+        self.assertGreater(len(result["winners"]), 0)
+
+    def test_simulate_is_reproducible(self):
+        first = simulate('default_gameboard.json', self.game_parameters, 5, 2, workers=1, seed=7)
+        second = simulate('default_gameboard.json', self.game_parameters, 5, 2, workers=1, seed=7)
+        self.assertEqual(first, second)
+
+    def test_simulate_process_pool_matches_serial(self):
+        serial = simulate('default_gameboard.json', self.game_parameters, 4, 2, workers=1, seed=3)
+        parallel = simulate('default_gameboard.json', self.game_parameters, 4, 2, workers=2, seed=3)
+        self.assertEqual(serial, parallel)
+
+    def test_summarize_results(self):
+        results = [
+            {"seed": 1, "winners": [0], "rounds_played": 10, "final_money": [100, 0], "bankruptcies": [1]},
+            {"seed": 2, "winners": [1], "rounds_played": 20, "final_money": [50, 60], "bankruptcies": []},
+        ]
+        summary = summarize_results(results, 2)
+        self.assertEqual(summary["games"], 2)
+        self.assertEqual(summary["average_rounds"], 15)
+        self.assertEqual(summary["win_rate_per_seat"], [0.5, 0.5])
+        self.assertEqual(summary["bankruptcy_rate_per_seat"], [0, 0.5])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+from unittest.mock import patch
+import json
+from game import Game, run_headless_game
+from player import Player
+from strategy import (
+    PropertyView, JailView, AlwaysBuyStrategy, CashThresholdStrategy, ReturnOnInvestmentStrategy, RandomStrategy,
+    StrategyDecisionProvider, make_strategy,
+)
+import vars
+
+
+class TestStrategy(unittest.TestCase):
+
+    def setUp(self):
+        self.design = json.load(open(vars.DEFAULT_GAMEBOARD_DESIGN_PATH, 'r'))
+        self.view = PropertyView(money=1000, location=2, price=600, rent=60, number_of_owned_properties=0, board_size=20, live_players=4, rounds_left=50)
+
+    def play(self, strategies, seed=3):
+        decision_providers = [StrategyDecisionProvider(strategy) for strategy in strategies]
+        return run_headless_game(self.design, [f'Player{i}' for i in range(1, len(strategies) + 1)], {"maximum_rounds": 50}, event_sink=lambda event, payload: None, seed=seed, decision_providers=decision_providers)
+
+    def test_built_in_strategies(self):
+        self.assertTrue(AlwaysBuyStrategy().buy_property(self.view))
+        self.assertTrue(CashThresholdStrategy(reserve=400).buy_property(self.view))
+        self.assertFalse(CashThresholdStrategy(reserve=401).buy_property(self.view))
+        self.assertFalse(CashThresholdStrategy(reserve=900).pay_jailbreak(JailView(money=1000, jailbreak_price=150, jailed_rounds_count_down=3)))
+        # 60 rent * 3 opponents * 50 rounds * 5 / 20 squares = 2250 expected rent
+        self.assertTrue(ReturnOnInvestmentStrategy(minimum_return=3.5).buy_property(self.view))
+        self.assertFalse(ReturnOnInvestmentStrategy(minimum_return=4).buy_property(self.view))
+        self.assertFalse(ReturnOnInvestmentStrategy().buy_property(self.view._replace(rounds_left=1)))
+        self.assertEqual([RandomStrategy(seed=1).buy_property(self.view) for _ in range(5)], [RandomStrategy(seed=1).buy_property(self.view) for _ in range(5)])
+        self.assertFalse(RandomStrategy(buy_probability=0).buy_property(self.view))
+        with self.assertRaises(ValueError):
+            make_strategy('hold-everything')
+
+    def test_strategies_drive_the_game(self):
+        game = self.play([CashThresholdStrategy(reserve=10 ** 9), AlwaysBuyStrategy()])
+        never_buys, always_buys = game.player_table
+        self.assertEqual(never_buys.owned_properties, [])
+        self.assertEqual(never_buys.decision_provider.strategy.reserve, 10 ** 9)
+        self.assertTrue(always_buys.owned_properties or always_buys.is_retired)
+
+    def test_seeded_games_are_reproducible(self):
+        strategies = lambda: [RandomStrategy(seed=1), ReturnOnInvestmentStrategy(), CashThresholdStrategy()]
+        first, second = self.play(strategies()), self.play(strategies())
+        self.assertEqual([player.money for player in first.player_table], [player.money for player in second.player_table])
+
+    def test_strategy_decides_jailbreak(self):
+        player = Player('Player1', 20, 'game_1')
+        player.event_sink = lambda event, payload: None
+        player.is_jailed = True
+        player.money = 200
+        player.decision_provider = StrategyDecisionProvider(CashThresholdStrategy(reserve=100))
+        with patch.object(Player, 'roll_dice', return_value=[1, 2]):
+            player.jailbreak(150)
+        self.assertTrue(player.is_jailed)
+        self.assertEqual(player.money, 200)
+
+    @patch('builtins.input', side_effect=['0', '2', 'Player1', 'bot:roi'])
+    def test_new_game_with_bot(self, mock_input):
+        game = Game()
+        with patch('builtins.print'):
+            self.assertTrue(game.new_game())
+        human, bot = game.player_table
+        self.assertIs(human.decision_provider, game.decision_provider)
+        self.assertIsInstance(bot.decision_provider.strategy, ReturnOnInvestmentStrategy)
+        self.assertEqual(bot.name, 'roi bot 2')
+
+    def test_new_game_random_bots_follow_the_game_seed(self):
+        def bot_choices(seed):
+            game = Game(seed=seed)
+            with patch('builtins.input', side_effect=['0', '2', 'bot:xyz', 'bot:random', 'bot:random']), patch('builtins.print'):
+                self.assertTrue(game.new_game())
+            return [[player.decision_provider.strategy.random.random() for _ in range(5)] for player in game.player_table]
+
+        first, second = bot_choices(12), bot_choices(12)
+        self.assertEqual(first, second)
+        self.assertNotEqual(first[0], first[1])
+        self.assertNotEqual(bot_choices(13), first)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from unittest.mock import patch
+import sys
+from table import render_table, format_table
+
+
+class TestTable(unittest.TestCase):
+
+    def setUp(self):
+        self.rows = [
+            {'Location': 1, 'Name': 'Go', 'Price': '-'},
+            {'Location': 10, 'Name': 'Tsing Yi', 'Price': 400},
+        ]
+
+    def test_render_table(self):
+        self.assertEqual(render_table(self.rows), '\n'.join([
+            'Location     Name Price',
+            '       1       Go     -',
+            '      10 Tsing Yi   400',
+        ]))
+
+    def test_render_table_columns(self):
+        self.assertEqual(render_table(self.rows, ['Name']), '    Name\n      Go\nTsing Yi')
+
+    def test_render_empty_table(self):
+        self.assertEqual(render_table([]), '')
+
+    def test_format_table_does_not_import_pandas(self):
+        with patch('vars.USE_PANDAS_TABLES', False), patch.dict(sys.modules, {'pandas': None}):
+            self.assertEqual(format_table(self.rows), render_table(self.rows))
+
+    def test_format_table_with_pandas(self):
+        try:
+            import pandas
+        except ImportError:
+            self.skipTest('pandas is not installed')
+        with patch('vars.USE_PANDAS_TABLES', True):
+            self.assertIn('Tsing Yi', format_table(self.rows))
+
+
+if __name__ == '__main__':
+    unittest.main()
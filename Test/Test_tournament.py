@@ -0,0 +1,64 @@
+import unittest
+import contextlib
+import io
+import json
+from tournament import TournamentStandings, matchups_for, play_matchup, run_tournament, wilson_interval, main
+import vars
+
+
+class TestTournament(unittest.TestCase):
+
+    def setUp(self):
+        self.game_parameters = {"maximum_rounds": 20}
+
+    def test_wilson_interval(self):
+        low, high = wilson_interval(50, 100, 1.96)
+        self.assertAlmostEqual(low, 0.404, places=3)
+        self.assertAlmostEqual(high, 0.596, places=3)
+        self.assertEqual(wilson_interval(0, 0, 1.96), (0.0, 1.0))
+        self.assertEqual(wilson_interval(10, 10, 1.96)[1], 1.0)
+
+    def test_matchups(self):
+        self.assertEqual(matchups_for(['a', 'b', 'c'], 2), [('a', 'b'), ('a', 'c'), ('b', 'c')])
+
+    def test_play_matchup_rotates_seats(self):
+        design = json.load(open(vars.DEFAULT_GAMEBOARD_DESIGN_PATH, 'r'))
+        scores = play_matchup(design, 'default_gameboard.json', self.game_parameters, ('roi', 'random', 'always-buy'), 7)
+        self.assertEqual(len(scores), 9)
+        for rotation in range(3):
+            game_scores = scores[rotation * 3:rotation * 3 + 3]
+            self.assertAlmostEqual(sum(score for _, _, score in game_scores), 1)
+            self.assertEqual([seat for _, seat, _ in game_scores], [0, 1, 2])
+        # Every strategy sits in every seat once
+        self.assertEqual(sorted((name, seat) for name, seat, _ in scores), sorted((name, seat) for name in ['roi', 'random', 'always-buy'] for seat in range(3)))
+        self.assertEqual(scores, play_matchup(design, 'default_gameboard.json', self.game_parameters, ('roi', 'random', 'always-buy'), 7))
+
+    def test_standings_separate(self):
+        standings = TournamentStandings(['a', 'b'], 2)
+        standings.add([('a', 0, 1), ('b', 1, 0)] * 2)
+        self.assertFalse(standings.is_separated())
+        standings.add([('a', 1, 1), ('b', 0, 0)] * 50)
+        report = standings.report()
+        self.assertTrue(report['separated'])
+        self.assertEqual([standing['strategy'] for standing in report['standings']], ['a', 'b'])
+        self.assertEqual(report['win_rate_per_seat'], [2 / 52, 50 / 52])
+
+    def test_run_tournament_stops_early(self):
+        reports = list(run_tournament(['roi', 'always-buy'], 2, game_parameters=self.game_parameters, maximum_seeds=10000, minimum_seeds=20, block_size=20, workers=1, seed=1))
+        self.assertTrue(reports[-1]['separated'])
+        self.assertLess(reports[-1]['seeds'], 10000)
+        self.assertEqual(reports[-1]['standings'][0]['games'], reports[-1]['seeds'] * 2)
+
+    def test_parallel_matches_serial(self):
+        serial = list(run_tournament(['roi', 'random', 'cash-threshold'], 2, game_parameters=self.game_parameters, maximum_seeds=6, block_size=3, workers=1, seed=2))
+        parallel = list(run_tournament(['roi', 'random', 'cash-threshold'], 2, game_parameters=self.game_parameters, maximum_seeds=6, block_size=3, workers=2, seed=2))
+        self.assertEqual(len(serial), 2)
+        self.assertEqual(serial, parallel)
+
+    def test_main_rejects_unknown_strategy(self):
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            main(['roi', 'hold-everything'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+from unittest.mock import MagicMock
+from turn_order import TurnOrder
+
+
+class TestTurnOrder(unittest.TestCase):
+
+    def setUp(self):
+        self.player_table = []
+        for index, player_id in enumerate(['a', 'b', 'c', 'd']):
+            self.player_table.append(MagicMock(id=player_id, index=index))
+        self.players = {player.id: player for player in self.player_table}
+        self.turn_order = TurnOrder(range(4))
+
+    def test_next_after_wraps_around(self):
+        self.assertEqual(self.turn_order.first, 0)
+        self.assertEqual(self.turn_order.next_after(2), 3)
+        self.assertEqual(self.turn_order.next_after(3), 0)
+
+    def test_retire(self):
+        self.turn_order.retire(1, 6)
+        self.turn_order.retire(0, 6)
+        self.assertEqual(len(self.turn_order), 2)
+        self.assertEqual(self.turn_order.seats(), [2, 3])
+        self.assertEqual(self.turn_order.first, 2)
+        self.assertEqual(self.turn_order.next_after(3), 2)
+        self.assertFalse(self.turn_order.is_playing(1))
+        # Retiring twice does nothing
+        self.turn_order.retire(1, 6)
+        self.assertEqual(self.turn_order.retired, [(7, 1), (8, 0)])
+
+    def test_player_orders_round_trip(self):
+        self.turn_order.retire(1, 6)
+        player_orders = self.turn_order.to_player_orders(self.player_table)
+        self.assertEqual(player_orders, {1: 'a', 2: 'c', 3: 'd', 7: 'b'})
+
+        # Saved files have string keys
+        restored = TurnOrder.from_player_orders({str(k): v for k, v in player_orders.items()}, self.players, 6)
+        self.assertEqual(restored.seats(), [0, 2, 3])
+        self.assertEqual(restored.to_player_orders(self.player_table), player_orders)
+        restored.retire(3, 6)
+        self.assertEqual(restored.to_player_orders(self.player_table), {1: 'a', 2: 'c', 7: 'b', 8: 'd'})
+
+
+if __name__ == '__main__':
+    unittest.main()
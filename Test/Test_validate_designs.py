@@ -0,0 +1,51 @@
+import json
+import tempfile
+import unittest
+import pathlib as pl
+from unittest.mock import patch
+import vars
+from validate_designs import validate_design_file, validate_designs, main
+
+
+class TestValidateDesigns(unittest.TestCase):
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.directory = pl.Path(self.temporary_directory.name)
+        self.valid_path = self.directory / 'valid.json'
+        self.valid_path.write_text(vars.DEFAULT_GAMEBOARD_DESIGN_PATH.read_text())
+        design = json.loads(vars.DEFAULT_GAMEBOARD_DESIGN_PATH.read_text())
+        design['properties'][0]['price'] = '100'
+        self.invalid_path = self.directory / 'invalid.json'
+        self.invalid_path.write_text(json.dumps(design))
+        self.broken_path = self.directory / 'broken.json'
+        self.broken_path.write_text('{')
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_validate_design_file(self):
+        self.assertTrue(validate_design_file(self.valid_path)['is_valid'])
+        record = validate_design_file(self.invalid_path)
+        self.assertFalse(record['is_valid'])
+        self.assertEqual([error['rule'] for error in record['errors']], ['property-schema'])
+        self.assertEqual(validate_design_file(self.broken_path)['errors'][0]['rule'], 'invalid-json')
+
+    def test_validate_designs_keeps_order(self):
+        paths = [self.valid_path, self.broken_path, self.invalid_path]
+        records = list(validate_designs(paths, workers=2))
+        self.assertEqual([record['file'] for record in records], [str(path) for path in paths])
+        self.assertEqual(records, list(validate_designs(paths, workers=1)))
+
+    def test_main_exit_code(self):
+        with patch('builtins.print') as mock_print:
+            self.assertEqual(main([str(self.directory), '--workers', '1']), 1)
+            lines = [call.args[0] for call in mock_print.call_args_list if call.kwargs.get('file') is None]
+            self.assertEqual(len(lines), 3)
+            self.assertEqual(json.loads(lines[0])['file'], str(self.broken_path))
+        with patch('builtins.print'):
+            self.assertEqual(main([str(self.directory), '--pattern', 'valid.json', '--workers', '1']), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
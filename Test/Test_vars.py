@@ -1,5 +1,5 @@
 import unittest
-from vars import secure_random_string, is_valid_save_file_name, is_valid_type
+from vars import secure_random_string, is_valid_save_file_name, is_valid_save_state_file_name, is_valid_type
 
 class TestVarsFunctions(unittest.TestCase):
 
@@ -14,6 +14,12 @@ class TestVarsFunctions(unittest.TestCase):
         self.assertFalse(is_valid_save_file_name("testjson"))
         self.assertFalse(is_valid_save_file_name(""))
 
+    def test_is_valid_save_state_file_name(self):
+        self.assertTrue(is_valid_save_state_file_name("test.json"))
+        self.assertTrue(is_valid_save_state_file_name("test.msav"))
+        self.assertFalse(is_valid_save_file_name("test.msav"))
+        self.assertFalse(is_valid_save_state_file_name("test.msav.json.txt"))
+
     def test_is_valid_type(self):
         self.assertTrue(is_valid_type("123", [int]))
         self.assertFalse(is_valid_type("abc", [int]))
@@ -0,0 +1,56 @@
+import unittest
+import json
+import numpy as np
+from simulation import simulate, summarize_results
+from vectorized import VectorizedGames, simulate_vectorized, summarize_vectorized_results, SQUARE_GO, SQUARE_PROPERTY, SQUARE_GO_TO_JAIL
+import vars
+
+
+class TestVectorized(unittest.TestCase):
+
+    def setUp(self):
+        self.design = json.load(open(vars.DEFAULT_GAMEBOARD_DESIGN_PATH, 'r'))
+        self.game_parameters = {"maximum_rounds": 60, "go_money": 100}
+
+    def tearDown(self):
+        self.design = None
+
+    def test_square_tables(self):
+        games = VectorizedGames(self.design, 2, 2)
+        self.assertEqual(games.square_kind[1], SQUARE_GO)
+        self.assertEqual(games.square_kind[2], SQUARE_PROPERTY)
+        self.assertEqual(games.square_kind[16], SQUARE_GO_TO_JAIL)
+        self.assertEqual(games.square_price[2], 800)
+        self.assertEqual(games.jail_location, 6)
+
+    def test_simulate_vectorized_shapes(self):
+        results = simulate_vectorized(self.design, 50, 3, self.game_parameters, seed=1)
+        self.assertEqual(results["final_money"].shape, (50, 3))
+        self.assertTrue((results["rounds_played"] <= 60).all())
+        self.assertTrue(results["winners"].any(axis=1).all())
+        self.assertTrue((results["final_money"][results["bankruptcies"]] == 0).all())
+
+    def test_simulate_vectorized_is_reproducible(self):
+        first = simulate_vectorized(self.design, 20, 2, self.game_parameters, seed=5)
+        second = simulate_vectorized(self.design, 20, 2, self.game_parameters, seed=5)
+        self.assertTrue(np.array_equal(first["final_money"], second["final_money"]))
+
+    def test_retired_players_lose_properties(self):
+        games = VectorizedGames(self.design, 1, 3)
+        games.ownership[0, 2] = 1
+        games.ownership[0, 3] = 0
+        games.retire_players(np.array([0]), np.array([1]))
+        self.assertEqual(games.ownership[0, 2], -1)
+        self.assertEqual(games.ownership[0, 3], 0)
+        self.assertFalse(games.game_over[0])
+
+    def test_matches_scalar_engine(self):
+        scalar = summarize_results(simulate('default_gameboard.json', self.game_parameters, 300, 2, workers=1, seed=11), 2)
+        vectorized = summarize_vectorized_results(simulate_vectorized(self.design, 3000, 2, self.game_parameters, seed=11))
+        self.assertAlmostEqual(scalar["average_rounds"], vectorized["average_rounds"], delta=0.1 * scalar["average_rounds"])
+        for scalar_rate, vectorized_rate in zip(scalar["bankruptcy_rate_per_seat"], vectorized["bankruptcy_rate_per_seat"]):
+            self.assertAlmostEqual(scalar_rate, vectorized_rate, delta=0.1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import threading
+import vars
+from delta_save import DeltaSaveWriter, snapshot_save_state
+from save_index import SaveIndex
+
+
+class AutosaveWriter:
+    # Serializes save states on a background thread. Only the latest pending snapshot is kept,
+    # so a slow disk never makes the game loop wait or queue up stale checkpoints.
+    # Checkpoints after the first are appended as deltas, so a checkpoint costs O(changes).
+
+    def __init__(self, save_file_name):
+        self.save_path = vars.BASE_SAVE_STATE_PATH / save_file_name
+        self.delta_save_writer = DeltaSaveWriter(save_file_name)
+        self.save_index = SaveIndex()
+        self.condition = threading.Condition()
+        self.pending_state = None
+        self.closed = False
+        self.saves_written = 0
+        self.last_error = None
+        self.thread = threading.Thread(target=self.run, name=f'autosave-{save_file_name}', daemon=True)
+        self.thread.start()
+
+    def submit(self, save_state):
+        snapshot = snapshot_save_state(save_state)
+        with self.condition:
+            self.pending_state = snapshot
+            self.condition.notify()
+
+    def run(self):
+        while True:
+            with self.condition:
+                while self.pending_state is None and not self.closed:
+                    self.condition.wait()
+                if self.pending_state is None and self.closed:
+                    # The index connection belongs to this thread
+                    self.save_index.close()
+                    return
+                save_state = self.pending_state
+                self.pending_state = None
+
+            try:
+                self.delta_save_writer.save(save_state)
+                self.saves_written += 1
+                self.save_index.update(self.save_path.name, save_state)
+            except Exception as e:
+                self.last_error = e
+
+    def take_error(self):
+        # The last write error since the previous call, so the game can report it once
+        error, self.last_error = self.last_error, None
+        return error
+
+    def close(self):
+        # Writes whatever is still pending before the thread stops
+        with self.condition:
+            self.closed = True
+            self.condition.notify()
+        self.thread.join()
@@ -0,0 +1,70 @@
+import argparse
+import os
+import pathlib as pl
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from delta_save import write_full_save_state
+from save_format import SAVE_FORMATS
+from save_index import load_save_state
+
+
+def converted_path(save_path, suffix, output_directory=None):
+    return (output_directory or save_path.parent) / save_path.with_suffix(suffix).name
+
+
+def convert_save_file(save_path, destination_path):
+    # Pending deltas are folded in, and stale deltas of the destination dropped, so the converted save stands on its own
+    try:
+        write_full_save_state(destination_path, load_save_state(save_path))
+        return {'file': str(save_path), 'converted': str(destination_path), 'size': save_path.stat().st_size, 'converted_size': destination_path.stat().st_size, 'error': None}
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+        return {'file': str(save_path), 'converted': str(destination_path), 'size': None, 'converted_size': None, 'error': f'{type(e).__name__}: {e}'}
+
+
+def convert_saves(save_paths, destination_paths, workers=None):
+    # Yields one record per save in the order of save_paths
+    if workers == 1:
+        yield from map(convert_save_file, save_paths, destination_paths)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(save_paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(convert_save_file, save_paths, destination_paths, chunksize=chunksize)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Convert game saves between the JSON and the binary save format.')
+    parser.add_argument('saves', nargs='+', help='Save files, or directories whose saves are all converted')
+    parser.add_argument('--to', choices=list(SAVE_FORMATS), required=True, help='Extension, and so format, of the converted saves')
+    parser.add_argument('--output-directory', type=pl.Path, default=None)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    save_paths = []
+    for save in map(pl.Path, args.saves):
+        if save.is_dir():
+            save_paths.extend(sorted(path for path in save.iterdir() if path.suffix in SAVE_FORMATS and path.suffix != args.to))
+        elif save.suffix in SAVE_FORMATS:
+            save_paths.append(save)
+        else:
+            parser.error(f'{save} is not a save file, expected one of {", ".join(SAVE_FORMATS)}')
+    if args.output_directory is not None:
+        args.output_directory.mkdir(parents=True, exist_ok=True)
+    destination_paths = [converted_path(save_path, args.to, args.output_directory) for save_path in save_paths]
+
+    number_of_failures, size, converted_size = 0, 0, 0
+    for record in convert_saves(save_paths, destination_paths, args.workers):
+        if record['error'] is not None:
+            number_of_failures += 1
+            print(f'{record["file"]}: {record["error"]}', file=sys.stderr)
+        else:
+            size += record['size']
+            converted_size += record['converted_size']
+
+    print(f'{len(save_paths) - number_of_failures} saves converted ({size} -> {converted_size} bytes), {number_of_failures} failed', file=sys.stderr)
+    return 1 if number_of_failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,76 @@
+import vars
+
+
+class InteractiveDecisionProvider:
+
+    def choose_turn_action(self, game, player):
+        selection = vars.handle_question_with_options(f'<---- Show status [0], query next player [1] or continue [empty input] ? ', ['0', '1', '2', ''])
+        if selection == '':
+            return 'continue'
+        elif selection == '1':
+            return 'next_player'
+        return 'status'
+
+    def choose_status_view(self, game, player):
+        selection = vars.handle_question_with_options(f'<---- Show own status [0], specific player status [1], all players status [2], game status [3]? ', ['0', '1', '2', '3'])
+        return {'0': 'own', '1': 'player', '2': 'all', '3': 'game'}[selection]
+
+    def choose_player_id(self, game, player):
+        while True:
+            specific_user_id = input(f'<---- Input specific player id: [-1 to exit show status] ')
+            if specific_user_id == '-1':
+                return None
+            if specific_user_id in game.players:
+                return specific_user_id
+
+    def continue_paging(self, game, page, number_of_pages):
+        return input('<---- Press Enter for the next page, q to stop: ').lower() != 'q'
+
+    def buy_property(self, game, player, location):
+        square_name = game.gameboard.actual_layout['layout'][location]['name']
+        selection = vars.handle_question_with_options(f'<---- {square_name} is not owned! Do you wanna buy it? [Y / n] ', ['y', 'n', ''])
+        return selection == 'y' or selection == ''
+
+    def pay_jailbreak(self, player, jailbreak_price):
+        selection = vars.handle_question_with_options(f'Pay ${jailbreak_price} to jailbreak immediately [Y / n]? ', ['y', 'n', ''])
+        return selection.lower() == 'y' or selection.lower() == ''
+
+    def save_game(self, game):
+        save_game = vars.handle_question_with_options('\nDo you want to save the game? [y / N] ? ', ['y', 'n', ''])
+        if save_game == 'y':
+            return vars.handle_question_with_function(f'Please enter save name [only alphanumeric characters and underscores, ends with .json or {vars.BINARY_SAVE_SUFFIX}]: ', vars.is_valid_save_state_file_name)
+        return None
+
+    def continue_playing(self, game):
+        continue_playing = vars.handle_question_with_options('Continue playing [Y / n] ? ', ['y', 'n', ''])
+        return continue_playing != 'n'
+
+
+class AutomaticDecisionProvider:
+
+    def choose_turn_action(self, game, player):
+        return 'continue'
+
+    def choose_status_view(self, game, player):
+        return 'own'
+
+    def choose_player_id(self, game, player):
+        return None
+
+    def continue_paging(self, game, page, number_of_pages):
+        return True
+
+    def buy_property(self, game, player, location):
+        return True
+
+    def pay_jailbreak(self, player, jailbreak_price):
+        return True
+
+    def save_game(self, game):
+        return None
+
+    def continue_playing(self, game):
+        return True
+
+
+DEFAULT_DECISION_PROVIDER = InteractiveDecisionProvider()
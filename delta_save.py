@@ -0,0 +1,107 @@
+import json
+import vars
+from save_format import write_save_state
+
+
+DEFAULT_COMPACTION_INTERVAL = 50
+
+
+def delta_path_for(save_path):
+    # Keyed on the full file name, so saves of the same name in different formats keep their own deltas
+    return save_path.with_name(f'{save_path.name}.delta.jsonl')
+
+
+def write_full_save_state(save_path, save_state):
+    # The deltas belong to the old base, so they go first. A crash in between leaves the old base
+    # on its own, an older but consistent save, never the new base with the old deltas replayed on top.
+    delta_path_for(save_path).unlink(missing_ok=True)
+    write_save_state(save_path, save_state)
+
+
+def compute_save_delta(previous_state, save_state):
+    # Only players whose fields changed are written, and only the fields that changed.
+    # Square ownership is stored through each player's owned_properties, so it is covered too.
+    delta = {}
+    game_state_changes = {k: v for k, v in save_state['game_state'].items() if previous_state['game_state'].get(k) != v}
+    if game_state_changes:
+        delta['game_state'] = game_state_changes
+    if save_state['player_orders'] != previous_state['player_orders']:
+        delta['player_orders'] = save_state['player_orders']
+    if save_state['game_parameters'] != previous_state['game_parameters']:
+        delta['game_parameters'] = save_state['game_parameters']
+
+    players_changes = {}
+    for player_id, player in save_state['players'].items():
+        previous_player = previous_state['players'].get(player_id, {})
+        player_changes = {k: v for k, v in player.items() if previous_player.get(k) != v}
+        if player_changes:
+            players_changes[player_id] = player_changes
+    if players_changes:
+        delta['players'] = players_changes
+    return delta
+
+
+def apply_save_delta(save_state, delta):
+    save_state['game_state'].update(delta.get('game_state', {}))
+    if 'player_orders' in delta:
+        save_state['player_orders'] = delta['player_orders']
+    if 'game_parameters' in delta:
+        save_state['game_parameters'] = delta['game_parameters']
+    for player_id, player_changes in delta.get('players', {}).items():
+        save_state['players'].setdefault(player_id, {}).update(player_changes)
+    return save_state
+
+
+def apply_save_deltas(save_state, save_path):
+    delta_path = delta_path_for(save_path)
+    if not delta_path.is_file():
+        return save_state
+    with open(delta_path, 'r') as delta_file:
+        for line in delta_file:
+            try:
+                delta = json.loads(line)
+            except ValueError:
+                # A crash while appending can leave a partial last line
+                break
+            apply_save_delta(save_state, delta)
+    return save_state
+
+
+def snapshot_save_state(save_state):
+    # build_save_state creates fresh player dicts but shares the live game dicts, so copy those
+    return {
+        'game_state': dict(save_state['game_state']),
+        'player_orders': dict(save_state['player_orders']),
+        'game_parameters': dict(save_state['game_parameters']),
+        'players': save_state['players'],
+        'gameboard_parameters': dict(save_state['gameboard_parameters']),
+    }
+
+
+class DeltaSaveWriter:
+    # Writes one full base snapshot and then appends per-save deltas next to it.
+    # Every compaction_interval deltas the base is rewritten and the deltas are dropped.
+
+    def __init__(self, save_file_name, compaction_interval=DEFAULT_COMPACTION_INTERVAL):
+        self.save_path = vars.BASE_SAVE_STATE_PATH / save_file_name
+        self.delta_path = delta_path_for(self.save_path)
+        self.compaction_interval = compaction_interval
+        self.last_state = None
+        self.deltas_written = 0
+
+    def save(self, save_state):
+        # Returns True when the save rewrote the base, False when it appended a delta
+        compacted = self.last_state is None or self.deltas_written >= self.compaction_interval
+        if compacted:
+            self.compact(save_state)
+        else:
+            delta = compute_save_delta(self.last_state, save_state)
+            with open(self.delta_path, 'a') as delta_file:
+                delta_file.write(json.dumps(delta, separators=(',', ':')) + '\n')
+            self.deltas_written += 1
+        self.last_state = snapshot_save_state(save_state)
+        return compacted
+
+    def compact(self, save_state):
+        write_full_save_state(self.save_path, save_state)
+        self.deltas_written = 0
@@ -0,0 +1,66 @@
+import hashlib
+import json
+from collections import OrderedDict
+import vars
+from design_validation import validate_design
+
+
+class DesignCacheEntry:
+    __slots__ = ('mtime_ns', 'size', 'content_hash', 'design', 'report')
+
+    def __init__(self, mtime_ns, size, content_hash, design, report):
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.content_hash = content_hash
+        self.design = design
+        self.report = report
+
+
+class DesignCache:
+    # Parsed and validated gameboard designs keyed by path. An unchanged mtime and size skip the read;
+    # a changed mtime with the same content hash skips the parse. Least recently used entries are evicted.
+    # The cached design dicts are shared between callers and must not be mutated.
+
+    def __init__(self, maximum_entries=vars.DESIGN_CACHE_SIZE):
+        self.maximum_entries = maximum_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, design_path):
+        key = str(design_path)
+        stat = design_path.stat()
+        entry = self.entries.get(key)
+        if entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry.design, entry.report
+
+        with open(design_path, 'r') as design_file:
+            content = design_file.read()
+        content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        if entry is not None and entry.content_hash == content_hash:
+            # Touched but not changed
+            entry.mtime_ns, entry.size = stat.st_mtime_ns, stat.st_size
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry.design, entry.report
+
+        design = json.loads(content)
+        report = validate_design(design)
+        self.entries[key] = DesignCacheEntry(stat.st_mtime_ns, stat.st_size, content_hash, design, report)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maximum_entries:
+            self.entries.popitem(last=False)
+        self.misses += 1
+        return design, report
+
+    def clear(self):
+        self.entries.clear()
+
+
+DESIGN_CACHE = DesignCache()
+
+
+def load_design_file(design_path):
+    return DESIGN_CACHE.load(design_path)
@@ -0,0 +1,168 @@
+RULE_MESSAGES = {
+    'square-design': "Error: Board size must be multiple of 4 to enforce square gameboard design!",
+    'missing-location': "Error: There exist empty loactions or location index / size mismatch!",
+    'location-out-of-range': "Error: There exist empty loactions or location index / size mismatch!",
+    'size-mismatch': "Error: Board Size must be equal to sum of properties and functions!",
+    'empty-field': "Error: There exist empty field in gameboard design.",
+    'duplicate-location': "Error: Duplicate locations detected.",
+    'duplicate-property-name': "Error: Duplicate property name detected.",
+    'jail-missing': "Error: Just Visiting / In Jail needs to exist if Go To Jail exists",
+    'go-missing': "Error: Go does not exist.",
+}
+RULE_ORDER = {rule: order for order, rule in enumerate(RULE_MESSAGES)}
+
+
+def validation_error(rule, location=None):
+    return {'rule': rule, 'location': location, 'message': RULE_MESSAGES[rule]}
+
+
+def error_sort_key(error):
+    location = error['location']
+    return RULE_ORDER[error['rule']], location if isinstance(location, int) else -1
+
+
+class DesignValidator:
+    # Indexes a gameboard design by location and by name. Edits go through add_square / remove_square,
+    # which only mark the touched locations; report() re-checks those and reuses the rest.
+    # The common case of one square per location and one property per name is kept in flat dicts;
+    # lists are only created for clashing locations and names.
+
+    def __init__(self, design):
+        self.design = design
+        self.squares = {}  # location: first row at that location
+        self.square_items = {}  # location: 'properties' or 'functions' for that row
+        self.stacked_squares = {}  # location: [(item, row), ...] for every further row at that location
+        self.property_name_counts = {}
+        self.property_name_location = {}  # property name: location of a square using it
+        self.duplicate_name_locations = {}  # property name: [location, ...] once the name is used twice
+        self.function_name_counts = {}
+        self.number_of_squares = 0
+        self.size = 0
+        self.missing_locations = set()
+        self.location_errors = {}
+        self.dirty_locations = set()
+        for item in ['properties', 'functions']:
+            for row in design[item]:
+                self.add_square(item, row)
+        self.set_size(design['size'])
+
+    def is_in_range(self, location):
+        return isinstance(location, int) and 1 <= location <= self.size
+
+    def set_size(self, size):
+        self.size = int(size)
+        self.missing_locations = {location for location in range(1, self.size + 1) if location not in self.squares}
+        # Whether a square is out of range depends on the size
+        self.dirty_locations.update(self.squares)
+
+    def add_square(self, item, row):
+        location = row.get('location')
+        if location in self.squares:
+            self.stacked_squares.setdefault(location, []).append((item, row))
+        else:
+            self.squares[location] = row
+            self.square_items[location] = item
+        self.number_of_squares += 1
+        self.missing_locations.discard(location)
+        self.dirty_locations.add(location)
+
+        name = row.get('name')
+        if item == 'functions':
+            self.function_name_counts[name] = self.function_name_counts.get(name, 0) + 1
+            return
+        count = self.property_name_counts.get(name, 0) + 1
+        self.property_name_counts[name] = count
+        if count == 1:
+            self.property_name_location[name] = location
+        elif count == 2:
+            # The square already using this name becomes a duplicate as well
+            self.duplicate_name_locations[name] = [self.property_name_location[name], location]
+            self.dirty_locations.add(self.property_name_location[name])
+        else:
+            self.duplicate_name_locations[name].append(location)
+
+    def remove_square(self, item, row):
+        location = row.get('location')
+        stacked = self.stacked_squares.get(location, [])
+        if self.squares[location] is row:
+            if stacked:
+                self.square_items[location], self.squares[location] = stacked.pop(0)
+            else:
+                del self.squares[location]
+                del self.square_items[location]
+                if self.is_in_range(location):
+                    self.missing_locations.add(location)
+        else:
+            stacked.pop(next(i for i, (_, square) in enumerate(stacked) if square is row))
+        if location in self.stacked_squares and not stacked:
+            del self.stacked_squares[location]
+        self.number_of_squares -= 1
+        self.dirty_locations.add(location)
+
+        name = row.get('name')
+        if item == 'functions':
+            self.function_name_counts[name] -= 1
+            if not self.function_name_counts[name]:
+                del self.function_name_counts[name]
+            return
+        count = self.property_name_counts[name] - 1
+        if count == 0:
+            del self.property_name_counts[name]
+            del self.property_name_location[name]
+            return
+        self.property_name_counts[name] = count
+        name_locations = self.duplicate_name_locations[name]
+        name_locations.remove(location)
+        self.dirty_locations.update(name_locations)
+        self.property_name_location[name] = name_locations[0]
+        if count == 1:
+            del self.duplicate_name_locations[name]
+
+    def check_location(self, location):
+        row = self.squares.get(location)
+        if row is None:
+            return []
+        if location not in self.stacked_squares and self.is_in_range(location) and '' not in row and '' not in row.values():
+            # Fast path: the only square at an in-range location with all fields filled
+            if self.square_items[location] == 'functions' or self.property_name_counts[row.get('name')] == 1:
+                return []
+        errors = []
+        rows = [(self.square_items[location], row)] + self.stacked_squares.get(location, [])
+        if not self.is_in_range(location):
+            errors.append(validation_error('location-out-of-range', location))
+        if len(rows) > 1:
+            errors.append(validation_error('duplicate-location', location))
+        for item, row in rows:
+            if '' in row or '' in row.values():
+                errors.append(validation_error('empty-field', location))
+            if item == 'properties' and self.property_name_counts[row.get('name')] > 1:
+                errors.append(validation_error('duplicate-property-name', location))
+        return errors
+
+    def report(self):
+        for location in self.dirty_locations:
+            errors = self.check_location(location)
+            if errors:
+                self.location_errors[location] = errors
+            else:
+                self.location_errors.pop(location, None)
+        self.dirty_locations.clear()
+
+        errors = []
+        if self.design.get('enforce_square_design') and self.size % 4 != 0:
+            errors.append(validation_error('square-design'))
+        errors.extend(validation_error('missing-location', location) for location in self.missing_locations)
+        if self.size != self.number_of_squares:
+            errors.append(validation_error('size-mismatch'))
+        for location_errors in self.location_errors.values():
+            errors.extend(location_errors)
+        if "Go To Jail" in self.function_name_counts and "Just Visiting / In Jail" not in self.function_name_counts:
+            errors.append(validation_error('jail-missing'))
+        if "Go" not in self.function_name_counts:
+            errors.append(validation_error('go-missing'))
+        errors.sort(key=error_sort_key)
+        return {'is_valid': not errors, 'errors': errors}
+
+
+def validate_design(design):
+    return DesignValidator(design).report()
@@ -0,0 +1,167 @@
+import json
+import struct
+from decision import AutomaticDecisionProvider
+from game import Game, discard_event
+
+
+# Every record starts with the same fixed-width header:
+# event code, player string index, other player string index, two signed integer fields.
+RECORD_HEADER = struct.Struct('<BIIqq')
+
+# Variable-length records: the header is followed by `b` bytes of payload
+STRING_RECORD = 1
+SNAPSHOT_RECORD = 2
+
+# event name: (code, player field, other player field, integer field a, integer field b)
+EVENT_RECORDS = {
+    'round': (3, None, None, 'round', None),
+    'roll': (4, 'player_id', None, 'first_roll', 'second_roll'),
+    'move': (5, 'player_id', None, 'location', None),
+    'pass_go': (6, 'player_id', None, 'amount', None),
+    'buy': (7, 'player_id', None, 'location', 'price'),
+    'rent': (8, 'player_id', 'owner_id', 'amount', 'location'),
+    'tax': (9, 'player_id', None, 'amount', None),
+    'chance': (10, 'player_id', None, 'amount', None),
+    'jail': (11, 'player_id', None, 'location', None),
+    'jailbreak': (12, 'player_id', None, 'paid', 'count_down'),
+    'retire': (13, 'player_id', None, None, None),
+    'game_over': (14, None, None, None, None),
+    'winner': (15, 'player_id', None, None, None),
+}
+EVENT_NAMES = {record[0]: event for event, record in EVENT_RECORDS.items()}
+
+
+class EventLogWriter:
+    # Event sink that appends typed game events to a binary log. Names and ids are written once
+    # to an inline string table and referenced by index afterwards.
+
+    def __init__(self, log_path, message_sink=None):
+        self.log_path = log_path
+        self.log_file = open(log_path, 'ab')
+        self.message_sink = message_sink
+        self.string_table = {}
+
+    def string_index(self, value):
+        if value is None:
+            return 0
+        index = self.string_table.get(value)
+        if index is None:
+            index = len(self.string_table) + 1
+            self.string_table[value] = index
+            encoded = value.encode('utf-8')
+            self.log_file.write(RECORD_HEADER.pack(STRING_RECORD, 0, 0, index, len(encoded)))
+            self.log_file.write(encoded)
+        return index
+
+    def __call__(self, event, payload):
+        if event == 'message':
+            if self.message_sink is not None:
+                self.message_sink(payload)
+            return
+
+        if event == 'snapshot':
+            encoded = json.dumps(payload).encode('utf-8')
+            self.log_file.write(RECORD_HEADER.pack(SNAPSHOT_RECORD, 0, 0, 0, len(encoded)))
+            self.log_file.write(encoded)
+            return
+
+        record = EVENT_RECORDS.get(event)
+        if record is None:
+            return
+        code, player_field, other_field, a_field, b_field = record
+        player_index = self.string_index(payload[player_field]) if player_field else 0
+        other_index = self.string_index(payload[other_field]) if other_field else 0
+        a = payload[a_field] if a_field else 0
+        b = payload[b_field] if b_field else 0
+        self.log_file.write(RECORD_HEADER.pack(code, player_index, other_index, a, b))
+
+    def flush(self):
+        self.log_file.flush()
+
+    def close(self):
+        self.log_file.close()
+
+
+def read_event_log(log_path):
+    # Yields (event, payload) pairs in the same shape the game emitted them
+    string_table = {0: None}
+    with open(log_path, 'rb') as log_file:
+        while True:
+            header = log_file.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                return
+            code, player_index, other_index, a, b = RECORD_HEADER.unpack(header)
+            if code == STRING_RECORD:
+                string_table[a] = log_file.read(b).decode('utf-8')
+            elif code == SNAPSHOT_RECORD:
+                yield 'snapshot', json.loads(log_file.read(b).decode('utf-8'))
+            else:
+                event = EVENT_NAMES[code]
+                _, player_field, other_field, a_field, b_field = EVENT_RECORDS[event]
+                payload = {}
+                if player_field:
+                    payload[player_field] = string_table[player_index]
+                if other_field:
+                    payload[other_field] = string_table[other_index]
+                if a_field:
+                    payload[a_field] = a
+                if b_field:
+                    payload[b_field] = b
+                yield event, payload
+
+
+def replay_event_log(log_path, until_round=None):
+    # Rebuilds a Game from the log without prompting. With until_round the game is returned as it
+    # was when that round finished, i.e. right before the next round started.
+    game = None
+    last_round = None
+    for event, payload in read_event_log(log_path):
+        if event == 'snapshot':
+            game = Game(AutomaticDecisionProvider(), discard_event)
+            game.restore_save_state(payload['save_state'], payload['gameboard_design'])
+            continue
+
+        if event == 'round':
+            if until_round is not None and payload['round'] > until_round:
+                game.game_state['current_round'] = payload['round']
+                return game
+            last_round = payload['round']
+            game.game_state['current_round'] = last_round
+            continue
+
+        apply_event(game, event, payload)
+
+    if game is not None and last_round is not None:
+        game.game_state['current_round'] = last_round + 1
+    return game
+
+
+def apply_event(game, event, payload):
+    player = game.players.get(payload.get('player_id'))
+    if event == 'move':
+        player.location = payload['location']
+        game.gameboard.place_player(player)
+    elif event in ('pass_go', 'chance'):
+        player.money += payload['amount']
+    elif event == 'tax':
+        player.money -= payload['amount']
+    elif event == 'buy':
+        player.location = payload['location']
+        player.buy_property(payload['location'], payload['price'])
+        game.change_property_ownership(player)
+    elif event == 'rent':
+        player.money -= payload['amount']
+        game.players[payload['owner_id']].money += payload['amount']
+    elif event == 'jail':
+        player.jailed(payload['location'])
+        game.gameboard.place_player(player)
+    elif event == 'jailbreak':
+        player.money -= payload['paid']
+        player.is_jailed = payload['count_down'] != 0
+        player.jailed_rounds_count_down = payload['count_down'] or 3
+    elif event == 'retire':
+        game.retire_player(player)
+    elif event == 'game_over':
+        game.game_state['game_over'] = True
+    elif event == 'winner':
+        game.winners.append(payload['player_id'])
@@ -1,38 +1,43 @@
-import random
 import vars
+from game_random import DEFAULT_GAME_RANDOM
 
 
 def go(player, game_parameters):
-    print(f'!! Welcome Back {player.name}! Get ${game_parameters["go_money"]}!')
+    player.announce(f'!! Welcome Back {player.name}! Get ${game_parameters["go_money"]}!')
     player.money += game_parameters['go_money']
+    player.emit('pass_go', player_id=player.id, amount=game_parameters['go_money'])
 
 
 def income_tax(player, game_parameters):
     tax_amount = int((player.money * game_parameters["tax_amount_rate"]) // 10 * 10)
-    print(f'!! {player.name} is being charged for ${tax_amount} as income tax!')
+    player.announce(f'!! {player.name} is being charged for ${tax_amount} as income tax!')
     player.money -= tax_amount
+    player.emit('tax', player_id=player.id, amount=tax_amount)
 
 
 def chance(player, game_parameters):
-    print(f'!! {player.name} got a Chance!')
-    is_gain = random.choice([True, False])
+    player.announce(f'!! {player.name} got a Chance!')
+    rng = player.rng or DEFAULT_GAME_RANDOM
+    is_gain = rng.chance_is_gain()
     if is_gain:
-        gain_money = game_parameters['chance_multiplier'] * random.choice(range(20))
-        print(f'!! Yay! {player.name} got {gain_money}!')
+        gain_money = game_parameters['chance_multiplier'] * rng.chance_amount(20)
+        player.announce(f'!! Yay! {player.name} got {gain_money}!')
         player.money += gain_money
+        player.emit('chance', player_id=player.id, amount=gain_money)
     else:
-        loss_money = game_parameters['chance_multiplier'] * random.choice(range(30))
-        print(f'!! Ooops! {player.name} loss {loss_money}!')
+        loss_money = game_parameters['chance_multiplier'] * rng.chance_amount(30)
+        player.announce(f'!! Ooops! {player.name} loss {loss_money}!')
         player.money -= loss_money
+        player.emit('chance', player_id=player.id, amount=-loss_money)
 
 
 def free_parking(player, game_parameters):
-    print(f'!! {player.name} is taking a break and Parking!')
+    player.announce(f'!! {player.name} is taking a break and Parking!')
 
 
 def just_visiting_or_in_jail(player, game_parameters):
     if not player.is_jailed:
-        print(f'!! {player.name} is visiting someone!')
+        player.announce(f'!! {player.name} is visiting someone!')
     else:
         player.jailbreak(game_parameters['jailbreak_price'])
 
@@ -40,17 +45,18 @@ def just_visiting_or_in_jail(player, game_parameters):
 def go_to_jail(player, jail_location):
     if not player.is_jailed:
         player.jailed(jail_location)
-        print(f'!! {player.name} is jailed!')
+        player.emit('jail', player_id=player.id, location=jail_location)
+        player.announce(f'!! {player.name} is jailed!')
     else:
-        print(f'!! {player.name} is jailed already!')
+        player.announce(f'!! {player.name} is jailed already!')
 
 
 def retire(player):
     if not player.is_retired:
         player.retired()
-        print(f'!! {player.name} is retired!')
+        player.announce(f'!! {player.name} is retired!')
     else:
-        print(f'!! {player.name} is retired already!')
+        player.announce(f'!! {player.name} is retired already!')
 
 
 available_functions = {
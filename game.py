@@ -1,24 +1,46 @@
-import json
+import copy
 import vars
-from gameboard import Gameboard, check_design
+from turn_order import TurnOrder
+from gameboard import Gameboard, print_design_report, SQUARE_PROPERTY, SQUARE_FUNCTION, SQUARE_GO_TO_JAIL, NO_OWNER
 from player import Player
+from design_cache import load_design_file
+from decision import DEFAULT_DECISION_PROVIDER, AutomaticDecisionProvider
+from strategy import STRATEGIES, StrategyDecisionProvider, make_strategy
+from game_random import GameRandom
+from delta_save import DeltaSaveWriter, apply_save_deltas, write_full_save_state
+from autosave import AutosaveWriter
+from save_index import SaveIndex
+from save_format import read_save_state
+from table import format_table
+from profiling import GameProfiler
 import pathlib as pl
-import random
-import pandas as pd
 
 
 class Game:
 
-    def __init__(self):
-
+    def __init__(self, decision_provider=None, event_sink=None, seed=None, profiler=None):
+
+        self.decision_provider = decision_provider or DEFAULT_DECISION_PROVIDER
+        self.event_sink = event_sink
+        self.winners = []
+        self.rng = GameRandom(seed)
+        self.profiler = profiler or (GameProfiler() if vars.PROFILE_GAMES else None)
+        # A profiler passed in may be shared by several games, so its owner reports it, not the game
+        self.reports_profile = profiler is None and self.profiler is not None
+        if self.profiler is not None:
+            self.profiler.time_phases(self)
+        self.delta_save_writers = {}
+        self.save_index = None
         self.gameboard = None
         self.players = {}
-        self.player_orders = {}
+        self.player_table = []
+        self.turn_order = TurnOrder()
         self.game_state = {
             "game_id": None,
             "game_over": False,
             "current_round": 1,
             "current_player_id": '',
+            "seed": self.rng.seed,
         }
         self.game_parameters = {
             "random_player_orders": False,
@@ -31,59 +53,83 @@ class Game:
             "maximum_player": 0
         }
 
+    @staticmethod
+    def default_game_parameters(large_lobby=False):
+        return {
+            "random_player_orders": vars.DEFAULT_RANDOM_PLAYER_ORDERS,
+            "chance_multiplier": vars.DEFAULT_CHANCE_MULTIPLIER,
+            "jailbreak_price": vars.DEFAULT_JAILBREAK_PRICE,
+            "tax_amount_rate": vars.DEFAULT_TAX_AMOUNT_RATE,
+            "go_money": vars.DEFAULT_GO_MONEY,
+            "maximum_rounds": vars.DEFAULT_MAXIMUM_ROUNDS,
+            "minimum_player": vars.DEFAULT_MINIMUM_PLAYER,
+            "maximum_player": vars.LARGE_LOBBY_MAXIMUM_PLAYER if large_lobby else vars.DEFAULT_MAXIMUM_PLAYER
+        }
+
+    def announce(self, message):
+        if self.event_sink is None:
+            print(message)
+        else:
+            self.event_sink('message', message)
+
+    def emit(self, event, **payload):
+        if self.event_sink is not None:
+            self.event_sink(event, payload)
+
+    @property
+    def player_orders(self):
+        # Save/display view of the turn order: {order: player id}, retired players above maximum_player
+        return self.turn_order.to_player_orders(self.player_table)
+
+    @player_orders.setter
+    def player_orders(self, player_orders):
+        self.turn_order = TurnOrder.from_player_orders(player_orders, self.players, self.game_parameters["maximum_player"])
+
+    def attach_player(self, player):
+        # Players share the game's decision provider unless they bring their own
+        if player.decision_provider is None:
+            player.decision_provider = self.decision_provider
+        player.event_sink = self.event_sink
+        player.rng = self.rng
+
+    def add_player(self, player):
+        # String ids stay at the save/display boundary; the game loop addresses players by index
+        player.index = len(self.player_table)
+        self.player_table.append(player)
+        self.players[player.id] = player
+        self.attach_player(player)
+
     def change_property_ownership(self, player, active_retire_player=False):
         if active_retire_player:
             for i in player.owned_properties:
-                self.gameboard.actual_layout['layout'][i]['ownership'] = None
-                self.gameboard.actual_layout['layout'][i]['owner_name'] = ''
+                self.gameboard.clear_owner(i)
 
-        elif self.gameboard.actual_layout['layout'][player.location]['is_ownable'] and not self.gameboard.actual_layout['layout'][player.location]['ownership']:
-            self.gameboard.actual_layout['layout'][player.location]['ownership'] = player.id
-            self.gameboard.actual_layout['layout'][player.location]['owner_name'] = player.name
+        elif self.gameboard.square_is_ownable[player.location] and self.gameboard.square_owners[player.location] == NO_OWNER:
+            self.gameboard.set_owner(player.location, player)
 
-        elif not self.gameboard.actual_layout['layout'][player.location]['is_ownable']:
-            print('Not ownable.')
+        elif not self.gameboard.square_is_ownable[player.location]:
+            self.announce('Not ownable.')
 
         else:
-            print('Ownership update failed.')
+            self.announce('Ownership update failed.')
 
     def retire_player(self, player):
         if not player.is_retired:
             self.change_property_ownership(player, True)
             player.retired()
+            self.gameboard.remove_player(player)
 
-            retired_player_id = player.id
-            player_orders_keys = list(self.player_orders.keys())
-            player_orders_keys.sort()
-            if max(player_orders_keys) <= self.game_parameters["maximum_player"]:
-                next_retired_player_order = self.game_parameters["maximum_player"] + 1
-            else:
-                next_retired_player_order = max(player_orders_keys) + 1
-
-            new_player_orders = {}
-            new_player_order = 1
-            player_orders_keys_still_playing = [i for i in player_orders_keys if i <= self.game_parameters["maximum_player"]]
-            player_orders_keys_retired = [i for i in player_orders_keys if i > self.game_parameters["maximum_player"]]
-
-            for player_order_key in player_orders_keys_still_playing:
-                if self.player_orders[player_order_key] != retired_player_id:
-                    new_player_orders[new_player_order] = self.player_orders[player_order_key]
-                    new_player_order += 1
-                else:
-                    new_player_orders[next_retired_player_order] = self.player_orders[player_order_key]
-
-            for player_order_key in player_orders_keys_retired:
-                new_player_orders[player_order_key] = self.player_orders[player_order_key]
-
-            self.player_orders = new_player_orders
-            print(f'{player.name} is retired!')
+            self.turn_order.retire(player.index, self.game_parameters["maximum_player"])
+            self.emit('retire', player_id=player.id)
+            self.announce(f'{player.name} is retired!')
 
     def show_player_status(self, player_id):
         player = self.players[player_id]
         player.show_status()
 
-    def show_all_players_status(self):
-        player_orders_keys = list(self.player_orders.keys())
+    def show_all_players_status(self, decision_provider=None):
+        player_orders = self.player_orders
+        player_orders_keys = list(player_orders.keys())
         player_orders_keys.sort()
         player_details = []
         for player_order in player_orders_keys:
@@ -98,7 +144,7 @@ class Game:
                 "IsJailed": '-',
                 "RoundsToStayInJail": '-',
             }
-            player = self.players[self.player_orders[player_order]]
+            player = self.players[player_orders[player_order]]
             if player.is_retired:
                 player_detail.update({
                     "IsRetired": True,
@@ -126,22 +172,26 @@ class Game:
                     "OwnedProperties": player.owned_properties,
                 })
             player_details.append(player_detail)
-        player_status_df = pd.DataFrame(player_details, index=player_orders_keys)
-        pd.set_option('display.max_rows', None)  # Show all rows
-        pd.set_option('display.max_columns', None)  # Show all columns
-        pd.set_option('display.max_colwidth', None)  # Show full column content
-        print('\nAll Player Status: \n', player_status_df.to_string(index=False), '\n')
-
-    def show_game_status(self):
-
-        player_locations_dict = {}
-        for player_id, player_ in self.players.items():
-            if not player_.is_retired:
-                player_name_id = f'{player_.name} (ID: {player_id})'
-                if player_.location not in player_locations_dict:
-                    player_locations_dict[player_.location] = [player_name_id]
-                else:
-                    player_locations_dict[player_.location].append(player_name_id)
+        self.print_table_pages('All Player Status', player_details, decision_provider)
+
+    def print_table_pages(self, title, rows, decision_provider=None):
+        # Large lobbies and boards are shown a page at a time; the decision provider says whether to go on
+        decision_provider = decision_provider or self.decision_provider
+        page_size = vars.STATUS_PAGE_SIZE
+        number_of_pages = max(1, -(-len(rows) // page_size))
+        for page in range(number_of_pages):
+            page_title = title if number_of_pages == 1 else f'{title} (page {page + 1} / {number_of_pages})'
+            self.announce(f'\n{page_title}: \n {format_table(rows[page * page_size:(page + 1) * page_size])} \n')
+            if page < number_of_pages - 1 and not decision_provider.continue_paging(self, page + 1, number_of_pages):
+                break
+
+    def players_on_square(self, location):
+        occupants = self.gameboard.square_occupants[location]
+        if not occupants:
+            return '-'
+        return [f'{self.player_table[index].name} (ID: {self.player_table[index].id})' for index in sorted(occupants)]
+
+    def show_game_status(self, decision_provider=None):
 
         gameboard_ = self.gameboard.actual_layout
         locations = list(gameboard_['layout'].keys())
@@ -165,39 +215,26 @@ class Game:
                     'Price': gameboard_['layout'][location]['price'],
                     'Rent': gameboard_['layout'][location]['rent'],
                     'OwnerID': gameboard_['layout'][location]['ownership'] if gameboard_['layout'][location]['ownership'] else '-',
-                    'PlayersOnSquare': player_locations_dict.get(location, '-')
+                    'PlayersOnSquare': self.players_on_square(location)
                 })
             else:
                 square.update({
                     'Location': location,
                     'Name': gameboard_['layout'][location]['name'],
                     'Type': 'Function',
-                    'PlayersOnSquare': player_locations_dict.get(location, '-')
+                    'PlayersOnSquare': self.players_on_square(location)
                 })
             squares.append(square)
 
-        gameboard_df = pd.DataFrame(squares, index=locations)
-        pd.set_option('display.max_rows', None)  # Show all rows
-        pd.set_option('display.max_columns', None)  # Show all columns
-        pd.set_option('display.max_colwidth', None)  # Show full column content
-        print(f'\nGame ID: {self.game_state["game_id"]}\nCurrent Round: {self.game_state["current_round"]}\nCurrent Player ID: {self.game_state["current_player_id"]}')
-        print('\nGameboard Status: \n', gameboard_df.to_string(index=False), '\n')
+        self.announce(f'\nGame ID: {self.game_state["game_id"]}\nCurrent Round: {self.game_state["current_round"]}\nCurrent Player ID: {self.game_state["current_player_id"]}')
+        self.print_table_pages('Gameboard Status', squares, decision_provider)
 
-    def new_game(self):
+    def new_game(self, large_lobby=False):
         print("Let's proceed to create a new game!")
         self.game_state["game_id"] = vars.secure_random_string(12)
 
         # For Game Parameters
-        self.game_parameters = {
-            "random_player_orders": vars.DEFAULT_RANDOM_PLAYER_ORDERS,
-            "chance_multiplier": vars.DEFAULT_CHANCE_MULTIPLIER,
-            "jailbreak_price": vars.DEFAULT_JAILBREAK_PRICE,
-            "tax_amount_rate": vars.DEFAULT_TAX_AMOUNT_RATE,
-            "go_money": vars.DEFAULT_GO_MONEY,
-            "maximum_rounds": vars.DEFAULT_MAXIMUM_ROUNDS,
-            "minimum_player": vars.DEFAULT_MINIMUM_PLAYER,
-            "maximum_player": vars.DEFAULT_MAXIMUM_PLAYER
-        }
+        self.game_parameters = self.default_game_parameters(large_lobby)
 
         # For Gameboard
         gameboard_design_selection = vars.handle_question_with_options('Load default design [0] or Load existing design [1] ', ['0', '1'])
@@ -213,8 +250,8 @@ class Game:
                     break
                 try:
                     gameboard_design_path = vars.BASE_GAMEBOARD_DESIGN_DIR / gameboard_design_file_name
-                    gameboard_design = json.load(open(gameboard_design_path, 'r'))
-                    design_is_valid = check_design(gameboard_design)
+                    gameboard_design, report = load_design_file(gameboard_design_path)
+                    design_is_valid = print_design_report(report)
                     if design_is_valid:
                         gameboard.load_design(gameboard_design)
                         break
@@ -242,87 +279,144 @@ class Game:
             except:
                 continue
 
-        players_list = []
+        # A large lobby can name some players and fill in the others
+        number_of_named_players = number_of_players
+        bot_strategy = None
+        if large_lobby:
+            number_of_named_players = int(vars.handle_question_with_function(f'How many players do you want to name (0 - {number_of_players})? The others are filled in automatically: ', lambda answer: answer.isdigit() and int(answer) <= number_of_players))
+            if number_of_named_players < number_of_players and vars.handle_question_with_options('Fill the other players with generated names [0] or with bots [1] ? ', ['0', '1']) == '1':
+                bot_strategy = vars.handle_question_with_options(f'Strategy of the bots ({" / ".join(STRATEGIES)}): ', list(STRATEGIES))
+
+        player_names = []
+        decision_providers = []
         player_orders_list = [i for i in range(1, number_of_players + 1)]
         if self.game_parameters["random_player_orders"]:
             print('Player order will be shuffled in each round!')
 
         for idx, player_order in enumerate(player_orders_list):
 
-            player_name = input(f'Please enter player name for order {idx+1}: [empty for randomly generated strings] ')
+            if idx >= number_of_named_players:
+                player_name = '' if bot_strategy is None else f'bot:{bot_strategy}'
+            else:
+                while True:
+                    player_name = input(f'Please enter player name for order {idx+1}: [empty for randomly generated strings, bot:<{" / ".join(STRATEGIES)}> for a computer player] ')
+                    if player_name.startswith('bot:') and player_name[4:] not in STRATEGIES:
+                        print(f'Unknown bot strategy {player_name[4:]!r}, expected one of {", ".join(STRATEGIES)}')
+                        continue
+                    break
 
+            decision_provider = None
             if player_name == '':
                 player_name = vars.secure_random_string(12)
+            elif player_name.startswith('bot:') and player_name[4:] in STRATEGIES:
+                player_name, decision_provider = self.make_bot(player_name[4:], idx)
             else:
                 player_name = str(player_name)
 
-            player_ = Player(player_name, gameboard.actual_layout['size'], self.game_state["game_id"])
-
-            players_list.append(player_)
+            player_names.append(player_name)
+            decision_providers.append(decision_provider)
 
-            self.player_orders.update({player_order: player_.id})
-
-        self.players = {player.id: player for player in players_list}
-        start_player_id = min([i for i in self.player_orders.keys()])
-        self.game_state['current_player_id'] = self.player_orders[start_player_id]
+        self.create_players(player_names, decision_providers)
         print(f'Game (game id: {self.game_state["game_id"]}) has created!')
         return True
 
+    def make_bot(self, strategy_name, idx):
+        # (player name, decision provider) of a computer player. A random bot draws from a stream of
+        # the game seed and its seat, so a seeded game stays reproducible.
+        parameters = {'seed': f'{self.rng.seed}:{idx}'} if strategy_name == 'random' else {}
+        return f'{strategy_name} bot {idx+1}', StrategyDecisionProvider(make_strategy(strategy_name, **parameters))
+
+    def setup_game(self, gameboard, player_names, game_parameters=None, decision_providers=None):
+        # Non-interactive counterpart of new_game
+        self.game_state["game_id"] = vars.secure_random_string(12)
+        self.game_parameters = self.default_game_parameters()
+        if game_parameters:
+            self.game_parameters.update(game_parameters)
+
+        self.gameboard = gameboard
+        self.gameboard.game_id = self.game_state["game_id"]
+        self.create_players(player_names, decision_providers)
+
+    def create_players(self, player_names, decision_providers=None):
+        # decision_providers[i] is used for player i; None falls back to the game's decision provider
+        self.players = {}
+        self.player_table = []
+        decision_providers = decision_providers or [None] * len(player_names)
+        for player_name, decision_provider in zip(player_names, decision_providers):
+            player_ = Player(player_name, self.gameboard.actual_layout['size'], self.game_state["game_id"])
+            player_.decision_provider = decision_provider
+            self.add_player(player_)
+            self.gameboard.place_player(player_)
+
+        self.turn_order = TurnOrder(range(len(self.player_table)))
+        self.game_state['current_player_id'] = self.player_table[self.turn_order.first].id
+
     def load_game_state(self, save_file_name):
         try:
             save_path = vars.BASE_SAVE_STATE_PATH / save_file_name
-            save_state = json.load(open(save_path, 'r'))
-            self.game_state = save_state['game_state']
-            self.player_orders = {int(k): v for k, v in save_state['player_orders'].items()}
-            # For loading game parameter
-            self.game_parameters = {
-                "random_player_orders": save_state["game_parameters"]["random_player_orders"],
-                "chance_multiplier": int(save_state["game_parameters"]["chance_multiplier"]),
-                "jailbreak_price": int(save_state["game_parameters"]["jailbreak_price"]),
-                "tax_amount_rate": float(save_state["game_parameters"]["tax_amount_rate"]),
-                "go_money": int(save_state["game_parameters"]["go_money"]),
-                "maximum_rounds": int(save_state["game_parameters"]["maximum_rounds"]),
-                "minimum_player": int(save_state["game_parameters"]["minimum_player"]),
-                "maximum_player": int(save_state["game_parameters"]["maximum_player"])
-            }
-            # For Loading Players
-            players = {}
-            for player_id, player in save_state['players'].items():
-                player_ = Player('', 10, '')
-                player_.name = player['name']
-                player_.id = player['id']
-                player_.location = player['location']
-                player_.money = player['money']
-                player_.owned_properties = [i for i in player['owned_properties']]  # Directly assign will lead to pass by reference
-                player_.is_jailed = player['is_jailed']
-                player_.jailed_rounds_count_down = player['jailed_rounds_count_down']
-                player_.is_retired = player['is_retired']
-                player_.gameboard_size = player['gameboard_size']
-                player_.game_id = player['game_id']
-                players.update({player_id: player_})
-            self.players = players
-
-            # For Loading Gameboard
-            gameboard = Gameboard()
-            gameboard_design = json.load(open(vars.BASE_GAMEBOARD_DESIGN_DIR / save_state['gameboard_parameters']['design_file_name'], 'r'))
-            gameboard.load_design(gameboard_design)
-            gameboard.design_file_name = save_state['gameboard_parameters']['design_file_name']
-            gameboard.game_id = save_state['gameboard_parameters']['game_id']
-
-            for player_id, player in players.items():
-                for location in player.owned_properties:
-                    gameboard.actual_layout['layout'][int(location)]['ownership'] = player_id
-                    gameboard.actual_layout['layout'][int(location)]['owner_name'] = player.name
-
-            self.gameboard = gameboard
-            print(f'Successfully loaded game state from {save_path}')
+            save_state = read_save_state(save_path)
+            save_state = apply_save_deltas(save_state, save_path)
+            self.restore_save_state(save_state)
+            self.announce(f'Successfully loaded game state from {save_path}')
             return True
         except Exception as e:
-            print(f"Error loading save state: {e}")
+            self.announce(f"Error loading save state: {e}")
             return False
 
-    def save_game_state(self, save_file_name):
-        save_path = vars.BASE_SAVE_STATE_PATH / save_file_name
+    def restore_save_state(self, save_state, gameboard_design=None):
+        self.game_state = save_state['game_state']
+        # Resume from the saved seed; play_one_round keys the streams by round, so the loaded game
+        # rolls the same dice as the game that kept running after the save
+        if 'seed' in self.game_state:
+            self.rng = GameRandom(self.game_state['seed'])
+        else:
+            self.game_state['seed'] = self.rng.seed
+        # For loading game parameter
+        self.game_parameters = {
+            "random_player_orders": save_state["game_parameters"]["random_player_orders"],
+            "chance_multiplier": int(save_state["game_parameters"]["chance_multiplier"]),
+            "jailbreak_price": int(save_state["game_parameters"]["jailbreak_price"]),
+            "tax_amount_rate": float(save_state["game_parameters"]["tax_amount_rate"]),
+            "go_money": int(save_state["game_parameters"]["go_money"]),
+            "maximum_rounds": int(save_state["game_parameters"]["maximum_rounds"]),
+            "minimum_player": int(save_state["game_parameters"]["minimum_player"]),
+            "maximum_player": int(save_state["game_parameters"]["maximum_player"])
+        }
+        # For Loading Players
+        self.players = {}
+        self.player_table = []
+        for player_id, player in save_state['players'].items():
+            player_ = Player('', 10, '')
+            player_.name = player['name']
+            player_.id = player['id']
+            player_.location = player['location']
+            player_.money = player['money']
+            player_.owned_properties = [i for i in player['owned_properties']]  # Directly assign will lead to pass by reference
+            player_.is_jailed = player['is_jailed']
+            player_.jailed_rounds_count_down = player['jailed_rounds_count_down']
+            player_.is_retired = player['is_retired']
+            player_.gameboard_size = player['gameboard_size']
+            player_.game_id = player['game_id']
+            self.add_player(player_)
+        self.player_orders = save_state['player_orders']
+
+        # For Loading Gameboard
+        gameboard = Gameboard()
+        if gameboard_design is None:
+            gameboard_design, _ = load_design_file(vars.BASE_GAMEBOARD_DESIGN_DIR / save_state['gameboard_parameters']['design_file_name'])
+        gameboard.load_design(gameboard_design)
+        gameboard.design_file_name = save_state['gameboard_parameters']['design_file_name']
+        gameboard.game_id = save_state['gameboard_parameters']['game_id']
+
+        for player in self.player_table:
+            for location in player.owned_properties:
+                gameboard.set_owner(int(location), player)
+            if not player.is_retired:
+                gameboard.place_player(player)
+
+        self.gameboard = gameboard
+
+    def build_save_state(self):
         players = {}
         for player_id, player in self.players.items():
             player_ = {
@@ -338,7 +432,7 @@ class Game:
                 "game_id": player.game_id
             }
             players.update({player_id: player_})
-        save_state = {
+        return {
             'game_state': self.game_state,
             'player_orders': self.player_orders,
             'game_parameters': self.game_parameters,
@@ -348,165 +442,249 @@ class Game:
                 'game_id': self.gameboard.game_id
             }
         }
-        json.dump(save_state, open(save_path, 'w'), indent=4)
-        print(f'Saving game status to {save_path}')
+
+    def save_game_state(self, save_file_name, incremental=False):
+        save_path = vars.BASE_SAVE_STATE_PATH / save_file_name
+        save_state = self.build_save_state()
+        if incremental:
+            # Base snapshot on the first save, small deltas afterwards
+            if save_file_name not in self.delta_save_writers:
+                self.delta_save_writers[save_file_name] = DeltaSaveWriter(save_file_name)
+            full_save = self.delta_save_writers[save_file_name].save(save_state)
+        else:
+            write_full_save_state(save_path, save_state)
+            self.delta_save_writers.pop(save_file_name, None)
+            full_save = True
+        # An index commit costs more than a delta, so only full saves are indexed;
+        # until the next one the index shows the base, and SaveIndex.refresh catches up
+        if full_save:
+            try:
+                if self.save_index is None:
+                    self.save_index = SaveIndex()
+                self.save_index.update(save_file_name, save_state)
+            except Exception as e:
+                self.announce(f'Could not update the save index: {e}')
+        self.announce(f'Saving game status to {save_path}')
 
     def play_one_round(self):
 
-        print('\nRound: ', self.game_state["current_round"])
+        self.announce(f'\nRound: {self.game_state["current_round"]}')
+        self.emit('round', round=self.game_state["current_round"])
+        # Saves are taken between rounds, so every round starts from streams that only depend on the seed and the round
+        self.rng.select_stream(f'round-{self.game_state["current_round"]}')
 
-        current_player_orders = {k: v for k, v in self.player_orders.items() if k <= self.game_parameters["maximum_player"]}
-        current_player_orders_keys = list(current_player_orders.keys())
-        if not self.game_parameters["random_player_orders"]:
-            current_player_orders_keys.sort()
-        else:
-            random.shuffle(current_player_orders_keys)
+        seats = self.turn_order.seats()
+        if self.game_parameters["random_player_orders"]:
+            self.rng.shuffle_orders(seats)
 
-        for idx, current_player_order in enumerate(current_player_orders_keys):
+        for idx, player_index in enumerate(seats):
             if not self.game_state["game_over"]:
-                current_player = self.players[current_player_orders[current_player_order]]
-                if idx < len(current_player_orders_keys) - 1:
-                    next_player_order = current_player_orders_keys[idx + 1]
-                    next_player_id = current_player_orders[next_player_order]
-                else:
-                    next_player_id = self.player_orders[min(self.player_orders.keys())]
+                current_player = self.player_table[player_index]
                 if current_player.is_retired:
                     pass
 
                 else:
-                    print(f'\n--> Current player: {current_player.name} (player id: {current_player.id})')
+                    decision_provider = current_player.decision_provider or self.decision_provider
+                    self.announce(f'\n--> Current player: {current_player.name} (player id: {current_player.id})')
                     while True:
 
                         # Asking show status or continue
-                        show_status_or_continue = vars.handle_question_with_options(f'<---- Show status [0], query next player [1] or continue [empty input] ? ', ['0', '1', '2', ''])
+                        turn_action = decision_provider.choose_turn_action(self, current_player)
 
-                        if show_status_or_continue == '':
+                        if turn_action == 'continue':
                             break
 
-                        elif show_status_or_continue == '1':
+                        elif turn_action == 'next_player':
                             if not self.game_parameters["random_player_orders"]:
-                                next_player = self.players[next_player_id]
-                                print(f"\nNext Player: {next_player.name} (id: {next_player.id})\n")
+                                next_player = self.player_table[seats[idx + 1] if idx < len(seats) - 1 else self.turn_order.first]
+                                self.announce(f"\nNext Player: {next_player.name} (id: {next_player.id})\n")
                             else:
-                                print(f"\nNext Player: ?\n")
+                                self.announce(f"\nNext Player: ?\n")
 
                         else:
                             # Asking show what status
-                            user_show_status_selection = vars.handle_question_with_options(f'<---- Show own status [0], specific player status [1], all players status [2], game status [3]? ', ['0', '1', '2', '3'])
-
-                            if user_show_status_selection == '0':
-                                self.show_player_status(current_player.id)
-
-                            elif user_show_status_selection == '1':
-                                while True:
-                                    specific_user_id = input(f'<---- Input specific player id: [-1 to exit show status] ')
-                                    if specific_user_id in [v for k, v in self.player_orders.items()] or specific_user_id == '-1':
-                                        break
-
-                                if specific_user_id != '-1':
-                                    self.show_player_status(specific_user_id)
-
-                            elif user_show_status_selection == '2':
-                                self.show_all_players_status()
-
-                            elif user_show_status_selection == '3':
-                                self.show_game_status()
+                            self.show_status_view(current_player, decision_provider, decision_provider.choose_status_view(self, current_player))
 
                     if current_player.is_jailed:
-                        dice = current_player.jailbreak(self.game_parameters["jailbreak_price"])
+                        dice = self.leave_jail(current_player)
                         if current_player.money <= 0:
-                            self.retire_player(current_player)
-                            self.check_only_player_is_left()
+                            self.retire_and_check(current_player)
                             continue
                     else:
                         dice = current_player.roll_dice()
 
                     # Normal roll dice or jailbreak successful
                     if dice != [None, None]:
-                        print(f"----> {current_player.name} 's dice: {dice}")
-                        current_player.move(sum(dice))
-
-                        if current_player.location > current_player.gameboard_size:
-                            # Execute Go
-                            self.gameboard.actual_layout['layout'][self.gameboard.go_location]['function'](current_player, self.game_parameters)
-                            current_player.adjust_location()
-
-                        current_location = self.gameboard.actual_layout['layout'][current_player.location]
-
-                        print(f"----> {current_player.name} landed on {current_location['name']} (location: {current_player.location}).")
-                        # Handle on landing on property square
-                        if current_location['is_ownable'] and current_location['name'].lower() != 'go':
-                            if not current_location['ownership'] and current_player.money > current_location['price']:
-                                buy_property_selection = vars.handle_question_with_options(f'<---- {current_location["name"]} is not owned! Do you wanna buy it? [Y / n] ', ['y', 'n', ''])
-
-                                if buy_property_selection == 'y' or buy_property_selection == '':
-                                    current_player.buy_property(current_player.location, current_location['price'])
-                                    self.change_property_ownership(current_player)
-                                    print(f'----> {current_player.name} bought {current_location["name"]}!')
-                            elif current_location['ownership'] and current_location['ownership'] != current_player.id:
-                                print(f"----> {current_location['name']} is owned by {current_location['owner_name']}, ${current_location['rent']} will be charged!")
-                                charged_amount = min([current_player.money, current_location['rent']])
-                                self.players[current_location['ownership']].money += charged_amount
-                                current_player.money -= charged_amount
-                                if current_player.money <= 0:
-                                    self.retire_player(current_player)
-                                    self.check_only_player_is_left()
-                                    continue
-                            elif current_location['ownership'] and current_location['ownership'] == current_player.id:
-                                print(f"----> {current_player.name} Home Sweet Home!")
-
-                        # Handle on landing on jailed square
-                        elif current_location['name'].lower() == 'go to jail':
-                            current_location['function'](current_player, self.gameboard.jail_location)
-
-                        elif current_location['name'].lower() != 'go':
-                            current_location['function'](current_player, self.game_parameters)
-                            if current_player.money <= 0:
-                                self.retire_player(current_player)
-                                self.check_only_player_is_left()
-                                continue
-
-    def play(self):
-
-        save_game = vars.handle_question_with_options('\nDo you want to save the game? [y / N] ? ', ['y', 'n', ''])
-
-        if save_game == 'y':
-            save_file_name = vars.handle_question_with_function('Please enter save name [only alphanumeric characters and underscores, ends with .json]: ', vars.is_valid_save_file_name)
-            self.save_game_state(save_file_name)
-            continue_playing = vars.handle_question_with_options('Continue playing [Y / n] ? ', ['y', 'n', ''])
-
-            if continue_playing == 'n':
-                print('See you in the next game!')
+                        self.move_player(current_player, dice)
+                        self.resolve_square(current_player, decision_provider)
+
+    def show_status_view(self, current_player, decision_provider, status_view):
+        if status_view == 'own':
+            self.show_player_status(current_player.id)
+
+        elif status_view == 'player':
+            specific_user_id = decision_provider.choose_player_id(self, current_player)
+            if specific_user_id is not None:
+                self.show_player_status(specific_user_id)
+
+        elif status_view == 'all':
+            self.show_all_players_status(decision_provider)
+
+        elif status_view == 'game':
+            self.show_game_status(decision_provider)
+
+    def leave_jail(self, player):
+        return player.jailbreak(self.game_parameters["jailbreak_price"])
+
+    def move_player(self, player, dice):
+        gameboard = self.gameboard
+        self.announce(f"----> {player.name} 's dice: {dice}")
+        self.emit('roll', player_id=player.id, first_roll=dice[0], second_roll=dice[1])
+        player.move(sum(dice))
+
+        if player.location > player.gameboard_size:
+            # Execute Go
+            gameboard.square_functions[gameboard.go_location](player, self.game_parameters)
+            player.adjust_location()
+        self.emit('move', player_id=player.id, location=player.location)
+        gameboard.place_player(player)
+
+    def resolve_square(self, player, decision_provider):
+        gameboard = self.gameboard
+        location = player.location
+        square_kind = gameboard.square_kinds[location]
+        square_name = gameboard.square_names[location]
+        self.announce(f"----> {player.name} landed on {square_name} (location: {location}).")
+        # Handle on landing on property square
+        if square_kind == SQUARE_PROPERTY:
+            owner_index = gameboard.square_owners[location]
+            if owner_index == NO_OWNER and player.money > gameboard.square_prices[location]:
+                if decision_provider.buy_property(self, player, location):
+                    player.buy_property(location, gameboard.square_prices[location])
+                    self.change_property_ownership(player)
+                    self.emit('buy', player_id=player.id, location=location, price=gameboard.square_prices[location])
+                    self.announce(f'----> {player.name} bought {square_name}!')
+            elif owner_index != NO_OWNER and owner_index != player.index:
+                owner = self.player_table[owner_index]
+                rent = gameboard.square_rents[location]
+                self.announce(f"----> {square_name} is owned by {owner.name}, ${rent} will be charged!")
+                charged_amount = min([player.money, rent])
+                owner.money += charged_amount
+                player.money -= charged_amount
+                self.emit('rent', player_id=player.id, owner_id=owner.id, amount=charged_amount, location=location)
+                if player.money <= 0:
+                    self.retire_and_check(player)
+            elif owner_index == player.index:
+                self.announce(f"----> {player.name} Home Sweet Home!")
+
+        # Handle on landing on jailed square
+        elif square_kind == SQUARE_GO_TO_JAIL:
+            gameboard.square_functions[location](player, gameboard.jail_location)
+            gameboard.place_player(player)
+
+        elif square_kind == SQUARE_FUNCTION:
+            gameboard.square_functions[location](player, self.game_parameters)
+            if player.money <= 0:
+                self.retire_and_check(player)
+
+    def retire_and_check(self, player):
+        self.retire_player(player)
+        self.check_only_player_is_left()
+
+    def handle_save_request(self):
+        save_file_name = self.decision_provider.save_game(self)
+        if save_file_name is not None:
+            # Saving again to the same file only appends what changed since the last save
+            self.save_game_state(save_file_name, incremental=True)
+
+            if not self.decision_provider.continue_playing(self):
+                self.announce('See you in the next game!')
                 self.game_state["game_over"] = True
 
+    def emit_game_over(self):
+        self.emit('game_over')
+        for winner_id in self.winners:
+            self.emit('winner', player_id=winner_id)
+
+    def play(self, autosave_every=0, autosave_file_name=None):
+
+        autosave_writer = None
+        if autosave_every > 0:
+            autosave_writer = AutosaveWriter(autosave_file_name or f'autosave_{self.game_state["game_id"]}.json')
+
+        try:
+            self.play_rounds(autosave_writer, autosave_every)
+        finally:
+            if autosave_writer is not None:
+                autosave_writer.close()
+                self.report_autosave_error(autosave_writer)
+
+        if self.reports_profile:
+            self.emit('profile', profile=self.profiler.to_dict())
+            self.announce(self.profiler.format_report())
+
+    def report_autosave_error(self, autosave_writer):
+        error = autosave_writer.take_error()
+        if error is not None:
+            self.announce(f'Autosave to {autosave_writer.save_path} failed: {error}')
+
+    def play_rounds(self, autosave_writer=None, autosave_every=0):
+
+        if self.event_sink is not None:
+            self.emit('snapshot', save_state=copy.deepcopy(self.build_save_state()), gameboard_design=self.gameboard.design)
+
+        self.handle_save_request()
+
         while True and not self.game_state["game_over"]:
             self.play_one_round()
             self.game_state["current_round"] += 1
 
-            save_game = vars.handle_question_with_options('\nDo you want to save the game? [y / N] ? ',['y', 'n', ''])
-            if save_game == 'y':
-                save_file_name = vars.handle_question_with_function('Please enter save name [only alphanumeric characters and underscores, ends with .json]: ', vars.is_valid_save_file_name)
-                self.save_game_state(save_file_name)
-                continue_playing = vars.handle_question_with_options('Continue playing [Y / n] ? ', ['y', 'n', ''])
+            if autosave_writer is not None and (self.game_state["current_round"] - 1) % autosave_every == 0:
+                self.report_autosave_error(autosave_writer)
+                autosave_writer.submit(self.build_save_state())
 
-                if continue_playing == 'n':
-                    print('See you in the next game!')
-                    self.game_state["game_over"] = True
+            self.handle_save_request()
 
             if self.game_state["current_round"] > self.game_parameters["maximum_rounds"] and not self.game_state["game_over"]:
                 player_records = {player.name: player.money for player_id, player in self.players.items()}
-                winners = [[name, amount] for name, amount in player_records.items() if amount == max(list(player_records.values()))]
-                print(f'\nGame over after {self.game_parameters["maximum_rounds"]} rounds!')
+                maximum_money = max(player_records.values())
+                winners = [[name, amount] for name, amount in player_records.items() if amount == maximum_money]
+                self.winners = [player_id for player_id, player in self.players.items() if player.money == maximum_money]
+                self.game_state["game_over"] = True
+                self.emit_game_over()
+                self.announce(f'\nGame over after {self.game_parameters["maximum_rounds"]} rounds!')
                 if len(winners) == 1:
-                    print(f'Winner: {winners[0][0]}, Money: {winners[0][1]}')
+                    self.announce(f'Winner: {winners[0][0]}, Money: {winners[0][1]}')
                 else:
                     for idx, winner in enumerate(winners):
-                        print(f'Winner {idx+1}: {winner[0]}, Money: {winner[1]}')
+                        self.announce(f'Winner {idx+1}: {winner[0]}, Money: {winner[1]}')
                 break
 
     def check_only_player_is_left(self):
+        # The turn order counts the playing seats, so the players are only scanned once at most one is left
+        if len(self.turn_order) > 1:
+            return
         winners = [[player.name, player.money] for player_id, player in self.players.items() if not player.is_retired]
         if len(winners) == 1:
             self.game_state["game_over"] = True
-            print('\nGame over when only one player is left!')
-            print(f'Winner: {winners[0][0]}, Money: {winners[0][1]}')
+            self.winners = [player_id for player_id, player in self.players.items() if not player.is_retired]
+            self.emit_game_over()
+            self.announce('\nGame over when only one player is left!')
+            self.announce(f'Winner: {winners[0][0]}, Money: {winners[0][1]}')
+
+
+def discard_event(event, payload):
+    # Event sink for games whose output nobody reads
+    pass
+
+
+def run_headless_game(gameboard_design, player_names, game_parameters=None, decision_provider=None, event_sink=None, design_file_name=None, seed=None, decision_providers=None, profiler=None):
+    # Plays a whole game without prompting; every decision comes from the decision provider
+    gameboard = Gameboard()
+    gameboard.load_design(gameboard_design)
+    gameboard.design_file_name = design_file_name
+
+    game = Game(decision_provider or AutomaticDecisionProvider(), event_sink, seed, profiler)
+    game.setup_game(gameboard, player_names, game_parameters, decision_providers)
+    game.play()
+    return game
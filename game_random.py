@@ -0,0 +1,62 @@
+import random
+import secrets
+
+
+DEFAULT_DICE_BLOCK_SIZE = 1024
+FIRST_DICE_BLOCK_SIZE = 16  # Blocks double up to dice_block_size, so a short stream does not draw a full block
+
+
+class GameRandom:
+    # Random streams owned by a single game. Dice, chance cards and player orders draw from
+    # separate sub-streams derived from one seed, so changing one rule does not shift the others.
+
+    def __init__(self, seed=None, stream_key='', dice_block_size=DEFAULT_DICE_BLOCK_SIZE):
+        if seed is None:
+            seed = secrets.randbits(63)
+        self.seed = seed
+        self.dice_block_size = dice_block_size
+        self.select_stream(stream_key)
+
+    def select_stream(self, stream_key):
+        # Restarts every sub-stream under a new key and drops the unused dice
+        self.stream_key = stream_key
+        self.dice = random.Random(self.stream_seed('dice'))
+        self.chance = random.Random(self.stream_seed('chance'))
+        self.order = random.Random(self.stream_seed('order'))
+        self.dice_generator = None
+        self.dice_block = []
+        self.next_dice_block_size = min(FIRST_DICE_BLOCK_SIZE, self.dice_block_size)
+
+    def stream_seed(self, stream_name):
+        # String seeds are hashed with SHA-512 by random.Random, so they are stable across processes
+        return f'{self.seed}:{self.stream_key}:{stream_name}'
+
+    def refill_dice(self):
+        block_size = self.next_dice_block_size
+        self.next_dice_block_size = min(2 * block_size, self.dice_block_size)
+        try:
+            import numpy as np
+        except ImportError:
+            self.dice_block = [[self.dice.randint(1, 4), self.dice.randint(1, 4)] for _ in range(block_size)]
+            return
+
+        if self.dice_generator is None:
+            self.dice_generator = np.random.default_rng(self.dice.getrandbits(64))
+        self.dice_block = self.dice_generator.integers(1, 5, size=(block_size, 2)).tolist()
+
+    def roll_dice(self):
+        if not self.dice_block:
+            self.refill_dice()
+        return self.dice_block.pop()
+
+    def chance_is_gain(self):
+        return self.chance.random() < 0.5
+
+    def chance_amount(self, maximum):
+        return self.chance.randrange(maximum)
+
+    def shuffle_orders(self, player_orders_keys):
+        self.order.shuffle(player_orders_keys)
+
+
+DEFAULT_GAME_RANDOM = GameRandom()
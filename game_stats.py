@@ -0,0 +1,191 @@
+import math
+import vars
+
+
+class RunningStats:
+    # Welford's online mean and variance. merge uses the parallel form (Chan et al.),
+    # so partial results can be combined in any grouping.
+    __slots__ = ('count', 'mean', 'm2', 'minimum', 'maximum')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = None
+        self.maximum = None
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+    def merge(self, other):
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2, self.minimum, self.maximum = other.count, other.mean, other.m2, other.minimum, other.maximum
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        return self
+
+    @property
+    def variance(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def to_dict(self):
+        return {'count': self.count, 'mean': self.mean, 'standard_deviation': math.sqrt(self.variance), 'minimum': self.minimum, 'maximum': self.maximum}
+
+
+class FixedHistogram:
+    # Equal-width bins over [minimum, maximum); values outside go to underflow / overflow
+    __slots__ = ('minimum', 'maximum', 'bin_width', 'counts', 'underflow', 'overflow')
+
+    def __init__(self, minimum, maximum, number_of_bins):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.bin_width = (maximum - minimum) / number_of_bins
+        self.counts = [0] * number_of_bins
+        self.underflow = 0
+        self.overflow = 0
+
+    def add(self, value):
+        if value < self.minimum:
+            self.underflow += 1
+        elif value >= self.maximum:
+            self.overflow += 1
+        else:
+            self.counts[int((value - self.minimum) / self.bin_width)] += 1
+
+    def merge(self, other):
+        if (other.minimum, other.maximum, len(other.counts)) != (self.minimum, self.maximum, len(self.counts)):
+            raise ValueError('Only histograms with the same bins can be merged')
+        self.counts = [count + other_count for count, other_count in zip(self.counts, other.counts)]
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        return self
+
+    def to_dict(self):
+        return {'minimum': self.minimum, 'maximum': self.maximum, 'bin_width': self.bin_width, 'counts': list(self.counts), 'underflow': self.underflow, 'overflow': self.overflow}
+
+
+def add_counts(counts, other_counts):
+    # Element-wise sum of two count lists of possibly different lengths
+    if len(counts) < len(other_counts):
+        counts.extend([0] * (len(other_counts) - len(counts)))
+    for i, count in enumerate(other_counts):
+        counts[i] += count
+    return counts
+
+
+class GameStatsAggregator:
+    # Event sink that folds the events of any number of games into fixed-size statistics.
+    # Memory depends on the board size, number of seats and histogram bins, not on the number of games.
+    # A game starts with its 'snapshot' event, which gives the seat order and the board size.
+
+    def __init__(self, maximum_rounds=vars.DEFAULT_MAXIMUM_ROUNDS, round_bins=None):
+        round_bins = round_bins or maximum_rounds
+        self.games = 0
+        self.landings = [0]  # Indexed by location; a Go To Jail landing counts there, not on the jail
+        self.jail_sends = 0  # Players sent to jail by a Go To Jail square
+        self.rent_income = {}  # location: total rent collected
+        self.rent_payments = {}  # location: number of rent payments
+        self.winner_seats = []  # Indexed by seat; a shared win counts for every winner
+        self.bankrupt_seats = []
+        self.game_length = RunningStats()
+        self.game_length_histogram = FixedHistogram(1, maximum_rounds + 1, round_bins)
+        self.bankruptcy_round = RunningStats()
+        self.bankruptcy_round_histogram = FixedHistogram(1, maximum_rounds + 1, round_bins)
+        self.function_amounts = {}  # 'pass_go' / 'tax' / 'chance' / 'jailbreak': RunningStats of the amounts
+        # Per-game state, reset by every snapshot
+        self.seats = {}
+        self.current_round = 0
+
+    def __call__(self, event, payload):
+        if event == 'move':
+            location = payload['location']
+            landings = self.landings
+            if location >= len(landings):
+                landings.extend([0] * (location + 1 - len(landings)))
+            landings[location] += 1
+        elif event == 'jail':
+            self.jail_sends += 1
+        elif event == 'round':
+            self.current_round = payload['round']
+        elif event == 'rent':
+            location = payload['location']
+            self.rent_income[location] = self.rent_income.get(location, 0) + payload['amount']
+            self.rent_payments[location] = self.rent_payments.get(location, 0) + 1
+        elif event in ('pass_go', 'tax', 'chance', 'jailbreak'):
+            amount = payload['paid'] if event == 'jailbreak' else payload['amount']
+            if event != 'jailbreak' or amount:
+                self.function_amounts.setdefault(event, RunningStats()).add(amount)
+        elif event == 'retire':
+            self.bankruptcy_round.add(self.current_round)
+            self.bankruptcy_round_histogram.add(self.current_round)
+            self.count_seat(self.bankrupt_seats, payload['player_id'])
+        elif event == 'winner':
+            self.count_seat(self.winner_seats, payload['player_id'])
+        elif event == 'game_over':
+            self.games += 1
+            self.game_length.add(self.current_round)
+            self.game_length_histogram.add(self.current_round)
+        elif event == 'snapshot':
+            save_state = payload['save_state']
+            self.seats = {player_id: seat for seat, player_id in enumerate(save_state['players'])}
+            self.current_round = save_state['game_state']['current_round']
+            size = payload['gameboard_design']['size']
+            if size >= len(self.landings):
+                self.landings.extend([0] * (size + 1 - len(self.landings)))
+
+    def count_seat(self, seat_counts, player_id):
+        seat = self.seats.get(player_id)
+        if seat is None:
+            return
+        if seat >= len(seat_counts):
+            seat_counts.extend([0] * (seat + 1 - len(seat_counts)))
+        seat_counts[seat] += 1
+
+    def merge(self, other):
+        self.games += other.games
+        add_counts(self.landings, other.landings)
+        self.jail_sends += other.jail_sends
+        for location, amount in other.rent_income.items():
+            self.rent_income[location] = self.rent_income.get(location, 0) + amount
+        for location, count in other.rent_payments.items():
+            self.rent_payments[location] = self.rent_payments.get(location, 0) + count
+        add_counts(self.winner_seats, other.winner_seats)
+        add_counts(self.bankrupt_seats, other.bankrupt_seats)
+        self.game_length.merge(other.game_length)
+        self.game_length_histogram.merge(other.game_length_histogram)
+        self.bankruptcy_round.merge(other.bankruptcy_round)
+        self.bankruptcy_round_histogram.merge(other.bankruptcy_round_histogram)
+        for event, stats in other.function_amounts.items():
+            self.function_amounts.setdefault(event, RunningStats()).merge(stats)
+        return self
+
+    def to_dict(self):
+        games = max(1, self.games)
+        return {
+            'games': self.games,
+            'landings': {location: count for location, count in enumerate(self.landings) if count},
+            'jail_sends': self.jail_sends,
+            'rent_income': {location: {'total': self.rent_income[location], 'payments': self.rent_payments[location]} for location in sorted(self.rent_income)},
+            'game_length': self.game_length.to_dict(),
+            'game_length_histogram': self.game_length_histogram.to_dict(),
+            'bankruptcy_round': self.bankruptcy_round.to_dict(),
+            'bankruptcy_round_histogram': self.bankruptcy_round_histogram.to_dict(),
+            'win_rate_per_seat': [count / games for count in self.winner_seats],
+            'bankruptcy_rate_per_seat': [count / games for count in self.bankrupt_seats],
+            'function_amounts': {event: stats.to_dict() for event, stats in sorted(self.function_amounts.items())},
+        }
@@ -1,74 +1,39 @@
 import json
-import pandas as pd
+from array import array
 import vars
+from table import format_table
 from functions import available_functions
+from design_validation import DesignValidator, validate_design
+from design_cache import load_design_file
 
 
 def check_design(design):
+    # Prints one line per failed rule, as before; validate_design has the full report
+    return print_design_report(validate_design(design))
 
-    count = 0
-    if design["enforce_square_design"]:
-        if design["size"] % 4 != 0:
-            print("Error: Board size must be multiple of 4 to enforce square gameboard design!")
-            count += 1
-
-    # Check if design size is bigger than the board size
-    all_locations_indice = [i['location'] for i in design['properties']] + [i['location'] for i in design['functions']]
-    for i in range(1, design["size"]+1):
-        if i not in all_locations_indice:
-            print("Error: There exist empty loactions or location index / size mismatch!")
-            count += 1
-            break
-
-    # Check if design size is bigger than the board size
-    if int(design['size']) != len(design['properties']) + len(design['functions']):
-        print("Error: Board Size must be equal to sum of properties and functions!")
-        count += 1
-
-    # Check if any field is empty
-    break_all_loops = False
-    for item in ['properties', 'functions']:
-        for row in design[item]:
-            for k, v in row.items():
-                if k == '' or v == '':
-                    print("Error: There exist empty field in gameboard design.")
-                    count += 1
-                    break_all_loops = True
-                    break
-            if break_all_loops:
-                break
-        if break_all_loops:
-            break
-
-    # Check if locations are unique:
-    locations = [row['location'] for row in design['properties']]
-    if len(locations) - len(set(locations)) > 0:
-        print("Error: Duplicate locations detected.")
-        count += 1
-
-    # Check if Properties location are unique:
-    properties_names = [row['name'] for row in design['properties']]
-    if len(properties_names) - len(set(properties_names)) > 0:
-        print("Error: Duplicate property name detected.")
-        count += 1
-
-    # Check if Just Visiting / In Jail exist if Go To Jail Exist
-    functions_names = [row['name'] for row in design['functions']]
-    if "Go To Jail" in functions_names and not "Just Visiting / In Jail" in functions_names:
-        print("Error: Just Visiting / In Jail needs to exist if Go To Jail exists")
-        count += 1
-
-    if "Go" not in functions_names:
-        print("Error: Go does not exist.")
-        count += 1
-
-    if count == 0:
+
+def print_design_report(report):
+    printed_messages = set()
+    for error in report['errors']:
+        if error['message'] not in printed_messages:
+            print(error['message'])
+            printed_messages.add(error['message'])
+
+    if report['is_valid']:
         print("Design is valid!")
         return True
 
     return False
 
 
+SQUARE_NONE = 0  # Go, or a square with nothing to resolve
+SQUARE_PROPERTY = 1
+SQUARE_FUNCTION = 2
+SQUARE_GO_TO_JAIL = 3
+
+NO_OWNER = -1
+
+
 class Gameboard:
 
     def __init__(self):
@@ -79,59 +44,39 @@ class Gameboard:
         self.jail_location = None
         self.design_file_name = None
         self.square_size = None
+        self.design = None
+
+        # Compiled layout, indexed by location (index 0 is unused)
+        self.square_names = []
+        self.square_kinds = array('b')
+        self.square_prices = array('q')
+        self.square_rents = array('q')
+        self.square_is_ownable = array('b')
+        self.square_owners = array('i')
+        self.square_functions = []
+        # Player indices standing on each square, and where each indexed player was last placed
+        self.square_occupants = []
+        self.occupant_locations = {}
 
     def load_default_gameboard(self):
 
         default_design_path = vars.DEFAULT_GAMEBOARD_DESIGN_PATH
-        default_design = {}
+        default_design = None
         if default_design_path.is_file():
             try:
-                default_design = json.load(open(default_design_path, "r"))
+                default_design, report = load_design_file(default_design_path)
                 self.design_file_name = default_design_path.name
             except:
-                default_design = {}
+                default_design = None
 
-        if not check_design(default_design):
+        if default_design is None or not print_design_report(report):
             self.actual_layout = {} 
             return
 
-        # self.__design = default_design
-
-        layout = {}
-        for row in default_design['properties']:
-            layout.update({
-                int(row['location']): {
-                    "name": row['name'],
-                    "price": row['price'],
-                    "rent": row['rent'],
-                    "is_ownable": row['is_ownable'],
-                    "ownership": None,
-                    "owner_name": ''
-                }
-            })
-        for row in default_design['functions']:
-
-            if row['name'].lower() == 'go':
-                self.go_location = int(row['location'])
-            elif row['name'].lower() == 'just visiting / in jail':
-                self.jail_location = int(row['location'])
-
-            try:
-                layout.update({
-                    int(row['location']): {
-                        "name": row['name'],
-                        "function": available_functions[row['name']],
-                        "is_ownable": row['is_ownable']
-                    }
-                })
-            except KeyError:
-                print('Function is not defined :', row['name'])
-        self.actual_layout = {
-            'size': default_design['size'],
-            "layout": layout
-        }
+        self.load_design(default_design)
 
     def load_design(self, design):
+        self.design = design
         layout = {}
         for row in design['properties']:
             layout.update({
@@ -165,6 +110,59 @@ class Gameboard:
             'size': design['size'],
             "layout": layout
         }
+        self.compile_layout()
+
+    def compile_layout(self):
+        # Flattens actual_layout into parallel arrays for the game loop; actual_layout stays as the display view
+        table_size = max([int(self.actual_layout['size'])] + list(self.actual_layout['layout'].keys())) + 1
+        self.square_names = [''] * table_size
+        self.square_kinds = array('b', [SQUARE_NONE]) * table_size
+        self.square_prices = array('q', [0]) * table_size
+        self.square_rents = array('q', [0]) * table_size
+        self.square_is_ownable = array('b', [False]) * table_size
+        self.square_owners = array('i', [NO_OWNER]) * table_size
+        self.square_functions = [None] * table_size
+        self.square_occupants = [set() for _ in range(table_size)]
+        self.occupant_locations = {}
+
+        for location, square in self.actual_layout['layout'].items():
+            name = square['name'].lower()
+            self.square_names[location] = square['name']
+            self.square_is_ownable[location] = bool(square['is_ownable'])
+            if 'price' in square:
+                self.square_prices[location] = square['price']
+                self.square_rents[location] = square['rent']
+            if square['is_ownable'] and name != 'go':
+                self.square_kinds[location] = SQUARE_PROPERTY
+            elif 'function' in square:
+                self.square_functions[location] = square['function']
+                if name == 'go to jail':
+                    self.square_kinds[location] = SQUARE_GO_TO_JAIL
+                elif name != 'go':
+                    self.square_kinds[location] = SQUARE_FUNCTION
+
+    def set_owner(self, location, player):
+        # The compiled table holds the player's index, the display view holds the id and name
+        self.square_owners[location] = player.index
+        self.actual_layout['layout'][location]['ownership'] = player.id
+        self.actual_layout['layout'][location]['owner_name'] = player.name
+
+    def clear_owner(self, location):
+        self.square_owners[location] = NO_OWNER
+        self.actual_layout['layout'][location]['ownership'] = None
+        self.actual_layout['layout'][location]['owner_name'] = ''
+
+    def place_player(self, player):
+        previous_location = self.occupant_locations.get(player.index)
+        if previous_location is not None:
+            self.square_occupants[previous_location].discard(player.index)
+        self.square_occupants[player.location].add(player.index)
+        self.occupant_locations[player.index] = player.location
+
+    def remove_player(self, player):
+        previous_location = self.occupant_locations.pop(player.index, None)
+        if previous_location is not None:
+            self.square_occupants[previous_location].discard(player.index)
 
     @staticmethod
     def square_checker(square, square_type='property'):
@@ -245,18 +243,19 @@ class Gameboard:
         }
         '''
 
-        while True:
-            cell_type = vars.handle_question_with_options("Edit a property [0], Edit a function [1], change gameboard size [2], view current design [3], check design for validity [4], discard design [5] and save & exit [empty]: ", ['0', '1', '2', '3', '4', '5', ''])
+        # Built once and kept in step with new_design, so every lookup while editing is O(1)
+        properties_dict = {row['location']: row for row in new_design['properties']}
+        functions_dict = {row['location']: row for row in new_design['functions']}
+        validator = DesignValidator(new_design)
 
-            properties_dict = {row['location']: row for row in new_design['properties']}
-            available_property_locations_for_update = list(properties_dict.keys())
-            available_property_locations_for_update.sort()
+        def is_available_for_insert(location):
+            return 1 <= location <= new_design['size'] and location not in properties_dict and location not in functions_dict
 
-            functions_dict = {row['location']: row for row in new_design['functions']}
-            available_function_locations_for_update = list(functions_dict.keys())
-            available_function_locations_for_update.sort()
+        def available_locations_for_insert():
+            return [i for i in range(1, new_design['size']+1) if i not in properties_dict and i not in functions_dict]
 
-            available_locations_for_insert = [i for i in range(1, new_design['size']+1) if i not in available_property_locations_for_update and i not in available_function_locations_for_update]
+        while True:
+            cell_type = vars.handle_question_with_options("Edit a property [0], Edit a function [1], change gameboard size [2], view current design [3], check design for validity [4], discard design [5] and save & exit [empty]: ", ['0', '1', '2', '3', '4', '5', ''])
 
             if cell_type == '':
                 json.dump(new_design, open(save_file_path, 'w'), indent=4)
@@ -265,9 +264,9 @@ class Gameboard:
             elif cell_type == '0':
                 property_selection = vars.handle_question_with_options("Insert a property [0], Update a property [1] , Delete a property [2] or up a level [empty]: ", ['0', '1', '2', ''])
                 if property_selection == '0':
-                    print(f'Available locations: {available_locations_for_insert}')
+                    print(f'Available locations: {available_locations_for_insert()}')
                     location = int(vars.handle_question_with_function('Enter the location of the property: ', vars.is_valid_type, [int]))
-                    if location in available_locations_for_insert:
+                    if is_available_for_insert(location):
                         name = vars.handle_question_with_function('Enter the name of the property: ', vars.is_valid_type, [str])
                         price = int(vars.handle_question_with_function('Enter the price of the property: ', vars.is_valid_type, [int]))
                         rent = int(vars.handle_question_with_function('Enter the rent of the property: ', vars.is_valid_type, [int]))
@@ -282,15 +281,16 @@ class Gameboard:
                             "is_ownable": is_ownable
                         }
                         properties_dict.update({location: new_property_square})
+                        validator.add_square('properties', new_property_square)
                         properties = [v for k, v in properties_dict.items()]
                         new_design['properties'] = properties
                     else:
                         print(f'Can not insert to an existing property / function!')
 
                 elif property_selection == '1':
-                    print(f'Available locations: {available_property_locations_for_update}')
+                    print(f'Available locations: {sorted(properties_dict)}')
                     location_selection = int(vars.handle_question_with_function('Enter the location to update: ', vars.is_valid_type, [int]))
-                    if location_selection in available_property_locations_for_update:
+                    if location_selection in properties_dict:
                         original_location = properties_dict[location_selection]['location']
                         original_name = properties_dict[location_selection]['name']
                         original_price = properties_dict[location_selection]['price']
@@ -311,11 +311,15 @@ class Gameboard:
                             "role": 'property',
                             "is_ownable": original_is_ownable if is_ownable == '' else is_ownable
                         }
+                        validator.remove_square('properties', properties_dict[original_location])
                         if location == '':
                             properties_dict.update({original_location: existing_property_square})
                         else:
-                            properties_dict.update({location: existing_property_square})
                             del properties_dict[original_location]
+                            if int(location) in properties_dict:
+                                validator.remove_square('properties', properties_dict[int(location)])
+                            properties_dict.update({int(location): existing_property_square})
+                        validator.add_square('properties', existing_property_square)
 
                         properties = [v for k, v in properties_dict.items()]
                         new_design['properties'] = properties
@@ -323,9 +327,10 @@ class Gameboard:
                         print(f'Can not update non existing property!')
 
                 elif property_selection == '2':
-                    print(f'Available locations: {available_property_locations_for_update}')
+                    print(f'Available locations: {sorted(properties_dict)}')
                     location_selection = int(vars.handle_question_with_function('Enter the location to delete: ', vars.is_valid_type, [int]))
-                    if location_selection in available_property_locations_for_update:
+                    if location_selection in properties_dict:
+                        validator.remove_square('properties', properties_dict[location_selection])
                         del properties_dict[location_selection]
                         properties = [v for k, v in properties_dict.items()]
                         new_design['properties'] = properties
@@ -336,9 +341,9 @@ class Gameboard:
                 function_selection = vars.handle_question_with_options("Insert a function [0], Delete a function [1] or up a level [empty]: ", ['0', '1', ''])
 
                 if function_selection == '0':
-                    print(f'Available locations: {available_locations_for_insert}')
+                    print(f'Available locations: {available_locations_for_insert()}')
                     location = int(vars.handle_question_with_function('Enter the location of the function: ', vars.is_valid_type, [int]))
-                    if location in available_locations_for_insert:
+                    if is_available_for_insert(location):
                         name = vars.handle_question_with_options('Enter the name of the function: ',  [i for i in available_functions.keys()], True)
                         role = "function"
                         is_ownable = False
@@ -348,14 +353,17 @@ class Gameboard:
                             "role": role,
                             "is_ownable": is_ownable
                         }
+                        functions_dict.update({location: new_function_square})
+                        validator.add_square('functions', new_function_square)
                         new_design['functions'].append(new_function_square)
                     else:
                         print(f'Can not insert to an existing property / function!')
 
                 elif function_selection == '1':
-                    print(f'Available locations: {available_function_locations_for_update}')
+                    print(f'Available locations: {sorted(functions_dict)}')
                     location_selection = int(vars.handle_question_with_function('Enter the location to delete: ', vars.is_valid_type, [int]))
-                    if location_selection in available_function_locations_for_update:
+                    if location_selection in functions_dict:
+                        validator.remove_square('functions', functions_dict[location_selection])
                         del functions_dict[location_selection]
                         functions = [v for k, v in functions_dict.items()]
                         new_design['functions'] = functions
@@ -365,6 +373,7 @@ class Gameboard:
             elif cell_type == '2':
                 gameboard_size = int(vars.handle_question_with_function("Update the size of the gameboard design: ", vars.is_valid_type, [int]))
                 new_design['size'] = gameboard_size
+                validator.set_size(gameboard_size)
 
             elif cell_type == '3':
                 squares = []
@@ -389,17 +398,19 @@ class Gameboard:
                     squares.append(square)
 
                 squares = sorted(squares, key=lambda x: x['Location'])
-                gameboard_df = pd.DataFrame(squares)
-                pd.set_option('display.max_rows', None)  # Show all rows
-                pd.set_option('display.max_columns', None)  # Show all columns
-                pd.set_option('display.max_colwidth', None)  # Show full column content
-                if len(gameboard_df) > 0:
-                    print(f'\nGameboard Size: {new_design["size"]}\nGameboard Status: \n', gameboard_df.to_string(index=False), '\n')
+                if len(squares) > 0:
+                    print(f'\nGameboard Size: {new_design["size"]}\nGameboard Status: \n', format_table(squares), '\n')
                 else:
                     print('\nGameboard Size: 0\nGameboard Status: \n', 'Empty', '\n')
 
             elif cell_type == '4':
-                check_design(new_design)
+                # Only the squares edited since the last check are re-validated
+                report = validator.report()
+                if report['is_valid']:
+                    print("Design is valid!")
+                else:
+                    errors = [{'Rule': error['rule'], 'Location': error['location'] if error['location'] is not None else '-', 'Message': error['message']} for error in report['errors']]
+                    print('\nDesign Errors: \n', format_table(errors), '\n')
 
             elif cell_type == '5':
                 print("Discard current design!")
@@ -0,0 +1,147 @@
+import argparse
+import numpy as np
+import vars
+from design_cache import load_design_file
+
+
+DICE_FACES = 4
+
+
+def dice_outcomes():
+    # (sum, probability, is_double) for the two dice rolled by Player.roll_dice
+    outcomes = {}
+    for first_roll in range(1, DICE_FACES + 1):
+        for second_roll in range(1, DICE_FACES + 1):
+            key = (first_roll + second_roll, first_roll == second_roll)
+            outcomes[key] = outcomes.get(key, 0) + 1 / DICE_FACES ** 2
+    return [(steps, probability, is_double) for (steps, is_double), probability in outcomes.items()]
+
+
+def move_location(location, steps, gameboard_size):
+    # Same arithmetic as Player.move followed by Player.adjust_location
+    location += steps
+    if location >= (gameboard_size + 1):
+        location = location % (gameboard_size + 1) + 1
+    return location
+
+
+class LandingChain:
+    # Markov chain over one player's turns. States 0..size-1 are "standing on location state+1",
+    # the last three states are the 1st, 2nd and 3rd round in jail.
+
+    def __init__(self, gameboard_design, pay_jailbreak=True):
+        self.gameboard_size = int(gameboard_design['size'])
+        self.squares = {}
+        for row in gameboard_design['properties'] + gameboard_design['functions']:
+            self.squares[int(row['location'])] = row
+        self.go_to_jail_locations = {int(row['location']) for row in gameboard_design['functions'] if row['name'] == 'Go To Jail'}
+        self.jail_location = None
+        for row in gameboard_design['functions']:
+            if row['name'] == 'Just Visiting / In Jail':
+                self.jail_location = int(row['location'])
+        self.pay_jailbreak = pay_jailbreak
+
+        self.number_of_states = self.gameboard_size + (3 if self.jail_location is not None else 0)
+        self.jail_states = {3: self.gameboard_size, 2: self.gameboard_size + 1, 1: self.gameboard_size + 2}
+        self.build()
+
+    def landing_state(self, location):
+        if location in self.go_to_jail_locations and self.jail_location is not None:
+            return self.jail_states[3]
+        return location - 1
+
+    def build(self):
+        # Sparse COO triplets for the state transitions and for the square landed on during the turn
+        transition_rows, transition_columns, transition_values = [], [], []
+        landing_rows, landing_columns, landing_values = [], [], []
+
+        def add_move(state, from_location, steps, probability):
+            location = move_location(from_location, steps, self.gameboard_size)
+            transition_rows.append(state)
+            transition_columns.append(self.landing_state(location))
+            transition_values.append(probability)
+            landing_rows.append(state)
+            landing_columns.append(location - 1)
+            landing_values.append(probability)
+
+        def add_stay(state, next_state, probability):
+            transition_rows.append(state)
+            transition_columns.append(next_state)
+            transition_values.append(probability)
+
+        outcomes = dice_outcomes()
+        for location in range(1, self.gameboard_size + 1):
+            for steps, probability, is_double in outcomes:
+                add_move(location - 1, location, steps, probability)
+
+        if self.jail_location is not None:
+            for steps, probability, is_double in outcomes:
+                # 1st round: pay and roll, or roll for a double
+                if self.pay_jailbreak or is_double:
+                    add_move(self.jail_states[3], self.jail_location, steps, probability)
+                else:
+                    add_stay(self.jail_states[3], self.jail_states[2], probability)
+                # 2nd round: only a double gets the player out
+                if is_double:
+                    add_move(self.jail_states[2], self.jail_location, steps, probability)
+                else:
+                    add_stay(self.jail_states[2], self.jail_states[1], probability)
+                # 3rd round: the player leaves either by a double or by paying the fine
+                add_move(self.jail_states[1], self.jail_location, steps, probability)
+
+        self.transition_rows = np.array(transition_rows, dtype=np.int64)
+        self.transition_columns = np.array(transition_columns, dtype=np.int64)
+        self.transition_values = np.array(transition_values, dtype=np.float64)
+        self.landing_rows = np.array(landing_rows, dtype=np.int64)
+        self.landing_columns = np.array(landing_columns, dtype=np.int64)
+        self.landing_values = np.array(landing_values, dtype=np.float64)
+
+    def step(self, distribution):
+        # Sparse vector-matrix product: distribution @ transition matrix
+        return np.bincount(self.transition_columns, weights=distribution[self.transition_rows] * self.transition_values, minlength=self.number_of_states)
+
+    def stationary_distribution(self, tolerance=1e-12, maximum_iterations=100000):
+        distribution = np.full(self.number_of_states, 1 / self.number_of_states)
+        for _ in range(maximum_iterations):
+            # Lazy chain (average with the identity) has the same stationary distribution and never oscillates
+            next_distribution = 0.5 * (distribution + self.step(distribution))
+            if np.abs(next_distribution - distribution).sum() < tolerance:
+                return next_distribution
+            distribution = next_distribution
+        return distribution
+
+    def landing_probabilities(self, tolerance=1e-12, maximum_iterations=100000):
+        distribution = self.stationary_distribution(tolerance, maximum_iterations)
+        landing = np.bincount(self.landing_columns, weights=distribution[self.landing_rows] * self.landing_values, minlength=self.gameboard_size)
+        return {location: float(landing[location - 1]) for location in range(1, self.gameboard_size + 1)}
+
+
+def solve_landing_probabilities(gameboard_design, pay_jailbreak=True, tolerance=1e-12, maximum_iterations=100000):
+    chain = LandingChain(gameboard_design, pay_jailbreak)
+    landing = chain.landing_probabilities(tolerance, maximum_iterations)
+    squares = {}
+    for location, probability in landing.items():
+        row = chain.squares.get(location, {})
+        is_property = row.get('is_ownable', False) and 'rent' in row
+        squares[location] = {
+            "name": row.get('name', ''),
+            "landing_probability": probability,
+            "expected_rent_per_roll": probability * row['rent'] if is_property else 0.0,
+        }
+    return squares
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Landing probability and expected rent per roll of a gameboard design.')
+    parser.add_argument('design_file_name', nargs='?', default='default_gameboard.json')
+    parser.add_argument('--roll-for-jailbreak', action='store_true', help='Roll for a double in the 1st jail round instead of paying.')
+    args = parser.parse_args(argv)
+
+    gameboard_design, _ = load_design_file(vars.BASE_GAMEBOARD_DESIGN_DIR / args.design_file_name)
+    squares = solve_landing_probabilities(gameboard_design, not args.roll_for_jailbreak)
+    for location, square in squares.items():
+        print(f'{location:>5}  {square["name"]:<30} {square["landing_probability"]:.6f}  {square["expected_rent_per_roll"]:.4f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -8,15 +8,17 @@ def play_monopoly_game():
     game_or_design_board = vars.handle_question_with_options('Start Game [0] or Design Gameboard [1] ? ', ['0', '1'])
     if game_or_design_board == '0':
         game = Game()
-        load_game = vars.handle_question_with_options('New Game [0] or Load Save File [1] ? ',  ['0', '1'])
+        load_game = vars.handle_question_with_options('New Game [0], Load Save File [1] or Large Lobby Game [2] ? ',  ['0', '1', '2'])
         if load_game == '0':
             game_initialized = game.new_game()
+        elif load_game == '2':
+            game_initialized = game.new_game(large_lobby=True)
         else:
-            save_file_name = vars.handle_question_with_function('Enter save file name: ', vars.is_valid_save_file_name)
+            save_file_name = vars.handle_question_with_function('Enter save file name: ', vars.is_valid_save_state_file_name)
             game_initialized = game.load_game_state(save_file_name)
 
         if game_initialized:
-            game.play()
+            game.play(autosave_every=vars.AUTOSAVE_EVERY_ROUNDS)
 
     else:
         gameboard = Gameboard()
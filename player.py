@@ -1,12 +1,18 @@
 from random import randint
 import vars
+from decision import DEFAULT_DECISION_PROVIDER
 
 
 class Player:
+    __slots__ = (
+        'name', 'id', 'index', 'location', 'money', 'owned_properties', 'is_jailed', 'jailed_rounds_count_down',
+        'is_retired', 'gameboard_size', 'game_id', 'decision_provider', 'event_sink', 'rng',
+    )
 
     def __init__(self, name, gameboard_size, game_id):
         self.name = name
         self.id = vars.secure_random_string(9)
+        self.index = None  # Position in Game.player_table, assigned by Game.add_player
         self.location = vars.PLAYER_DEFAULT_PROPERTIES['location']
         self.money = vars.PLAYER_DEFAULT_PROPERTIES['money']
         self.owned_properties = [i for i in vars.PLAYER_DEFAULT_PROPERTIES['owned_properties']] # Directly assign will lead to pass by reference
@@ -15,10 +21,14 @@ class Player:
         self.is_retired = vars.PLAYER_DEFAULT_PROPERTIES['is_retired']
         self.gameboard_size = gameboard_size
         self.game_id = game_id
+        self.decision_provider = None
+        self.event_sink = None
+        self.rng = None
 
-    @staticmethod
-    def roll_dice():
-        return [randint(1, 4), randint(1, 4)]
+    def roll_dice(self):
+        if self.rng is None:
+            return [randint(1, 4), randint(1, 4)]
+        return self.rng.roll_dice()
 
     def move(self, steps):
         self.location += steps
@@ -35,70 +45,89 @@ class Player:
         self.is_jailed = True
         self.location = jail_location
 
+    def announce(self, message):
+        if self.event_sink is None:
+            print(message)
+        else:
+            self.event_sink('message', message)
+
+    def emit(self, event, **payload):
+        if self.event_sink is not None:
+            self.event_sink(event, payload)
+
     def jailbreak(self, jailbreak_price):
+        if not self.is_jailed:
+            return self.roll_dice()
+
+        money_before_jailbreak = self.money
+        dice = self.attempt_jailbreak(jailbreak_price)
+        self.emit('jailbreak', player_id=self.id, paid=money_before_jailbreak - self.money, count_down=self.jailed_rounds_count_down if self.is_jailed else 0)
+        return dice
+
+    def attempt_jailbreak(self, jailbreak_price):
         if self.is_jailed:
             # If the player is in the 1st round of jail (countdown is 3)
             if self.jailed_rounds_count_down == 3:
-                print(f'{self.name} is jailed for the 1st round.')
+                self.announce(f'{self.name} is jailed for the 1st round.')
                 # Player can choose to pay the fine or roll the dice
-                selection = vars.handle_question_with_options(f'Pay ${jailbreak_price} to jailbreak immediately [Y / n]? ', ['y', 'n', ''])
-                if selection.lower() == 'y' or selection.lower() == '':
+                decision_provider = self.decision_provider or DEFAULT_DECISION_PROVIDER
+                if decision_provider.pay_jailbreak(self, jailbreak_price):
                     if self.money >= jailbreak_price:
                         self.money -= jailbreak_price
-                        print(f'{self.name} jailbreak success by paying ${jailbreak_price}!')
+                        self.announce(f'{self.name} jailbreak success by paying ${jailbreak_price}!')
                         self.is_jailed = False
                         self.jailed_rounds_count_down = 3  # Reset the countdown
                         return self.roll_dice()
                     else:
-                        print(f'{self.name} does not have enough money to pay the fine!')
+                        self.announce(f'{self.name} does not have enough money to pay the fine!')
                         first_roll, second_roll = self.roll_dice()
-                        print(f'{self.name} rolled 2 dice: [{first_roll}, {second_roll}]')
+                        self.announce(f'{self.name} rolled 2 dice: [{first_roll}, {second_roll}]')
                         if first_roll == second_roll:
-                            print(f'{self.name} jailbreak success by luck!')
+                            self.announce(f'{self.name} jailbreak success by luck!')
                             self.is_jailed = False
                             self.jailed_rounds_count_down = 3  # Reset the countdown
                         return [first_roll, second_roll]
                 else:
-                    print(f'{self.name} chooses to roll double!')
+                    self.announce(f'{self.name} chooses to roll double!')
                     first_roll, second_roll = self.roll_dice()
-                    print(f'{self.name} rolled 2 dice: [{first_roll}, {second_roll}]')
+                    self.announce(f'{self.name} rolled 2 dice: [{first_roll}, {second_roll}]')
                     if first_roll == second_roll:
-                        print(f'{self.name} jailbreak success by luck!')
+                        self.announce(f'{self.name} jailbreak success by luck!')
                         self.is_jailed = False
                         self.jailed_rounds_count_down = 3  # Reset the countdown
                         return [first_roll, second_roll]
                     else:
-                        print(f'{self.name} failed to roll doubles. Must roll again next turn.')
+                        self.announce(f'{self.name} failed to roll doubles. Must roll again next turn.')
                         self.jailed_rounds_count_down -= 1  # Decrement countdown
 
         # If the player is in the 3rd round of jail (countdown is 1)
             # If the player is in the 2nd round of jail (countdown is 2)
             elif self.jailed_rounds_count_down == 2:
-                print(f'{self.name} is jailed for the 2nd round.')
+                self.announce(f'{self.name} is jailed for the 2nd round.')
                 # Player can only roll the dice
                 first_roll, second_roll = self.roll_dice()
-                print(f'{self.name} rolled 2 dice: [{first_roll}, {second_roll}]')
+                self.announce(f'{self.name} rolled 2 dice: [{first_roll}, {second_roll}]')
                 if first_roll == second_roll:
-                    print(f'{self.name} jailbreak success by luck!')
+                    self.announce(f'{self.name} jailbreak success by luck!')
                     self.is_jailed = False
                     self.jailed_rounds_count_down = 3  # Reset the countdown
                     return [first_roll, second_roll]
                 else:
-                    print(f'{self.name} failed to roll doubles. Must roll again next turn.')
+                    self.announce(f'{self.name} failed to roll doubles. Must roll again next turn.')
                     self.jailed_rounds_count_down -= 1  # Decrement countdown
 
             # If the player is in the 3rd round of jail (countdown is 1)
             elif self.jailed_rounds_count_down == 1:
-                print(f'{self.name} is jailed for the 3rd round.')
+                self.announce(f'{self.name} is jailed for the 3rd round.')
                 first_roll, second_roll = self.roll_dice()
-                print(f'{self.name} rolled 2 dice: [{first_roll}, {second_roll}]')
+                self.announce(f'{self.name} rolled 2 dice: [{first_roll}, {second_roll}]')
                 if first_roll == second_roll:
-                    print(f'{self.name} jailbreak success by luck!')
+                    self.announce(f'{self.name} jailbreak success by luck!')
                     self.is_jailed = False
                     self.jailed_rounds_count_down = 3  # Reset the countdown
                     return [first_roll, second_roll]
                 else:
-                    print(f'{self.name} failed to roll doubles and must pay ${jailbreak_price} to get out of jail.')
+                    self.announce(f'{self.name} failed to roll doubles and must pay ${jailbreak_price} to get out of jail.')
                     self.money -= jailbreak_price
                     self.is_jailed = False
                     self.jailed_rounds_count_down = 3  # Reset the countdown
@@ -115,8 +144,8 @@ class Player:
 
     def show_status(self):
         if self.is_retired:
-            print(f'\nPlayer ID: {self.id}\nPlayer Name: {self.name}\nPlayer is retired: {self.is_retired}')
+            self.announce(f'\nPlayer ID: {self.id}\nPlayer Name: {self.name}\nPlayer is retired: {self.is_retired}')
         elif not self.is_jailed:
-            print(f'\nPlayer ID: {self.id}\nPlayer Name: {self.name}\nPlayer Location: {self.location}\nPlayer Money: {self.money}\nPlayer Owned Properties: {self.owned_properties}\nPlayer is jailed: {self.is_jailed}\n')
+            self.announce(f'\nPlayer ID: {self.id}\nPlayer Name: {self.name}\nPlayer Location: {self.location}\nPlayer Money: {self.money}\nPlayer Owned Properties: {self.owned_properties}\nPlayer is jailed: {self.is_jailed}\n')
         else:
-            print(f'\nPlayer ID: {self.id}\nPlayer Name: {self.name}\nPlayer Location: {self.location}\nPlayer Money: {self.money}\nPlayer Owned Properties: {self.owned_properties}\nPlayer is jailed: {self.is_jailed}\nRounds to stay in Jail: {self.jailed_rounds_count_down}\n')
+            self.announce(f'\nPlayer ID: {self.id}\nPlayer Name: {self.name}\nPlayer Location: {self.location}\nPlayer Money: {self.money}\nPlayer Owned Properties: {self.owned_properties}\nPlayer is jailed: {self.is_jailed}\nRounds to stay in Jail: {self.jailed_rounds_count_down}\n')
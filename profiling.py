@@ -0,0 +1,61 @@
+from time import perf_counter_ns
+from table import format_table
+
+
+# Phases timed for a game, and the Game method each one times. Nested phases are also part of their parent:
+# 'landing' includes any 'retirement' caused by the landing.
+PROFILE_PHASES = {
+    'round': 'play_one_round',
+    'status': 'show_status_view',
+    'jail': 'leave_jail',
+    'move': 'move_player',
+    'landing': 'resolve_square',
+    'retirement': 'retire_and_check',
+}
+
+
+class GameProfiler:
+    # Call counts and cumulative nanoseconds per phase. The phase methods are only wrapped on games with a
+    # profiler, so a game without one calls them directly and takes no timestamps.
+    __slots__ = ('calls', 'nanoseconds')
+
+    def __init__(self):
+        self.calls = {}
+        self.nanoseconds = {}
+
+    def add(self, phase, started):
+        # started is a perf_counter_ns() timestamp
+        self.nanoseconds[phase] = self.nanoseconds.get(phase, 0) + perf_counter_ns() - started
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+
+    def timed(self, phase, function):
+        def timed_function(*args, **kwargs):
+            started = perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.add(phase, started)
+        return timed_function
+
+    def time_phases(self, game):
+        # The timed methods are set on the game instance and shadow the ones of its class
+        for phase, method_name in PROFILE_PHASES.items():
+            setattr(game, method_name, self.timed(phase, getattr(game, method_name)))
+
+    def merge(self, other):
+        for phase, calls in other.calls.items():
+            self.calls[phase] = self.calls.get(phase, 0) + calls
+            self.nanoseconds[phase] = self.nanoseconds.get(phase, 0) + other.nanoseconds[phase]
+        return self
+
+    def to_dict(self):
+        phases = sorted(self.calls, key=lambda phase: list(PROFILE_PHASES).index(phase) if phase in PROFILE_PHASES else len(PROFILE_PHASES))
+        return {phase: {'calls': self.calls[phase], 'total_ns': self.nanoseconds[phase], 'mean_ns': self.nanoseconds[phase] / self.calls[phase]} for phase in phases}
+
+    def format_report(self):
+        rows = [
+            {'Phase': phase, 'Calls': timing['calls'], 'Total [ms]': f'{timing["total_ns"] / 1e6:.3f}', 'Mean [us]': f'{timing["mean_ns"] / 1e3:.3f}'}
+            for phase, timing in self.to_dict().items()
+        ]
+        return f'Profile (landing includes retirement):\n{format_table(rows)}'
+
@@ -0,0 +1,398 @@
+import json
+import os
+import struct
+from itertools import accumulate
+import vars
+
+
+BINARY_SAVE_MAGIC = b'MSAV'
+BINARY_SAVE_VERSION = 2
+# Player flag bits
+PLAYER_IS_JAILED = 1
+PLAYER_IS_RETIRED = 2
+PLAYER_SHARES_GAME_ID = 4  # The player's game id is the one in game_state and is not stored again
+PLAYER_SPARSE_PROPERTIES = 8  # Owned properties are stored as location gaps instead of a bitset
+# Seed tags
+SEED_NONE = 0
+SEED_INT = 1
+SEED_STRING = 2
+# Game over, current round, seed tag, random player orders, chance multiplier, jailbreak price, tax amount rate, go money,
+# maximum rounds, minimum player, maximum player and the number of players
+GAME_FIELDS = struct.Struct('<?IB?qqdqqqqI')
+# Locations of the set bits of every byte value, for decoding owned property bitsets a byte at a time
+BYTE_BITS = [tuple(bit + 1 for bit in range(8) if byte >> bit & 1) for byte in range(256)]
+
+
+def player_columns_format(number_of_players):
+    # Fixed-width player columns: flags, location, money, jailed rounds count down and gameboard size
+    n = number_of_players
+    return f'<{n}B{n}I{n}q{n}i{n}I'
+
+
+def player_orders_format(number_of_orders):
+    # Order keys, then the position in the player table of the player with each order
+    return f'<{number_of_orders}I{number_of_orders}I'
+
+
+class BinaryWriter:
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def write_unsigned(self, value):
+        # LEB128: 7 bits per byte, high bit set on all but the last byte
+        while value > 0x7f:
+            self.buffer.append((value & 0x7f) | 0x80)
+            value >>= 7
+        self.buffer.append(value)
+
+    def write_signed(self, value):
+        # Zigzag, so small negative amounts of money stay small
+        self.write_unsigned(value << 1 if value >= 0 else (-value << 1) - 1)
+
+    def write_string(self, value):
+        encoded = value.encode('utf-8')
+        self.write_unsigned(len(encoded))
+        self.buffer += encoded
+
+    def write_optional_string(self, value):
+        if value is None:
+            self.write_unsigned(0)
+        else:
+            encoded = value.encode('utf-8')
+            self.write_unsigned(len(encoded) + 1)
+            self.buffer += encoded
+
+    def write_bytes(self, value):
+        self.write_unsigned(len(value))
+        self.buffer += value
+
+    def write_unsigned_array(self, values):
+        for value in values:
+            self.write_unsigned(value)
+
+
+class BinaryReader:
+
+    def __init__(self, data):
+        self.data = memoryview(data)
+        self.position = 0
+
+    def read_unsigned(self):
+        data, position = self.data, self.position
+        byte = data[position]
+        position += 1
+        if byte < 0x80:
+            self.position = position
+            return byte
+        value = byte & 0x7f
+        shift = 7
+        while byte & 0x80:
+            byte = data[position]
+            position += 1
+            value |= (byte & 0x7f) << shift
+            shift += 7
+        self.position = position
+        return value
+
+    def read_signed(self):
+        value = self.read_unsigned()
+        return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+    def read_bytes(self, length):
+        start = self.position
+        self.position += length
+        if self.position > len(self.data):
+            raise IndexError('read past the end of the data')
+        return self.data[start:self.position]
+
+    def read_string(self):
+        return str(self.read_bytes(self.read_unsigned()), 'utf-8')
+
+    def read_optional_string(self):
+        length = self.read_unsigned()
+        return None if length == 0 else str(self.read_bytes(length - 1), 'utf-8')
+
+    def read_unsigned_array(self, count):
+        # A run of varints below 0x80 is one byte each, so it is read with a single slice
+        chunk = self.data[self.position:self.position + count]
+        if len(chunk) == count and (count == 0 or max(chunk) < 0x80):
+            self.position += count
+            return chunk.tolist()
+        return [self.read_unsigned() for _ in range(count)]
+
+    def read_struct(self, struct_format):
+        # struct_format is a format string or a struct.Struct
+        if isinstance(struct_format, str):
+            struct_format = struct.Struct(struct_format)
+        values = struct_format.unpack_from(self.data, self.position)
+        self.position += struct_format.size
+        return values
+
+
+def owned_properties_bitset(owned_properties):
+    # Bit location - 1 is set for every owned location, trailing zero bytes are dropped
+    mask = 0
+    for location in owned_properties:
+        mask |= 1 << (int(location) - 1)
+    return mask.to_bytes((mask.bit_length() + 7) // 8, 'little')
+
+
+def bitset_owned_properties(bitset):
+    return [index * 8 + location for index, byte in enumerate(bitset) if byte for location in BYTE_BITS[byte]]
+
+
+def sparse_owned_properties(owned_properties):
+    # Gaps between the sorted locations; smaller than a bitset when a few squares of a huge board are owned
+    writer = BinaryWriter()
+    previous_location = 0
+    for location in sorted(int(location) for location in owned_properties):
+        writer.write_unsigned(location - previous_location)
+        previous_location = location
+    return bytes(writer.buffer)
+
+
+def read_sparse_owned_properties(data):
+    if max(data) < 0x80:
+        # Every gap fits in one byte
+        return list(accumulate(data))
+    reader = BinaryReader(data)
+    owned_properties = []
+    location = 0
+    while reader.position < len(data):
+        location += reader.read_unsigned()
+        owned_properties.append(location)
+    return owned_properties
+
+
+class JsonSaveFormat:
+    suffix = '.json'
+    file_mode = ''
+
+    def dump(self, save_state, save_file):
+        json.dump(save_state, save_file, indent=4)
+
+    def load(self, save_file):
+        return json.load(save_file)
+
+
+class BinarySaveFormat:
+    # Fixed schema: every field of build_save_state in a fixed order, numbers fixed-width. The player table is
+    # stored column by column: varint string lengths, the ids and names as one string, fixed-width number columns,
+    # then the owned properties. player_orders refers to players by their position in that table.
+    # Owned properties come back in ascending location order.
+    suffix = vars.BINARY_SAVE_SUFFIX
+    file_mode = 'b'
+
+    def dump(self, save_state, save_file):
+        save_file.write(self.encode(save_state))
+
+    def load(self, save_file):
+        return self.decode(save_file.read())
+
+    def encode(self, save_state):
+        game_state = save_state['game_state']
+        game_parameters = save_state['game_parameters']
+        gameboard_parameters = save_state['gameboard_parameters']
+        game_id = game_state['game_id']
+
+        writer = BinaryWriter()
+        writer.buffer += BINARY_SAVE_MAGIC
+        writer.write_unsigned(BINARY_SAVE_VERSION)
+
+        seed = game_state.get('seed')
+        seed_tag = SEED_NONE if seed is None else SEED_INT if isinstance(seed, int) else SEED_STRING
+        players = save_state['players']
+        writer.buffer += GAME_FIELDS.pack(
+            bool(game_state['game_over']),
+            int(game_state['current_round']),
+            seed_tag,
+            bool(game_parameters['random_player_orders']),
+            int(game_parameters['chance_multiplier']),
+            int(game_parameters['jailbreak_price']),
+            float(game_parameters['tax_amount_rate']),
+            int(game_parameters['go_money']),
+            int(game_parameters['maximum_rounds']),
+            int(game_parameters['minimum_player']),
+            int(game_parameters['maximum_player']),
+            len(players),
+        )
+        writer.write_optional_string(game_id)
+        writer.write_string(game_state.get('current_player_id') or '')
+        if seed_tag == SEED_INT:
+            writer.write_signed(seed)
+        elif seed_tag == SEED_STRING:
+            writer.write_string(str(seed))
+        writer.write_optional_string(gameboard_parameters['design_file_name'])
+        writer.write_optional_string(gameboard_parameters['game_id'])
+
+        player_positions = {player_id: position for position, player_id in enumerate(players)}
+        flags_column, owned_properties_column = [], []
+        for player in players.values():
+            flags = 0
+            if player['is_jailed']:
+                flags |= PLAYER_IS_JAILED
+            if player['is_retired']:
+                flags |= PLAYER_IS_RETIRED
+            if player['game_id'] == game_id:
+                flags |= PLAYER_SHARES_GAME_ID
+            owned_properties = owned_properties_bitset(player['owned_properties'])
+            sparse = sparse_owned_properties(player['owned_properties'])
+            if len(sparse) < len(owned_properties):
+                flags |= PLAYER_SPARSE_PROPERTIES
+                owned_properties = sparse
+            flags_column.append(flags)
+            owned_properties_column.append(owned_properties)
+
+        names = [player['name'] for player in players.values()]
+        writer.write_unsigned_array([len(player_id) for player_id in players] + [len(name) for name in names])
+        writer.write_string(''.join(players) + ''.join(names))
+        writer.buffer += struct.pack(
+            player_columns_format(len(players)),
+            *flags_column,
+            *[int(player['location']) for player in players.values()],
+            *[int(player['money']) for player in players.values()],
+            *[int(player['jailed_rounds_count_down']) for player in players.values()],
+            *[int(player['gameboard_size']) for player in players.values()],
+        )
+        for flags, player in zip(flags_column, players.values()):
+            if not flags & PLAYER_SHARES_GAME_ID:
+                writer.write_optional_string(player['game_id'])
+        writer.write_unsigned_array([len(owned_properties) for owned_properties in owned_properties_column])
+        writer.buffer += b''.join(owned_properties_column)
+
+        player_orders = save_state['player_orders']
+        writer.write_unsigned(len(player_orders))
+        writer.buffer += struct.pack(
+            player_orders_format(len(player_orders)),
+            *[int(order) for order in player_orders],
+            *[player_positions[player_id] for player_id in player_orders.values()],
+        )
+        return bytes(writer.buffer)
+
+    def decode(self, data):
+        try:
+            return self.decode_fields(data)
+        except (IndexError, UnicodeDecodeError, struct.error):
+            raise ValueError('Binary save file is truncated or corrupted') from None
+
+    def decode_fields(self, data):
+        if data[:len(BINARY_SAVE_MAGIC)] != BINARY_SAVE_MAGIC:
+            raise ValueError('Not a binary save file')
+        reader = BinaryReader(data)
+        reader.position = len(BINARY_SAVE_MAGIC)
+        version = reader.read_unsigned()
+        if version != BINARY_SAVE_VERSION:
+            raise ValueError(f'Unsupported binary save version {version}')
+
+        (game_over, current_round, seed_tag, random_player_orders, chance_multiplier, jailbreak_price, tax_amount_rate,
+         go_money, maximum_rounds, minimum_player, maximum_player, number_of_players) = reader.read_struct(GAME_FIELDS)
+        game_id = reader.read_optional_string()
+        game_state = {
+            'game_id': game_id,
+            'game_over': game_over,
+            'current_round': current_round,
+            'current_player_id': reader.read_string(),
+        }
+        if seed_tag == SEED_INT:
+            game_state['seed'] = reader.read_signed()
+        elif seed_tag == SEED_STRING:
+            game_state['seed'] = reader.read_string()
+
+        game_parameters = {
+            'random_player_orders': random_player_orders,
+            'chance_multiplier': chance_multiplier,
+            'jailbreak_price': jailbreak_price,
+            'tax_amount_rate': tax_amount_rate,
+            'go_money': go_money,
+            'maximum_rounds': maximum_rounds,
+            'minimum_player': minimum_player,
+            'maximum_player': maximum_player,
+        }
+        gameboard_parameters = {
+            'design_file_name': reader.read_optional_string(),
+            'game_id': reader.read_optional_string(),
+        }
+
+        # The player table is stored column by column, so each column is read with one call
+        text_lengths = reader.read_unsigned_array(2 * number_of_players)
+        text = reader.read_string()
+        text_offsets = list(accumulate(text_lengths, initial=0))
+        if text_offsets[-1] != len(text):
+            raise ValueError('Binary save file is truncated or corrupted')
+        texts = [text[start:end] for start, end in zip(text_offsets, text_offsets[1:])]
+        player_ids, names = texts[:number_of_players], texts[number_of_players:]
+
+        columns = reader.read_struct(player_columns_format(number_of_players))
+        flags_column = columns[:number_of_players]
+        locations = columns[number_of_players:2 * number_of_players]
+        money_column = columns[2 * number_of_players:3 * number_of_players]
+        jailed_rounds_count_downs = columns[3 * number_of_players:4 * number_of_players]
+        gameboard_sizes = columns[4 * number_of_players:]
+        player_game_ids = [game_id if flags & PLAYER_SHARES_GAME_ID else reader.read_optional_string() for flags in flags_column]
+
+        owned_properties_lengths = reader.read_unsigned_array(number_of_players)
+        owned_properties_data = reader.read_bytes(sum(owned_properties_lengths))
+        owned_properties_offsets = list(accumulate(owned_properties_lengths, initial=0))
+        owned_properties_column = [
+            [] if start == end
+            else read_sparse_owned_properties(owned_properties_data[start:end]) if flags & PLAYER_SPARSE_PROPERTIES
+            else bitset_owned_properties(owned_properties_data[start:end])
+            for flags, start, end in zip(flags_column, owned_properties_offsets, owned_properties_offsets[1:])
+        ]
+
+        players = {
+            player_id: {
+                'name': name,
+                'id': player_id,
+                'location': location,
+                'money': money,
+                'owned_properties': owned_properties,
+                'is_jailed': bool(flags & PLAYER_IS_JAILED),
+                'jailed_rounds_count_down': jailed_rounds_count_down,
+                'is_retired': bool(flags & PLAYER_IS_RETIRED),
+                'gameboard_size': gameboard_size,
+                'game_id': player_game_id,
+            }
+            for player_id, name, flags, location, money, jailed_rounds_count_down, gameboard_size, player_game_id, owned_properties in zip(
+                player_ids, names, flags_column, locations, money_column, jailed_rounds_count_downs, gameboard_sizes, player_game_ids, owned_properties_column,
+            )
+        }
+
+        number_of_orders = reader.read_unsigned()
+        orders = reader.read_struct(player_orders_format(number_of_orders))
+        player_orders = {order: player_ids[position] for order, position in zip(orders[:number_of_orders], orders[number_of_orders:])}
+
+        return {
+            'game_state': game_state,
+            'player_orders': player_orders,
+            'game_parameters': game_parameters,
+            'players': players,
+            'gameboard_parameters': gameboard_parameters,
+        }
+
+
+SAVE_FORMATS = {save_format.suffix: save_format for save_format in [JsonSaveFormat(), BinarySaveFormat()]}
+
+
+def save_format_for(save_path):
+    try:
+        return SAVE_FORMATS[save_path.suffix]
+    except KeyError:
+        raise ValueError(f'Unknown save file extension {save_path.suffix!r}, expected one of {", ".join(SAVE_FORMATS)}') from None
+
+
+def read_save_state(save_path):
+    save_format = save_format_for(save_path)
+    with open(save_path, f'r{save_format.file_mode}') as save_file:
+        return save_format.load(save_file)
+
+
+def write_save_state(save_path, save_state):
+    # Written next to the target and renamed over it, so readers never see a half-written save.
+    # The format is picked by the extension.
+    save_format = save_format_for(save_path)
+    temporary_path = save_path.with_name(f'.{save_path.name}.tmp')
+    with open(temporary_path, f'w{save_format.file_mode}') as temporary_file:
+        save_format.dump(save_state, temporary_file)
+    os.replace(temporary_path, save_path)
@@ -0,0 +1,162 @@
+import argparse
+import json
+import os
+import sqlite3
+import sys
+from concurrent.futures import ProcessPoolExecutor
+import vars
+from delta_save import apply_save_deltas, delta_path_for
+from save_format import SAVE_FORMATS, read_save_state
+
+
+SAVE_INDEX_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS saves (
+    file_name TEXT PRIMARY KEY,
+    game_id TEXT,
+    current_round INTEGER,
+    live_players INTEGER,
+    total_players INTEGER,
+    design_file_name TEXT,
+    game_over INTEGER,
+    signature TEXT
+)
+'''
+SAVE_INDEX_COLUMNS = ['file_name', 'game_id', 'current_round', 'live_players', 'total_players', 'design_file_name', 'game_over']
+
+
+def save_signature(save_path):
+    # Changes whenever the base file or its delta log is rewritten
+    signature = []
+    for path in [save_path, delta_path_for(save_path)]:
+        try:
+            stat = path.stat()
+            signature.append(f'{stat.st_mtime_ns}:{stat.st_size}')
+        except FileNotFoundError:
+            signature.append('-')
+    return '|'.join(signature)
+
+
+def save_summary(file_name, save_state):
+    players = save_state['players'].values()
+    return {
+        'file_name': file_name,
+        'game_id': save_state['game_state'].get('game_id'),
+        'current_round': int(save_state['game_state'].get('current_round', 0)),
+        'live_players': sum(1 for player in players if not player.get('is_retired', False)),
+        'total_players': len(players),
+        'design_file_name': save_state['gameboard_parameters'].get('design_file_name'),
+        'game_over': bool(save_state['game_state'].get('game_over', False)),
+    }
+
+
+def load_save_state(save_path):
+    # The save state as Game.load_game_state sees it, without building a Game or reading the design
+    return apply_save_deltas(read_save_state(save_path), save_path)
+
+
+class SaveIndex:
+    # SQLite catalog of the save directory. An index keeps one connection, opened with the schema by
+    # the first call, and must stay on the thread that made that call; the game and its autosave
+    # thread each have their own index.
+
+    def __init__(self, save_directory=None, index_path=None):
+        self.save_directory = save_directory or vars.BASE_SAVE_STATE_PATH
+        self.index_path = index_path or self.save_directory / vars.SAVE_INDEX_FILE_NAME
+        self.connection = None
+
+    def connect(self):
+        if self.connection is None:
+            self.connection = sqlite3.connect(self.index_path, timeout=10)
+            self.connection.execute(SAVE_INDEX_SCHEMA)
+        return self.connection
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def update(self, file_name, save_state):
+        summary = save_summary(file_name, save_state)
+        summary['game_over'] = int(summary['game_over'])
+        summary['signature'] = save_signature(self.save_directory / file_name)
+        with self.connect() as connection:
+            connection.execute(
+                'INSERT OR REPLACE INTO saves VALUES (:file_name, :game_id, :current_round, :live_players, :total_players, :design_file_name, :game_over, :signature)',
+                summary,
+            )
+
+    def refresh(self):
+        # Re-reads only the saves whose files changed since they were indexed, and drops deleted ones
+        with self.connect() as connection:
+            signatures = dict(connection.execute('SELECT file_name, signature FROM saves'))
+
+        save_paths = {path.name: path for path in self.save_directory.iterdir() if path.suffix in SAVE_FORMATS}
+        for file_name in signatures.keys() - save_paths.keys():
+            self.remove(file_name)
+        for file_name, save_path in save_paths.items():
+            if signatures.get(file_name) != save_signature(save_path):
+                try:
+                    self.update(file_name, load_save_state(save_path))
+                except (ValueError, KeyError, TypeError, AttributeError):
+                    # Not a save file
+                    self.remove(file_name)
+
+    def remove(self, file_name):
+        with self.connect() as connection:
+            connection.execute('DELETE FROM saves WHERE file_name = ?', (file_name,))
+
+    def query(self, game_id=None, minimum_round=None, maximum_round=None, minimum_live_players=None, design_file_name=None, game_over=None):
+        conditions, parameters = [], []
+        for condition, value in [
+            ('game_id = ?', game_id),
+            ('current_round >= ?', minimum_round),
+            ('current_round <= ?', maximum_round),
+            ('live_players >= ?', minimum_live_players),
+            ('design_file_name = ?', design_file_name),
+            ('game_over = ?', None if game_over is None else int(game_over)),
+        ]:
+            if value is not None:
+                conditions.append(condition)
+                parameters.append(value)
+        where = f' WHERE {" AND ".join(conditions)}' if conditions else ''
+
+        with self.connect() as connection:
+            rows = connection.execute(f'SELECT {", ".join(SAVE_INDEX_COLUMNS)} FROM saves{where} ORDER BY file_name', parameters).fetchall()
+        summaries = [dict(zip(SAVE_INDEX_COLUMNS, row)) for row in rows]
+        for summary in summaries:
+            summary['game_over'] = bool(summary['game_over'])
+        return summaries
+
+
+def bulk_load_save_states(file_names, save_directory=None, workers=None):
+    # {file name: save state}; parsing is spread over processes, the results keep the input order
+    save_directory = save_directory or vars.BASE_SAVE_STATE_PATH
+    save_paths = [save_directory / file_name for file_name in file_names]
+    if workers == 1:
+        return dict(zip(file_names, map(load_save_state, save_paths)))
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(save_paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(file_names, executor.map(load_save_state, save_paths, chunksize=chunksize)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='List and filter the saves in the save directory.')
+    parser.add_argument('--game-id')
+    parser.add_argument('--minimum-round', type=int)
+    parser.add_argument('--maximum-round', type=int)
+    parser.add_argument('--minimum-live-players', type=int)
+    parser.add_argument('--design')
+    parser.add_argument('--refresh', action='store_true', help='Re-index saves that changed outside of Game.save_game_state')
+    args = parser.parse_args(argv)
+
+    save_index = SaveIndex()
+    if args.refresh:
+        save_index.refresh()
+    for summary in save_index.query(args.game_id, args.minimum_round, args.maximum_round, args.minimum_live_players, args.design):
+        print(json.dumps(summary))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
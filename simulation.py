@@ -0,0 +1,115 @@
+import argparse
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import vars
+from design_cache import load_design_file
+from game import discard_event, run_headless_game
+from game_stats import GameStatsAggregator
+
+
+def play_simulated_game(gameboard_design, design_file_name, game_parameters, number_of_players, seed):
+    # Each game owns its random streams, so results only depend on the seed
+    player_names = [f'Player{i}' for i in range(1, number_of_players + 1)]
+    game = run_headless_game(gameboard_design, player_names, game_parameters, event_sink=discard_event, design_file_name=design_file_name, seed=seed)
+
+    # Players are created in seat order, so the dict order is the seat order
+    seats = list(game.players.values())
+    return {
+        "seed": seed,
+        "winners": [seat for seat, player in enumerate(seats) if player.id in game.winners],
+        "rounds_played": game.game_state["current_round"] - 1,
+        "final_money": [player.money for player in seats],
+        "bankruptcies": [seat for seat, player in enumerate(seats) if player.is_retired],
+    }
+
+
+def aggregate_simulated_games(gameboard_design, design_file_name, game_parameters, number_of_players, seeds):
+    # One aggregator per worker task; only the fixed-size aggregate crosses the process boundary
+    game_parameters = game_parameters or {}
+    aggregator = GameStatsAggregator(game_parameters.get("maximum_rounds", vars.DEFAULT_MAXIMUM_ROUNDS))
+    player_names = [f'Player{i}' for i in range(1, number_of_players + 1)]
+    for seed in seeds:
+        run_headless_game(gameboard_design, player_names, game_parameters, event_sink=aggregator, design_file_name=design_file_name, seed=seed)
+    return aggregator
+
+
+def simulate_statistics(design_file_name='default_gameboard.json', game_parameters=None, number_of_games=1000, number_of_players=4, workers=None, seed=None, games_per_task=None):
+    # Same seeds as simulate, but the per-game results are folded into one GameStatsAggregator
+    gameboard_design, _ = load_design_file(vars.BASE_GAMEBOARD_DESIGN_DIR / design_file_name)
+    seed_generator = random.Random(seed)
+    seeds = [seed_generator.getrandbits(32) for _ in range(number_of_games)]
+    aggregate = partial(aggregate_simulated_games, gameboard_design, design_file_name, game_parameters, number_of_players)
+
+    workers = workers or os.cpu_count() or 1
+    games_per_task = games_per_task or max(1, number_of_games // (workers * 4))
+    seed_chunks = [seeds[i:i + games_per_task] for i in range(0, number_of_games, games_per_task)]
+    total = aggregate([])
+    if workers == 1:
+        for seed_chunk in seed_chunks:
+            total.merge(aggregate(seed_chunk))
+        return total
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for partial_aggregate in executor.map(aggregate, seed_chunks):
+            total.merge(partial_aggregate)
+    return total
+
+
+def simulate(design_file_name='default_gameboard.json', game_parameters=None, number_of_games=1000, number_of_players=4, workers=None, seed=None):
+    gameboard_design, _ = load_design_file(vars.BASE_GAMEBOARD_DESIGN_DIR / design_file_name)
+    seed_generator = random.Random(seed)
+    seeds = [seed_generator.getrandbits(32) for _ in range(number_of_games)]
+    play = partial(play_simulated_game, gameboard_design, design_file_name, game_parameters, number_of_players)
+
+    if workers == 1:
+        return [play(game_seed) for game_seed in seeds]
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, number_of_games // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(play, seeds, chunksize=chunksize))
+
+
+def summarize_results(results, number_of_players):
+    wins = [0] * number_of_players
+    bankruptcies = [0] * number_of_players
+    for result in results:
+        for seat in result["winners"]:
+            wins[seat] += 1
+        for seat in result["bankruptcies"]:
+            bankruptcies[seat] += 1
+
+    number_of_games = max(1, len(results))
+    return {
+        "games": len(results),
+        "average_rounds": sum(result["rounds_played"] for result in results) / number_of_games,
+        "win_rate_per_seat": [count / number_of_games for count in wins],
+        "bankruptcy_rate_per_seat": [count / number_of_games for count in bankruptcies],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run many headless MonopolyCMD games and summarize the results.')
+    parser.add_argument('design_file_name', nargs='?', default='default_gameboard.json')
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--players', type=int, default=4)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--maximum-rounds', type=int, default=vars.DEFAULT_MAXIMUM_ROUNDS)
+    parser.add_argument('--statistics', action='store_true', help='Report landing, rent, game length and bankruptcy statistics in constant memory')
+    args = parser.parse_args(argv)
+
+    if args.statistics:
+        aggregator = simulate_statistics(args.design_file_name, {"maximum_rounds": args.maximum_rounds}, args.games, args.players, args.workers, args.seed)
+        print(json.dumps(aggregator.to_dict(), indent=4))
+        return
+
+    results = simulate(args.design_file_name, {"maximum_rounds": args.maximum_rounds}, args.games, args.players, args.workers, args.seed)
+    print(json.dumps(summarize_results(results, args.players), indent=4))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+import random
+from collections import namedtuple
+from decision import AutomaticDecisionProvider
+
+
+AVERAGE_DICE_TOTAL = 5  # Two dice of 1 - 4
+DEFAULT_CASH_RESERVE = 300
+DEFAULT_MINIMUM_RETURN = 1.0
+
+# Read-only snapshots of what a strategy may look at. Strategies never see the Game or the Player,
+# so they cannot change the game and are plain functions of these fields.
+PropertyView = namedtuple('PropertyView', ['money', 'location', 'price', 'rent', 'number_of_owned_properties', 'board_size', 'live_players', 'rounds_left'])
+JailView = namedtuple('JailView', ['money', 'jailbreak_price', 'jailed_rounds_count_down'])
+
+
+def property_view(game, player, location):
+    gameboard = game.gameboard
+    return PropertyView(
+        player.money,
+        location,
+        gameboard.square_prices[location],
+        gameboard.square_rents[location],
+        len(player.owned_properties),
+        player.gameboard_size,
+        len(game.turn_order),
+        game.game_parameters['maximum_rounds'] - game.game_state['current_round'] + 1,
+    )
+
+
+def jail_view(player, jailbreak_price):
+    return JailView(player.money, jailbreak_price, player.jailed_rounds_count_down)
+
+
+class AlwaysBuyStrategy:
+    __slots__ = ()
+
+    def buy_property(self, view):
+        return True
+
+    def pay_jailbreak(self, view):
+        return True
+
+
+class CashThresholdStrategy:
+    # Spends money only while at least `reserve` is left afterwards
+    __slots__ = ('reserve',)
+
+    def __init__(self, reserve=DEFAULT_CASH_RESERVE):
+        self.reserve = reserve
+
+    def buy_property(self, view):
+        return view.money - view.price >= self.reserve
+
+    def pay_jailbreak(self, view):
+        return view.money - view.jailbreak_price >= self.reserve
+
+
+class ReturnOnInvestmentStrategy:
+    # Buys when the rent expected from the opponents before the game ends pays back
+    # `minimum_return` times the price. An opponent lands on a given square about
+    # AVERAGE_DICE_TOTAL / board_size times per round.
+    __slots__ = ('minimum_return', 'reserve')
+
+    def __init__(self, minimum_return=DEFAULT_MINIMUM_RETURN, reserve=0):
+        self.minimum_return = minimum_return
+        self.reserve = reserve
+
+    def buy_property(self, view):
+        if view.money - view.price < self.reserve:
+            return False
+        expected_rent = view.rent * (view.live_players - 1) * max(view.rounds_left, 0) * AVERAGE_DICE_TOTAL / view.board_size
+        return expected_rent >= view.price * self.minimum_return
+
+    def pay_jailbreak(self, view):
+        return view.money - view.jailbreak_price >= self.reserve
+
+
+class RandomStrategy:
+    # Its own random stream, so a seeded bot makes the same choices whatever the other players do
+    __slots__ = ('buy_probability', 'pay_probability', 'random')
+
+    def __init__(self, seed=None, buy_probability=0.5, pay_probability=0.5):
+        self.buy_probability = buy_probability
+        self.pay_probability = pay_probability
+        self.random = random.Random(seed)
+
+    def buy_property(self, view):
+        return self.random.random() < self.buy_probability
+
+    def pay_jailbreak(self, view):
+        return self.random.random() < self.pay_probability
+
+
+STRATEGIES = {
+    'always-buy': AlwaysBuyStrategy,
+    'cash-threshold': CashThresholdStrategy,
+    'roi': ReturnOnInvestmentStrategy,
+    'random': RandomStrategy,
+}
+
+
+def make_strategy(name, **parameters):
+    try:
+        return STRATEGIES[name](**parameters)
+    except KeyError:
+        raise ValueError(f'Unknown strategy {name!r}, expected one of {", ".join(STRATEGIES)}') from None
+
+
+class StrategyDecisionProvider(AutomaticDecisionProvider):
+    # Plugs a strategy into the decision points of the game loop and of Player.jailbreak.
+    # Bots never look at the status screens, so the turn action stays 'continue'.
+
+    def __init__(self, strategy):
+        self.strategy = strategy
+
+    def buy_property(self, game, player, location):
+        return self.strategy.buy_property(property_view(game, player, location))
+
+    def pay_jailbreak(self, player, jailbreak_price):
+        return self.strategy.pay_jailbreak(jail_view(player, jailbreak_price))
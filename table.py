@@ -0,0 +1,26 @@
+import vars
+
+
+def render_table(rows, columns=None):
+    # Right-aligned fixed-width table, laid out like pandas' DataFrame.to_string(index=False)
+    if columns is None:
+        columns = list(rows[0].keys()) if rows else []
+    cells = [[str(row.get(column, '')) for column in columns] for row in rows]
+    widths = [max([len(column)] + [len(row[idx]) for row in cells]) for idx, column in enumerate(columns)]
+    lines = [' '.join(column.rjust(width) for column, width in zip(columns, widths))]
+    for row in cells:
+        lines.append(' '.join(cell.rjust(width) for cell, width in zip(row, widths)))
+    return '\n'.join(lines)
+
+
+def render_pandas_table(rows):
+    # pandas is only imported when a user opts into it
+    import pandas as pd
+    with pd.option_context('display.max_rows', None, 'display.max_columns', None, 'display.max_colwidth', None):
+        return pd.DataFrame(rows).to_string(index=False)
+
+
+def format_table(rows):
+    if vars.USE_PANDAS_TABLES:
+        return render_pandas_table(rows)
+    return render_table(rows)
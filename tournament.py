@@ -0,0 +1,157 @@
+import argparse
+import itertools
+import json
+import math
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from statistics import NormalDist
+import vars
+from design_cache import load_design_file
+from game import discard_event, run_headless_game
+from strategy import STRATEGIES, StrategyDecisionProvider, make_strategy
+
+
+DEFAULT_BLOCK_SIZE = 50
+DEFAULT_CONFIDENCE = 0.95
+
+
+def tournament_strategy(name, seed, slot):
+    # A random bot's stream depends on the game seed and its slot in the matchup, not on its seat,
+    # so every rotation of a matchup replays the same choices
+    if name == 'random':
+        return make_strategy(name, seed=f'{seed}:{slot}')
+    return make_strategy(name)
+
+
+def matchups_for(strategy_names, players_per_game):
+    return list(itertools.combinations(strategy_names, players_per_game))
+
+
+def play_matchup(gameboard_design, design_file_name, game_parameters, matchup, seed):
+    # One game per rotation of the seats, all with the same seed. A win shared by several
+    # players is split between them. Returns [(strategy name, seat, score), ...]
+    scores = []
+    for rotation in range(len(matchup)):
+        slots = list(range(rotation, len(matchup))) + list(range(rotation))
+        decision_providers = [StrategyDecisionProvider(tournament_strategy(matchup[slot], seed, slot)) for slot in slots]
+        player_names = [f'{matchup[slot]} {seat}' for seat, slot in enumerate(slots, start=1)]
+        game = run_headless_game(gameboard_design, player_names, game_parameters, event_sink=discard_event, design_file_name=design_file_name, seed=seed, decision_providers=decision_providers)
+        number_of_winners = max(1, len(game.winners))
+        for seat, (slot, player) in enumerate(zip(slots, game.player_table)):
+            scores.append((matchup[slot], seat, 1 / number_of_winners if player.id in game.winners else 0))
+    return scores
+
+
+def wilson_interval(score, games, z):
+    if games == 0:
+        return 0.0, 1.0
+    rate = score / games
+    denominator = 1 + z * z / games
+    center = (rate + z * z / (2 * games)) / denominator
+    half_width = z * math.sqrt(rate * (1 - rate) / games + z * z / (4 * games * games)) / denominator
+    return max(0.0, center - half_width), min(1.0, center + half_width)
+
+
+class TournamentStandings:
+    # Running totals per strategy; games of the same seed are correlated, so the intervals are a guide, not exact
+
+    def __init__(self, strategy_names, players_per_game, confidence=DEFAULT_CONFIDENCE):
+        self.z = NormalDist().inv_cdf((1 + confidence) / 2)
+        self.confidence = confidence
+        self.games = {name: 0 for name in strategy_names}
+        self.scores = {name: 0.0 for name in strategy_names}
+        self.seat_games = [0] * players_per_game
+        self.seat_scores = [0.0] * players_per_game
+
+    def add(self, scores):
+        for name, seat, score in scores:
+            self.games[name] += 1
+            self.scores[name] += score
+            self.seat_games[seat] += 1
+            self.seat_scores[seat] += score
+
+    def standings(self):
+        standings = []
+        for name, games in self.games.items():
+            low, high = wilson_interval(self.scores[name], games, self.z)
+            standings.append({'strategy': name, 'games': games, 'win_rate': self.scores[name] / games if games else 0.0, 'low': low, 'high': high})
+        standings.sort(key=lambda standing: standing['win_rate'], reverse=True)
+        return standings
+
+    def is_separated(self):
+        # The leader's interval lies entirely above the runner-up's
+        standings = self.standings()
+        return len(standings) > 1 and standings[0]['low'] > standings[1]['high']
+
+    def report(self):
+        return {
+            'confidence': self.confidence,
+            'standings': self.standings(),
+            'win_rate_per_seat': [score / games if games else 0.0 for score, games in zip(self.seat_scores, self.seat_games)],
+            'separated': self.is_separated(),
+        }
+
+
+def run_tournament(strategy_names, players_per_game=2, design_file_name='default_gameboard.json', game_parameters=None, maximum_seeds=1000,
+                   minimum_seeds=DEFAULT_BLOCK_SIZE, block_size=DEFAULT_BLOCK_SIZE, confidence=DEFAULT_CONFIDENCE, workers=None, seed=None):
+    # Yields a report after every block of seeds; stops after maximum_seeds, or earlier once the standings separate.
+    # Every matchup is played with the same seeds.
+    gameboard_design, _ = load_design_file(vars.BASE_GAMEBOARD_DESIGN_DIR / design_file_name)
+    matchups = matchups_for(strategy_names, players_per_game)
+    standings = TournamentStandings(strategy_names, players_per_game, confidence)
+    seed_generator = random.Random(seed)
+    play = partial(play_matchup, gameboard_design, design_file_name, game_parameters)
+
+    executor = None if workers == 1 else ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1)
+    try:
+        seeds_played = 0
+        while seeds_played < maximum_seeds:
+            seeds = [seed_generator.getrandbits(32) for _ in range(min(block_size, maximum_seeds - seeds_played))]
+            tasks = [(matchup, game_seed) for game_seed in seeds for matchup in matchups]
+            results = map(play, *zip(*tasks)) if executor is None else executor.map(play, *zip(*tasks))
+            for scores in results:
+                standings.add(scores)
+            seeds_played += len(seeds)
+
+            report = standings.report()
+            report['seeds'] = seeds_played
+            yield report
+            if seeds_played >= minimum_seeds and report['separated']:
+                return
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Play strategy matchups against each other and report win rates with confidence intervals.')
+    parser.add_argument('strategies', nargs='*', help=f'Strategies to play, all of them by default: {", ".join(STRATEGIES)}')
+    parser.add_argument('--design', default='default_gameboard.json')
+    parser.add_argument('--players', type=int, default=2, help='Players per game; every combination of this many strategies is a matchup')
+    parser.add_argument('--maximum-seeds', type=int, default=1000)
+    parser.add_argument('--minimum-seeds', type=int, default=DEFAULT_BLOCK_SIZE)
+    parser.add_argument('--block-size', type=int, default=DEFAULT_BLOCK_SIZE, help='Seeds played between two reports')
+    parser.add_argument('--confidence', type=float, default=DEFAULT_CONFIDENCE)
+    parser.add_argument('--maximum-rounds', type=int, default=vars.DEFAULT_MAXIMUM_ROUNDS)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    strategy_names = list(dict.fromkeys(args.strategies or STRATEGIES))
+    for name in strategy_names:
+        if name not in STRATEGIES:
+            parser.error(f'Unknown strategy {name!r}, expected one of {", ".join(STRATEGIES)}')
+    if not 2 <= args.players <= len(strategy_names):
+        parser.error(f'--players must be between 2 and the number of strategies ({len(strategy_names)})')
+
+    for report in run_tournament(strategy_names, args.players, args.design, {"maximum_rounds": args.maximum_rounds}, args.maximum_seeds,
+                                 args.minimum_seeds, args.block_size, args.confidence, args.workers, args.seed):
+        print(json.dumps(report), flush=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,65 @@
+class TurnOrder:
+    # Circular doubly linked list over player indices. Next-player lookup and retirement are O(1);
+    # retired seats keep the order keys they got in the player_orders save format.
+
+    def __init__(self, seats=(), retired=()):
+        seats = list(seats)
+        table_size = max(seats + [index for key, index in retired] + [-1]) + 1
+        self.next_seat = [None] * table_size
+        self.previous_seat = [None] * table_size
+        self.first = seats[0] if seats else None
+        self.playing_count = len(seats)
+        for position, index in enumerate(seats):
+            self.next_seat[index] = seats[(position + 1) % len(seats)]
+            self.previous_seat[index] = seats[position - 1]
+        # (order key, player index) in the order the players retired
+        self.retired = list(retired)
+
+    def __len__(self):
+        return self.playing_count
+
+    def is_playing(self, index):
+        return index < len(self.next_seat) and self.next_seat[index] is not None
+
+    def next_after(self, index):
+        return self.next_seat[index]
+
+    def seats(self):
+        seats = []
+        index = self.first
+        for _ in range(self.playing_count):
+            seats.append(index)
+            index = self.next_seat[index]
+        return seats
+
+    def retire(self, index, maximum_player):
+        if not self.is_playing(index):
+            return
+        next_index = self.next_seat[index]
+        previous_index = self.previous_seat[index]
+        self.next_seat[previous_index] = next_index
+        self.previous_seat[next_index] = previous_index
+        self.next_seat[index] = None
+        self.previous_seat[index] = None
+        self.playing_count -= 1
+        if self.first == index:
+            self.first = next_index if self.playing_count else None
+
+        # Same numbering as the save format: retired seats count up from maximum_player + 1
+        retired_key = self.retired[-1][0] + 1 if self.retired else maximum_player + 1
+        self.retired.append((retired_key, index))
+
+    def to_player_orders(self, player_table):
+        player_orders = {order: player_table[index].id for order, index in enumerate(self.seats(), start=1)}
+        for key, index in self.retired:
+            player_orders[key] = player_table[index].id
+        return player_orders
+
+    @classmethod
+    def from_player_orders(cls, player_orders, players, maximum_player):
+        # players maps player id to Player; keys above maximum_player are retired seats
+        keys = sorted(int(key) for key in player_orders)
+        player_orders = {int(key): player_id for key, player_id in player_orders.items()}
+        seats = [players[player_orders[key]].index for key in keys if key <= maximum_player]
+        retired = [(key, players[player_orders[key]].index) for key in keys if key > maximum_player]
+        return cls(seats, retired)
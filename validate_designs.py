@@ -0,0 +1,72 @@
+import argparse
+import json
+import os
+import pathlib as pl
+import sys
+from concurrent.futures import ProcessPoolExecutor
+import vars
+from gameboard import Gameboard
+from design_validation import validate_design
+
+
+def square_schema_errors(design):
+    errors = []
+    for item, square_type in [('properties', 'property'), ('functions', 'function')]:
+        for row in design[item]:
+            try:
+                Gameboard.square_checker(row, square_type)
+            except (AssertionError, KeyError):
+                errors.append({'rule': f'{square_type}-schema', 'location': row.get('location'), 'message': f'Error: {square_type.capitalize()} square fields or field types do not match the design format.'})
+    return errors
+
+
+def validate_design_file(design_path):
+    # One JSON-lines record per design file; never raises, so one broken file does not stop the batch
+    record = {'file': str(design_path), 'is_valid': False, 'errors': []}
+    try:
+        with open(design_path) as design_file:
+            design = json.load(design_file)
+        report = validate_design(design)
+        record['errors'] = report['errors'] + square_schema_errors(design)
+    except ValueError as e:
+        record['errors'] = [{'rule': 'invalid-json', 'location': None, 'message': f'Error: {e}'}]
+    except (KeyError, TypeError, AttributeError) as e:
+        record['errors'] = [{'rule': 'invalid-design', 'location': None, 'message': f'Error: Design is missing or has a malformed field: {e}'}]
+    record['is_valid'] = not record['errors']
+    return record
+
+
+def validate_designs(design_paths, workers=None):
+    # Yields the records in the order of design_paths as soon as each one is ready
+    if workers == 1:
+        yield from map(validate_design_file, design_paths)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(design_paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(validate_design_file, design_paths, chunksize=chunksize)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Validate every gameboard design in a directory and print a JSON-lines report.')
+    parser.add_argument('directory', nargs='?', default=str(vars.BASE_GAMEBOARD_DESIGN_DIR))
+    parser.add_argument('--pattern', default='*.json')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--only-failures', action='store_true', help='Only print records of invalid designs')
+    args = parser.parse_args(argv)
+
+    design_paths = sorted(pl.Path(args.directory).glob(args.pattern))
+    number_of_failures = 0
+    for record in validate_designs(design_paths, args.workers):
+        if not record['is_valid']:
+            number_of_failures += 1
+        if not record['is_valid'] or not args.only_failures:
+            print(json.dumps(record), flush=True)
+
+    print(f'{len(design_paths)} designs checked, {number_of_failures} invalid', file=sys.stderr)
+    return 1 if number_of_failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,5 +1,4 @@
 import pathlib as pl
-import json
 import string
 import random
 import re
@@ -15,6 +14,12 @@ def is_valid_save_file_name(s):
     return bool(re.match(pattern, s))
 
 
+def is_valid_save_state_file_name(s):
+    # Game saves may also use the binary save format
+    pattern = rf'^[\w]+(\.json|{re.escape(BINARY_SAVE_SUFFIX)})$'
+    return bool(re.match(pattern, s))
+
+
 def is_valid_type(s, type_functions):
     try:
         if len(type_functions) > 1 and type_functions[1]:
@@ -52,14 +57,14 @@ SQUARE_DESIGN = True
 BASE_GAMEBOARD_DESIGN_DIR = pl.Path.cwd() / "data" / "gameboard_design"
 BASE_GAMEBOARD_DESIGN_DIR.mkdir(exist_ok=True)
 BASE_SAVE_STATE_PATH = pl.Path.cwd() / "data" / "save_state"
+BINARY_SAVE_SUFFIX = ".msav"  # Save files with this extension use the binary save format of save_format
+SAVE_INDEX_FILE_NAME = "save_index.sqlite"  # Catalog of the saves, kept up to date by save_index
 DEFAULT_GAMEBOARD_DESIGN_PATH = BASE_GAMEBOARD_DESIGN_DIR / "default_gameboard.json"
-DEFAULT_GAMEBOARD_DESIGN = {}
-if DEFAULT_GAMEBOARD_DESIGN_PATH.is_file():
-    try:
-        DEFAULT_GAMEBOARD_DESIGN = json.load(open(DEFAULT_GAMEBOARD_DESIGN_PATH, "r"))
-    except:
-        DEFAULT_GAMEBOARD_DESIGN = {}
+DESIGN_CACHE_SIZE = 16  # Parsed designs kept in memory by design_cache
 
+USE_PANDAS_TABLES = False  # Render status tables with pandas instead of the built-in renderer
+AUTOSAVE_EVERY_ROUNDS = 0  # Interactive games checkpoint to autosave_<game id>.json every n rounds; 0 turns autosave off
+PROFILE_GAMES = False  # Time the phases of every turn and print the profile when a game ends
 DEFAULT_RANDOM_PLAYER_ORDERS = False
 DEFAULT_CHANCE_MULTIPLIER = 10 # Default 10
 DEFAULT_JAILBREAK_PRICE = 150
@@ -68,6 +73,8 @@ DEFAULT_GO_MONEY = 1500 # 1500
 DEFAULT_MAXIMUM_ROUNDS = 100
 DEFAULT_MINIMUM_PLAYER = 2
 DEFAULT_MAXIMUM_PLAYER = 6
+LARGE_LOBBY_MAXIMUM_PLAYER = 1000
+STATUS_PAGE_SIZE = 20  # Rows per page of the status tables
 PLAYER_DEFAULT_PROPERTIES = {
     "location": 1,
     "money": 1500,
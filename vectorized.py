@@ -0,0 +1,226 @@
+import numpy as np
+import vars
+from game import Game
+
+
+SQUARE_PROPERTY = 0
+SQUARE_GO = 1
+SQUARE_INCOME_TAX = 2
+SQUARE_JAIL = 3
+SQUARE_CHANCE = 4
+SQUARE_FREE_PARKING = 5
+SQUARE_GO_TO_JAIL = 6
+SQUARE_INERT = 7
+
+FUNCTION_SQUARE_KINDS = {
+    "Go": SQUARE_GO,
+    "Income Tax": SQUARE_INCOME_TAX,
+    "Just Visiting / In Jail": SQUARE_JAIL,
+    "Chance": SQUARE_CHANCE,
+    "Free Parking": SQUARE_FREE_PARKING,
+    "Go To Jail": SQUARE_GO_TO_JAIL,
+}
+
+
+class VectorizedGames:
+    # Plays many games in lockstep with the "always buy, always pay the jail fine" policy of
+    # AutomaticDecisionProvider. All per-player state is stored as (games, players) arrays.
+
+    def __init__(self, gameboard_design, number_of_games, number_of_players, game_parameters=None, seed=None):
+        self.game_parameters = Game.default_game_parameters()
+        if game_parameters:
+            self.game_parameters.update(game_parameters)
+        self.rng = np.random.default_rng(seed)
+        self.number_of_games = number_of_games
+        self.number_of_players = number_of_players
+
+        # Square tables are indexed by location, index 0 is unused
+        self.size = int(gameboard_design['size'])
+        self.square_kind = np.full(self.size + 1, SQUARE_INERT, dtype=np.int8)
+        self.square_price = np.zeros(self.size + 1, dtype=np.int64)
+        self.square_rent = np.zeros(self.size + 1, dtype=np.int64)
+        self.jail_location = None
+        for row in gameboard_design['properties']:
+            location = int(row['location'])
+            if row['is_ownable'] and row['name'].lower() != 'go':
+                self.square_kind[location] = SQUARE_PROPERTY
+            self.square_price[location] = row['price']
+            self.square_rent[location] = row['rent']
+        for row in gameboard_design['functions']:
+            location = int(row['location'])
+            self.square_kind[location] = FUNCTION_SQUARE_KINDS[row['name']]
+            if row['name'].lower() == 'just visiting / in jail':
+                self.jail_location = location
+
+        shape = (number_of_games, number_of_players)
+        self.location = np.full(shape, vars.PLAYER_DEFAULT_PROPERTIES['location'], dtype=np.int64)
+        self.money = np.full(shape, vars.PLAYER_DEFAULT_PROPERTIES['money'], dtype=np.int64)
+        self.is_jailed = np.full(shape, vars.PLAYER_DEFAULT_PROPERTIES['is_jailed'], dtype=bool)
+        self.jailed_rounds_count_down = np.full(shape, vars.PLAYER_DEFAULT_PROPERTIES['jailed_rounds_count_down'], dtype=np.int8)
+        self.is_retired = np.full(shape, vars.PLAYER_DEFAULT_PROPERTIES['is_retired'], dtype=bool)
+        self.ownership = np.full((number_of_games, self.size + 1), -1, dtype=np.int32)
+        self.game_over = np.zeros(number_of_games, dtype=bool)
+        self.rounds_played = np.zeros(number_of_games, dtype=np.int64)
+        self.winners = np.zeros(shape, dtype=bool)
+
+    def roll_dice(self, count):
+        dice = self.rng.integers(1, 5, size=(2, count))
+        return dice[0], dice[1]
+
+    def retire_players(self, games, players):
+        if len(games) == 0:
+            return
+        self.is_retired[games, players] = True
+        self.money[games, players] = 0
+        owned = self.ownership[games] == players[:, None]
+        self.ownership[games] = np.where(owned, -1, self.ownership[games])
+
+        # Game over when only one player is left
+        still_playing = ~self.is_retired[games]
+        finished = games[still_playing.sum(axis=1) == 1]
+        self.game_over[finished] = True
+        self.winners[finished] = ~self.is_retired[finished]
+
+    def jailbreak(self, games, players):
+        # Mirrors Player.jailbreak; returns the dice and whether the player leaves jail this turn
+        first_roll, second_roll = self.roll_dice(len(games))
+        is_double = first_roll == second_roll
+        count_down = self.jailed_rounds_count_down[games, players]
+        money = self.money[games, players]
+        jailbreak_price = self.game_parameters["jailbreak_price"]
+        moves = np.zeros(len(games), dtype=bool)
+        released = np.zeros(len(games), dtype=bool)
+
+        # 1st round: pay the fine if possible, otherwise roll for a double but move anyway
+        first_round = count_down == 3
+        pays = first_round & (money >= jailbreak_price)
+        money = np.where(pays, money - jailbreak_price, money)
+        released |= pays | (first_round & is_double)
+        moves |= first_round
+
+        # 2nd round: only a double gets the player out
+        second_round = count_down == 2
+        released |= second_round & is_double
+        moves |= second_round & is_double
+
+        # 3rd round: a double or the fine gets the player out
+        third_round = count_down == 1
+        money = np.where(third_round & ~is_double, money - jailbreak_price, money)
+        released |= third_round
+        moves |= third_round
+
+        self.money[games, players] = money
+        self.is_jailed[games, players] = ~released
+        self.jailed_rounds_count_down[games, players] = np.where(released, 3, np.where(second_round, 1, count_down))
+        return first_roll, second_roll, moves
+
+    def play_turn(self, games, players):
+        jailed = self.is_jailed[games, players]
+        first_roll, second_roll = self.roll_dice(len(games))
+        moves = np.ones(len(games), dtype=bool)
+
+        if jailed.any():
+            jailed_index = np.nonzero(jailed)[0]
+            jail_first_roll, jail_second_roll, jail_moves = self.jailbreak(games[jailed_index], players[jailed_index])
+            first_roll[jailed_index] = jail_first_roll
+            second_roll[jailed_index] = jail_second_roll
+            moves[jailed_index] = jail_moves
+            broke = jailed & (self.money[games, players] <= 0)
+            self.retire_players(games[broke], players[broke])
+            moves &= ~broke
+
+        games, players = games[moves], players[moves]
+        first_roll, second_roll = first_roll[moves], second_roll[moves]
+        if len(games) == 0:
+            return
+
+        # Movement with Go money and wrap-around, as in Player.move and Player.adjust_location
+        location = self.location[games, players] + first_roll + second_roll
+        passed_go = location > self.size
+        self.money[games, players] += np.where(passed_go, self.game_parameters["go_money"], 0)
+        location = np.where(location >= self.size + 1, location % (self.size + 1) + 1, location)
+        self.location[games, players] = location
+        kind = self.square_kind[location]
+        money = self.money[games, players]
+
+        # Property squares
+        owner = self.ownership[games, location]
+        on_property = kind == SQUARE_PROPERTY
+        buys = on_property & (owner < 0) & (money > self.square_price[location])
+        money = np.where(buys, money - self.square_price[location], money)
+        self.ownership[games[buys], location[buys]] = players[buys]
+
+        pays_rent = on_property & (owner >= 0) & (owner != players)
+        charged_amount = np.where(pays_rent, np.minimum(money, self.square_rent[location]), 0)
+        money = money - charged_amount
+        self.money[games, players] = money
+        self.money[games[pays_rent], owner[pays_rent]] += charged_amount[pays_rent]
+
+        # Function squares
+        goes_to_jail = (kind == SQUARE_GO_TO_JAIL) & ~self.is_jailed[games, players]
+        self.is_jailed[games[goes_to_jail], players[goes_to_jail]] = True
+        self.location[games[goes_to_jail], players[goes_to_jail]] = self.jail_location
+
+        pays_tax = kind == SQUARE_INCOME_TAX
+        tax_amount = (np.floor_divide(money * self.game_parameters["tax_amount_rate"], 10) * 10).astype(np.int64)
+        money = np.where(pays_tax, money - tax_amount, money)
+
+        on_chance = kind == SQUARE_CHANCE
+        is_gain = self.rng.random(len(games)) < 0.5
+        gain_money = self.game_parameters["chance_multiplier"] * self.rng.integers(0, 20, size=len(games))
+        loss_money = self.game_parameters["chance_multiplier"] * self.rng.integers(0, 30, size=len(games))
+        money = np.where(on_chance, money + np.where(is_gain, gain_money, -loss_money), money)
+        self.money[games, players] = money
+
+        # A jailed player landing on the jail square tries to break out again
+        visits_jail = (kind == SQUARE_JAIL) & self.is_jailed[games, players]
+        if visits_jail.any():
+            self.jailbreak(games[visits_jail], players[visits_jail])
+
+        broke = self.money[games, players] <= 0
+        self.retire_players(games[broke], players[broke])
+
+    def play_one_round(self):
+        games_in_round = ~self.game_over
+        if self.game_parameters["random_player_orders"]:
+            order = np.argsort(self.rng.random((self.number_of_games, self.number_of_players)), axis=1)
+        else:
+            order = np.broadcast_to(np.arange(self.number_of_players), (self.number_of_games, self.number_of_players))
+
+        all_games = np.arange(self.number_of_games)
+        for turn in range(self.number_of_players):
+            players = order[:, turn]
+            active = ~self.game_over & ~self.is_retired[all_games, players]
+            games = np.nonzero(active)[0]
+            if len(games) > 0:
+                self.play_turn(games, players[games])
+
+        self.rounds_played[games_in_round] += 1
+        timed_out = games_in_round & ~self.game_over & (self.rounds_played >= self.game_parameters["maximum_rounds"])
+        self.game_over[timed_out] = True
+        self.winners[timed_out] = self.money[timed_out] == self.money[timed_out].max(axis=1, keepdims=True)
+
+    def play(self):
+        while not self.game_over.all():
+            self.play_one_round()
+        return {
+            "winners": self.winners,
+            "rounds_played": self.rounds_played,
+            "final_money": self.money,
+            "bankruptcies": self.is_retired,
+        }
+
+
+def simulate_vectorized(gameboard_design, number_of_games, number_of_players, game_parameters=None, seed=None):
+    return VectorizedGames(gameboard_design, number_of_games, number_of_players, game_parameters, seed).play()
+
+
+def summarize_vectorized_results(results):
+    # Same keys as simulation.summarize_results
+    number_of_games = max(1, len(results["rounds_played"]))
+    return {
+        "games": len(results["rounds_played"]),
+        "average_rounds": float(results["rounds_played"].mean()) if len(results["rounds_played"]) else 0.0,
+        "win_rate_per_seat": (results["winners"].sum(axis=0) / number_of_games).tolist(),
+        "bankruptcy_rate_per_seat": (results["bankruptcies"].sum(axis=0) / number_of_games).tolist(),
+    }